@@ -0,0 +1,67 @@
+"""Benchmark the batched ARMA fit against the per-series statsmodels loop.
+
+Simulates ARMA series, fits them with ``ts2025.batch_arma.fit_arma`` and with
+``statsmodels.tsa.arima.model.ARIMA`` and reports the wall times and the
+largest differences of the estimates, standard errors and log-likelihoods:
+
+    uv run python -m scripts.bench_batch_arma --nseries 10000 --statsmodels-series 200
+
+With ``--statsmodels-series`` the statsmodels loop runs on a subset and the
+time is extrapolated.
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from ts2025.batch_arma import fit_arma
+from ts2025.simulate import arma_generate_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nseries", type=int, default=10_000)
+    parser.add_argument("--nobs", type=int, default=200)
+    parser.add_argument("--p", type=int, default=1)
+    parser.add_argument("--q", type=int, default=0)
+    parser.add_argument("--statsmodels-series", type=int, default=None,
+                        help="number of series for the statsmodels loop (default: all)")
+    args = parser.parse_args()
+
+    ar = [1, -0.6, 0.2][:args.p + 1]
+    ma = [1, 0.4, -0.2][:args.q + 1]
+    x = 2 + arma_generate_paths(ar, ma, args.nobs, args.nseries, burnin=100, seed=0)
+    order = (args.p, 0, args.q)
+
+    start = time.perf_counter()
+    res = fit_arma(x, order=order)
+    fast_seconds = time.perf_counter() - start
+
+    from statsmodels.tsa.arima.model import ARIMA
+
+    n_slow = args.statsmodels_series or args.nseries
+    params, bse, llf = [], [], []
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i in range(n_slow):
+            fit = ARIMA(x[i], order=order, trend="c").fit()
+            params.append(fit.params)
+            bse.append(fit.bse)
+            llf.append(fit.llf)
+    slow_seconds = (time.perf_counter() - start) * args.nseries / n_slow
+
+    print(f"series: {args.nseries}, observations: {args.nobs}, order: {order}")
+    print(f"batched fit:        {fast_seconds:8.1f} s, "
+          f"{res.converged.mean():.1%} converged, median {res.iterations.median():.0f} iterations")
+    extrapolated = " (extrapolated)" if n_slow < args.nseries else ""
+    print(f"statsmodels loop:   {slow_seconds:8.1f} s{extrapolated}")
+    print(f"speed-up:           {slow_seconds / fast_seconds:8.1f}x")
+    print(f"max |params diff|:  {np.abs(res.params.values[:n_slow] - np.array(params)).max():.2e}")
+    print(f"max rel bse diff:   {np.abs(res.bse.values[:n_slow] / np.array(bse) - 1).max():.2e}")
+    print(f"max llf gain:       {(res.llf.values[:n_slow] - np.array(llf)).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Coverage and speed of bootstrap versus Gaussian ARIMA prediction intervals.
+
+Simulates AR(1) series with skewed innovations (centered chi-squared), fits
+``ARIMA(order=(1, 0, 0))`` to all but the last ``--steps`` observations and
+reports how often the held-out values fall into the Gaussian intervals of
+``summary_frame`` and into the bootstrap intervals of
+``ts2025.bootstrap_forecast``, and how often they fall below and above:
+
+    uv run python -m scripts.bench_bootstrap_forecast --nseries 500 --nboot 10000
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+from scipy.signal import lfilter
+
+from ts2025.bootstrap_forecast import bootstrap_summary_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nseries", type=int, default=500)
+    parser.add_argument("--nobs", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=3)
+    parser.add_argument("--nboot", type=int, default=10_000)
+    parser.add_argument("--df", type=float, default=2.0, help="degrees of freedom of the chi-squared innovations")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    e = (rng.chisquare(args.df, size=(args.nseries, args.nobs + 100)) - args.df) / np.sqrt(2 * args.df)
+    x = 2 + lfilter([1], [1, -0.75], e, axis=1)[:, 100:]
+    past, future = x[:, :-args.steps], x[:, -args.steps:]
+
+    from statsmodels.tsa.arima.model import ARIMA
+
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        results = [ARIMA(series, order=(1, 0, 0)).fit() for series in past]
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gaussian = np.stack([r.get_forecast(args.steps).summary_frame()[["mean_ci_lower", "mean_ci_upper"]].values
+                         for r in results])
+    gaussian_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frames = bootstrap_summary_frames(results, args.steps, nboot=args.nboot, workers=args.workers, seed=1)
+    bootstrap_seconds = time.perf_counter() - start
+    bootstrap = frames[["mean_ci_lower", "mean_ci_upper"]].values.reshape(args.nseries, args.steps, 2)
+
+    print(f"series: {args.nseries}, observations: {args.nobs}, steps: {args.steps}, paths: {args.nboot}")
+    print(f"ARIMA fits:      {fit_seconds:8.1f} s")
+    for name, bounds, seconds in [("gaussian", gaussian, gaussian_seconds),
+                                  ("bootstrap", bootstrap, bootstrap_seconds)]:
+        below = (future < bounds[..., 0]).mean(axis=0)
+        above = (future > bounds[..., 1]).mean(axis=0)
+        print(f"{name + ':':16} {seconds:7.1f} s, coverage by step "
+              f"{np.round(1 - below - above, 3)}, below {np.round(below, 3)}, above {np.round(above, 3)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark statsforecast against the per-series statsmodels loop.
+
+Simulates AR(1) series, forecasts them with both implementations and reports
+the wall time and the largest difference of the point forecasts:
+
+    uv run python -m scripts.bench_bulk_forecast --nseries 10000
+
+The statsmodels loop takes several minutes for 10k series; with
+``--statsmodels-series`` it runs on a subset and the time is extrapolated.
+
+statsforecast is timed twice in the same process: the first (cold) call pays
+for the one-time compilation and imports, the second (warm) call shows the
+cost of a further forecast. Speed-ups are reported for both.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ts2025.bulk_forecast import forecast_panel, forecast_panel_statsmodels, to_long_panel
+from ts2025.simulate import arma_generate_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nseries", type=int, default=10_000)
+    parser.add_argument("--nobs", type=int, default=100)
+    parser.add_argument("--horizon", type=int, default=3)
+    parser.add_argument("--statsmodels-series", type=int, default=None,
+                        help="number of series for the statsmodels loop (default: all)")
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    args = parser.parse_args()
+
+    x = 2 + arma_generate_paths([1, -0.75], [1], args.nobs, args.nseries, burnin=100, seed=0)
+    panel = to_long_panel(x)
+
+    from statsforecast.models import ARIMA
+    models = [ARIMA(order=(1, 0, 0), include_mean=True, alias="ARIMA")]
+
+    fast_seconds = []
+    for _ in range(2):
+        start = time.perf_counter()
+        fast = forecast_panel(panel, args.horizon, models=models, n_jobs=args.n_jobs)
+        fast_seconds.append(time.perf_counter() - start)
+
+    n_slow = args.statsmodels_series or args.nseries
+    subset = panel[panel["unique_id"] < n_slow]
+    start = time.perf_counter()
+    slow = forecast_panel_statsmodels(subset, args.horizon)
+    slow_seconds = (time.perf_counter() - start) * args.nseries / n_slow
+
+    merged = fast.merge(slow, on=["unique_id", "ds", "model"], suffixes=("_sf", "_sm"))
+    max_diff = np.abs(merged["mean_sf"] - merged["mean_sm"]).max()
+
+    print(f"series: {args.nseries}, observations: {args.nobs}, horizon: {args.horizon}")
+    print(f"statsforecast cold: {fast_seconds[0]:8.1f} s")
+    print(f"statsforecast warm: {fast_seconds[1]:8.1f} s")
+    extrapolated = " (extrapolated)" if n_slow < args.nseries else ""
+    print(f"statsmodels loop:   {slow_seconds:8.1f} s{extrapolated}")
+    print(f"speed-up cold:      {slow_seconds / fast_seconds[0]:8.1f}x")
+    print(f"speed-up warm:      {slow_seconds / fast_seconds[1]:8.1f}x")
+    print(f"max |mean diff|:    {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure cold starts: notebook kernels and the Dash app.
+
+Kernels: the wall time from starting a kernel to having run a cell that
+imports ``ts2025.lazy.STACK``, for a fresh ``ipykernel`` and for a kernel
+forked from ``scripts/kernel_forkserver.py`` (the one-off start of the fork
+server is reported separately). App: the time to import
+``sine_wave_circle_app`` and to build the app in a fresh interpreter.
+
+    uv run python -m scripts.bench_cold_start --runs 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import nbformat
+from nbclient import NotebookClient
+
+from scripts.kernel_forkserver import forkserver, kernel_manager
+from ts2025.lazy import STACK
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_notebook():
+    lines = []
+    for name in STACK:
+        lines += ["try:", f"    import {name}", "except ImportError:", "    pass"]
+    nb = nbformat.v4.new_notebook()
+    nb.cells = [nbformat.v4.new_code_cell("\n".join(lines))]
+    return nb
+
+
+def time_kernel(km=None):
+    nb = import_notebook()
+    kwargs = {"km": km} if km is not None else {"kernel_name": "python3"}
+    start = time.perf_counter()
+    NotebookClient(nb, timeout=600, resources={"metadata": {"path": str(ROOT)}}, **kwargs).execute()
+    return time.perf_counter() - start
+
+
+def time_python(code):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+    return time.perf_counter() - start
+
+
+def report(label, seconds):
+    print(f"{label:<32} median {statistics.median(seconds):6.2f} s  (min {min(seconds):.2f}, max {max(seconds):.2f}, n={len(seconds)})", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    report("fresh kernel + imports", [time_kernel() for _ in range(args.runs)])
+
+    start = time.perf_counter()
+    with forkserver() as socket_path:
+        report("fork server start (once)", [time.perf_counter() - start])
+        report("forked kernel + imports", [time_kernel(kernel_manager(socket_path)) for _ in range(args.runs)])
+
+    report("import sine_wave_circle_app", [time_python("import sine_wave_circle_app") for _ in range(args.runs)])
+    report("create_app()", [time_python("import sine_wave_circle_app as m; m.create_app()") for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
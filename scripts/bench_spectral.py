@@ -0,0 +1,76 @@
+"""Benchmark the streaming Welch estimate on a very long series.
+
+Simulates an AR(1) series chunk by chunk (the series is never held in
+memory), feeds the chunks to ``ts2025.spectral.welch`` and reports the wall
+time, the peak of the memory allocated during the estimate and the largest
+relative difference to the theoretical AR(1) spectral density:
+
+    uv run python -m scripts.bench_spectral --nobs 100000000
+
+With ``--compare`` the series is also materialized and passed to
+``scipy.signal.welch`` and to the full-length ``periodogram`` (needs about
+4 GB of memory for 10^8 observations).
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from scipy import signal
+
+from ts2025.spectral import periodogram, welch
+
+
+def ar1_chunks(phi, nobs, chunk_size, seed=0):
+    """AR(1) series with unit innovation variance, in chunks of ``chunk_size``."""
+    rng = np.random.default_rng(seed)
+    state = np.zeros(1)
+    for start in range(0, nobs, chunk_size):
+        e = rng.standard_normal(min(chunk_size, nobs - start))
+        chunk, state = signal.lfilter([1.0], [1.0, -phi], e, zi=state * phi)
+        state = chunk[-1:]
+        yield chunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nobs", type=int, default=10**8)
+    parser.add_argument("--chunk-size", type=int, default=10**6)
+    parser.add_argument("--nperseg", type=int, default=4096)
+    parser.add_argument("--phi", type=float, default=0.5)
+    parser.add_argument("--compare", action="store_true", help="also run on the materialized series")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    freqs, pxx = welch(ar1_chunks(args.phi, args.nobs, args.chunk_size), nperseg=args.nperseg)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Spectral density of an AR(1) process, one-sided with fs = 1
+    theory = 2 / np.abs(1 - args.phi * np.exp(-2j * np.pi * freqs)) ** 2
+    # Removing the segment means also removes power within the main lobe of
+    # the Hann window around 0, i.e. the first bin
+    inner = slice(2, -1)
+    deviation = np.abs(pxx[0, inner] / theory[inner] - 1).max()
+
+    print(f"observations: {args.nobs:,}, chunk size: {args.chunk_size:,}, nperseg: {args.nperseg}")
+    print(f"streaming welch:    {seconds:8.1f} s, peak memory {peak / 2**20:8.1f} MB, "
+          f"max relative deviation from the AR(1) density {deviation:.3f}")
+
+    if args.compare:
+        x = np.concatenate(list(ar1_chunks(args.phi, args.nobs, args.chunk_size)))
+
+        start = time.perf_counter()
+        _, reference = signal.welch(x, nperseg=args.nperseg)
+        print(f"scipy.signal.welch: {time.perf_counter() - start:8.1f} s, "
+              f"max difference {np.abs(pxx[0] - reference).max():.2e}")
+
+        start = time.perf_counter()
+        periodogram(x)
+        print(f"full periodogram:   {time.perf_counter() - start:8.1f} s")
+
+
+if __name__ == "__main__":
+    main()
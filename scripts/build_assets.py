@@ -0,0 +1,123 @@
+"""Generate the derived figures of the book.
+
+Each asset is an output file under ``figures/`` with a generator and its
+inputs. An asset is only rebuilt when the hash of its inputs (the input
+values, the source files and the source of the generator) differs from the last build or the
+output is missing:
+
+- ``figures/qr_code.png``, ``figures/qr_code_github.png`` and
+  ``figures/qr_code_githubHttps.png``: QR codes for the URLs in
+  ``_variables.yml``,
+- ``figures/sine_wave_circle.html``: static export of ``sine_wave_circle_app.py``.
+
+It runs as part of ``scripts.build_book`` before Quarto renders, or alone:
+
+    uv run python -m scripts.build_assets [--force]
+
+The hashes are kept in ``.cache/assets/manifest.json``.
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+FIGURES = ROOT / "figures"
+MANIFEST = ROOT / ".cache" / "assets" / "manifest.json"
+
+# Keys of _variables.yml that get a QR code, and the file name of each
+QR_CODES = {
+    "url": "qr_code.png",
+    "github": "qr_code_github.png",
+    "githubHttps": "qr_code_githubHttps.png",
+}
+
+
+def create_qr_code(url: str):
+    import qrcode
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+
+    qr.add_data(url)
+    qr.make()
+    img = qr.make_image(fill_color="black", back_color="white")
+
+    return img
+
+
+def write_qr_code(path, url):
+    create_qr_code(url).save(path)
+
+
+def write_sine_wave_circle(path):
+    from sine_wave_circle_app import export_static
+
+    export_static(path)
+
+
+def assets():
+    """Return ``{output: (generator, kwargs, source files)}``."""
+    variables = yaml.safe_load((ROOT / "_variables.yml").read_text())
+    found = {}
+    for key, name in QR_CODES.items():
+        if key in variables:
+            found[FIGURES / name] = (write_qr_code, {"url": variables[key]}, [])
+    # The app imports dash and plotly through ts2025.lazy
+    found[FIGURES / "sine_wave_circle.html"] = (write_sine_wave_circle, {},
+                                                [ROOT / "sine_wave_circle_app.py", ROOT / "ts2025" / "lazy.py"])
+    return found
+
+
+def asset_hash(generator, kwargs, sources):
+    digest = hashlib.sha256()
+    digest.update(inspect.getsource(generator).encode())
+    if generator is write_qr_code:
+        digest.update(inspect.getsource(create_qr_code).encode())
+    digest.update(json.dumps(kwargs, sort_keys=True).encode())
+    for source in sources:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def build(force=False):
+    """Rebuild the changed assets, return ``{output: status}``."""
+    manifest = json.loads(MANIFEST.read_text()) if MANIFEST.exists() else {}
+
+    report = {}
+    for path, (generator, kwargs, sources) in assets().items():
+        key = str(path.relative_to(ROOT))
+        digest = asset_hash(generator, kwargs, sources)
+        if not force and path.exists() and manifest.get(key, {}).get("hash") == digest:
+            report[key] = "unchanged"
+            continue
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        generator(path, **kwargs)
+        manifest[key] = {"hash": digest, "built": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        report[key] = "built"
+
+    MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="rebuild all assets")
+    args = parser.parse_args()
+
+    for key, status in build(force=args.force).items():
+        print(f"{key:<40} {status}")
+
+
+if __name__ == "__main__":
+    main()
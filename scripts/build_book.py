@@ -0,0 +1,301 @@
+"""Execute the chapter notebooks in parallel and render the book.
+
+Every chapter of ``_quarto.yml`` gets its own kernel in a process pool. A
+chapter is only executed when its hash has changed. The hash covers
+
+- the source of the code cells,
+- the ``ts2025`` modules the notebook imports, directly or through other
+  ``ts2025`` modules, and ``uv.lock``,
+- the datasets it reads through ``ts2025.data``, by the content of the cached
+  objects (by the URL while it is not cached),
+- for chapters that use ``ts2025.market_data``, the stored bars in
+  ``.cache/market``.
+
+The hash is taken again after execution, when the data caches are filled, so
+the stored hash is the one the next build compares against. The market data
+store only fetches new bars and corporate actions when its chapter runs, so
+use ``--force`` (with the chapter name) to bring such a chapter up to date.
+
+The committed notebooks are not modified. Executed notebooks are kept in
+``.cache/build/executed``; the book is assembled in ``.cache/build/book``
+(links to the project files plus the chapters with the executed outputs, or
+the committed ones for chapters that were not executed) and Quarto renders
+that copy without executing anything; the site is copied to ``_site``:
+
+    uv run python -m scripts.build_book --workers 4
+
+A per-chapter timing report is printed and written to
+``.cache/build/timings.json``. With ``--shrink`` the outputs of the assembled
+chapters are compacted with ``scripts.shrink_notebooks`` before rendering
+(lossless; images repeated across chapters are extracted to ``outputs/``). The
+derived figures are brought up to date with ``scripts.build_assets`` before
+rendering. With ``--forkserver`` the kernels are forked from a process that
+has imported the scientific stack (``scripts.kernel_forkserver``), which saves
+the import time of every chapter.
+"""
+import argparse
+import ast
+import contextlib
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import nbformat
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+BUILD_DIR = ROOT / ".cache" / "build"
+BOOK_DIR = BUILD_DIR / "book"
+DATA_INDEX = ROOT / ".cache" / "data" / "index.json"
+MARKET_DIR = ROOT / ".cache" / "market"
+
+# Fallback for cells that are not plain Python (magics, shell escapes)
+IMPORT_PATTERN = re.compile(r"^\s*(?:from\s+ts2025(?:\.(\w+)|\s+import\s+(\w+))|import\s+ts2025\.(\w+))",
+                            re.MULTILINE)
+URL_PATTERN = re.compile(r"""["'](https?://[^"']+)["']""")
+
+
+def chapters():
+    config = yaml.safe_load((ROOT / "_quarto.yml").read_text())
+    return [chapter for chapter in config["book"]["chapters"] if chapter.endswith(".ipynb")]
+
+
+def _code(nb):
+    return [cell.source for cell in nb.cells if cell.cell_type == "code"]
+
+
+def _imports(source):
+    """Names of the ``ts2025`` modules imported by a piece of code."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return {name for match in IMPORT_PATTERN.findall(source) for name in match if name}
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            # Relative imports only occur inside the package
+            module = "ts2025" + (f".{node.module}" if node.module else "") if node.level else node.module or ""
+            names.add(module)
+            names.update(f"{module}.{alias.name}" for alias in node.names)
+    return {name.split(".")[1] for name in names if name.startswith("ts2025.")}
+
+
+def dependencies(source):
+    """The ``ts2025`` modules the code imports, directly or indirectly."""
+    todo, found = list(_imports(source)), set()
+    while todo:
+        module = todo.pop()
+        path = ROOT / "ts2025" / f"{module}.py"
+        if module in found or not path.exists():
+            continue
+        found.add(module)
+        todo.extend(_imports(path.read_text()))
+    return sorted(found)
+
+
+def notebook_hash(path):
+    nb = nbformat.read(path, as_version=4)
+    code = "\n".join(_code(nb))
+
+    digest = hashlib.sha256()
+    digest.update(nb.metadata.get("kernelspec", {}).get("name", "python3").encode())
+    for source in _code(nb):
+        digest.update(source.encode())
+        digest.update(b"\0")
+
+    # Dependencies: project modules and the locked environment
+    modules = dependencies(code)
+    for module in modules:
+        digest.update(module.encode())
+        digest.update((ROOT / "ts2025" / f"{module}.py").read_bytes())
+    lock = ROOT / "uv.lock"
+    if lock.exists():
+        digest.update(lock.read_bytes())
+
+    # Data inputs: the cached objects of every URL (named by the content and
+    # the parsing options). A URL the chapter reads is cached once it ran, and
+    # the stored hash is taken after execution; other URLs count as text.
+    index = json.loads(DATA_INDEX.read_text()) if DATA_INDEX.exists() else {}
+    for url in sorted(set(URL_PATTERN.findall(code))):
+        objects = sorted(entry["object"] for entry in index.values() if entry["url"] == url)
+        digest.update(" ".join(objects or [url]).encode())
+
+    if "market_data" in modules and MARKET_DIR.exists():
+        for stored in sorted(MARKET_DIR.rglob("*")):
+            if stored.is_file():
+                digest.update(stored.relative_to(MARKET_DIR).as_posix().encode())
+                digest.update(stored.read_bytes())
+
+    return digest.hexdigest()
+
+
+def execute(chapter, timeout, forkserver_socket=None):
+    """Run one notebook in a fresh kernel, return wall time in seconds.
+
+    With ``forkserver_socket`` the kernel is forked from a running
+    ``scripts.kernel_forkserver`` instead of started from scratch.
+    """
+    from nbclient import NotebookClient
+
+    kwargs = {}
+    if forkserver_socket is not None:
+        from scripts.kernel_forkserver import kernel_manager
+
+        kwargs["km"] = kernel_manager(forkserver_socket)
+
+    path = ROOT / chapter
+    nb = nbformat.read(path, as_version=4)
+    start = time.perf_counter()
+    NotebookClient(nb, timeout=timeout, resources={"metadata": {"path": str(ROOT)}}, **kwargs).execute()
+    seconds = time.perf_counter() - start
+
+    cached = BUILD_DIR / "executed" / chapter
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    nbformat.write(nb, cached)
+
+    return seconds
+
+
+def restore_outputs(chapter):
+    """The chapter with the outputs of its cached executed notebook.
+
+    The markdown cells are those of the chapter, so text edits do not require
+    re-execution. Returns None when there is no executed notebook with the
+    same code cells.
+    """
+    cached_path = BUILD_DIR / "executed" / chapter
+    if not cached_path.exists():
+        return None
+
+    nb = nbformat.read(ROOT / chapter, as_version=4)
+    cached = nbformat.read(cached_path, as_version=4)
+    if _code(nb) != _code(cached):
+        return None
+    cached_code = [cell for cell in cached.cells if cell.cell_type == "code"]
+    code = [cell for cell in nb.cells if cell.cell_type == "code"]
+    for cell, done in zip(code, cached_code):
+        cell.outputs = done.outputs
+        cell.execution_count = done.execution_count
+    return nb
+
+
+def assemble(shrink_outputs=False):
+    """Lay out the book in ``BOOK_DIR`` for Quarto, return the directory.
+
+    The files of the project are linked, the chapters are written with their
+    executed outputs (or copied as committed when there are none).
+    """
+    shutil.rmtree(BOOK_DIR, ignore_errors=True)
+    BOOK_DIR.mkdir(parents=True)
+    book = set(chapters())
+    for entry in ROOT.iterdir():
+        if entry.name.startswith(".") or entry.name == "_site" or entry.name in book:
+            continue
+        (BOOK_DIR / entry.name).symlink_to(entry, target_is_directory=entry.is_dir())
+
+    for chapter in book:
+        if not (ROOT / chapter).exists():
+            continue
+        target = BOOK_DIR / chapter
+        target.parent.mkdir(parents=True, exist_ok=True)
+        nb = restore_outputs(chapter)
+        if nb is None:
+            shutil.copyfile(ROOT / chapter, target)
+        else:
+            nbformat.write(nb, target)
+
+    if shrink_outputs:
+        from scripts.shrink_notebooks import dump_notebook, duplicate_images, shrink
+
+        # Lossless re-encoding; images repeated across chapters are stored once
+        paths = [BOOK_DIR / chapter for chapter in book if (BOOK_DIR / chapter).exists()]
+        shared = duplicate_images(paths)
+        for path in paths:
+            path.write_text(dump_notebook(shrink(path, shared=shared, outputs_dir=BOOK_DIR / "outputs")),
+                            encoding="utf-8")
+
+    return BOOK_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds per cell")
+    parser.add_argument("--force", action="store_true", help="execute all chapters")
+    parser.add_argument("--no-render", action="store_true", help="only execute the notebooks")
+    parser.add_argument("--shrink", action="store_true", help="compact the outputs before rendering")
+    parser.add_argument("--forkserver", action="store_true",
+                        help="fork the kernels from a process with the scientific stack imported")
+    parser.add_argument("chapters", nargs="*", help="subset of chapters (default: all in _quarto.yml)")
+    args = parser.parse_args()
+
+    manifest_path = BUILD_DIR / "manifest.json"
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    todo, report = [], {}
+    for chapter in args.chapters or chapters():
+        if not (ROOT / chapter).exists():
+            print(f"{chapter}: missing, skipped")
+            continue
+        unchanged = manifest.get(chapter, {}).get("hash") == notebook_hash(ROOT / chapter)
+        if unchanged and not args.force and restore_outputs(chapter) is not None:
+            report[chapter] = {"status": "cached", "seconds": 0.0}
+        else:
+            todo.append(chapter)
+
+    failed = []
+    with contextlib.ExitStack() as stack:
+        socket_path = None
+        if args.forkserver and todo:
+            from scripts.kernel_forkserver import forkserver
+
+            socket_path = stack.enter_context(forkserver())
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=args.workers))
+        futures = {pool.submit(execute, chapter, args.timeout, socket_path): chapter for chapter in todo}
+        for future in as_completed(futures):
+            chapter = futures[future]
+            try:
+                seconds = future.result()
+            except Exception as exc:
+                failed.append(chapter)
+                report[chapter] = {"status": "failed", "seconds": None, "error": str(exc).splitlines()[0] if str(exc) else repr(exc)}
+                continue
+            report[chapter] = {"status": "executed", "seconds": seconds}
+            # After execution: the data read by the chapter is in the caches now
+            manifest[chapter] = {"hash": notebook_hash(ROOT / chapter), "seconds": seconds, "executed": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    (BUILD_DIR / "timings.json").write_text(json.dumps(report, indent=2, sort_keys=True))
+
+    print(f"{'chapter':<40} {'status':<10} {'seconds':>8}")
+    for chapter, entry in sorted(report.items(), key=lambda item: -(item[1]["seconds"] or 0)):
+        seconds = "" if entry["seconds"] is None else f"{entry['seconds']:8.1f}"
+        print(f"{chapter:<40} {entry['status']:<10} {seconds:>8}")
+
+    if failed:
+        raise SystemExit(f"execution failed: {', '.join(failed)}")
+
+    if not args.no_render:
+        # Derived figures: QR codes and the static circle/sine wave page, embedded with
+        # <iframe src="figures/sine_wave_circle.html" width="100%" height="760"></iframe>
+        from scripts.build_assets import build
+
+        for asset, status in build().items():
+            print(f"{asset}: {status}")
+        book = assemble(shrink_outputs=args.shrink)
+        subprocess.run(["quarto", "render", str(book), "--no-execute"], check=True)
+        shutil.rmtree(ROOT / "_site", ignore_errors=True)
+        shutil.copytree(book / "_site", ROOT / "_site")
+
+
+if __name__ == "__main__":
+    main()
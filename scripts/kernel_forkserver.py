@@ -0,0 +1,247 @@
+"""Start Jupyter kernels by forking a process that has the stack imported.
+
+A fresh kernel spends seconds importing statsmodels, arch, scipy and pandas
+before it runs the first cell of a chapter. The fork server imports
+``ts2025.lazy.STACK`` (and ipykernel) once and forks a kernel for every
+notebook, so each kernel starts with the modules already in memory:
+
+    with forkserver() as socket_path:
+        NotebookClient(nb, km=kernel_manager(socket_path)).execute()
+
+``scripts.build_book --forkserver`` executes the chapters this way. The
+kernel manager launches ``python scripts/kernel_forkserver.py connect ...``
+instead of ``ipykernel_launcher``; that small process hands the connection
+file to the server, relays signals (interrupts) to the forked kernel and
+exits with it, so the kernel manager can treat it as the kernel process.
+
+Compare the start-up times with ``python -m scripts.bench_cold_start``.
+"""
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import random
+import select
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _send(conn, message):
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _receive(conn):
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            return None
+        data += chunk
+    return json.loads(data)
+
+
+def _reseed():
+    """Fresh global random states in a forked child.
+
+    The child starts with a copy of the server's states; without this, the
+    unseeded ``np.random`` calls of every kernel draw the same numbers.
+    """
+    random.seed()
+    if "numpy" in sys.modules:
+        sys.modules["numpy"].random.seed()
+
+
+def _run_kernel(request):
+    """Body of a forked child: run an IPython kernel on the connection file."""
+    code = 0
+    try:
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        # As with `python -m ipykernel_launcher` started in the notebook directory
+        sys.path[0] = request["cwd"]
+        sys.argv = ["ipykernel_launcher", "-f", request["connection_file"]]
+
+        from ipykernel.kernelapp import IPKernelApp
+
+        # The default is read from the environment when ipykernel is imported,
+        # i.e. in the server; take the one of this kernel
+        app = IPKernelApp.instance(parent_handle=int(os.environ.get("JPY_PARENT_PID") or 0))
+        app.initialize(sys.argv[1:])
+        if "matplotlib.pyplot" in sys.modules:
+            # pyplot was imported before the shell existed: hook up inline figures
+            app.shell.enable_matplotlib("inline")
+        app.start()
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else 0
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _reap(kernels):
+    """Report the kernels that exited to their clients."""
+    for pid, conn in list(kernels.items()):
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            with contextlib.suppress(OSError):
+                _send(conn, {"exit": os.waitstatus_to_exitcode(status)})
+            conn.close()
+            del kernels[pid]
+
+
+def serve(socket_path, preload):
+    # Figures of the preloaded pyplot go through the inline backend
+    os.environ.setdefault("MPLBACKEND", "module://matplotlib_inline.backend_inline")
+    # pyarrow (imported by pandas) starts a jemalloc purging thread by default;
+    # without it the server has a single thread when it forks
+    os.environ.setdefault("JE_ARROW_MALLOC_CONF", "background_thread:false")
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except ImportError as exc:
+            print(f"forkserver: cannot preload {name}: {exc}", file=sys.stderr)
+    import ipykernel.kernelapp  # noqa: F401
+
+    # Bind under a temporary name so the socket only appears once it accepts
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path + ".tmp")
+    server.listen()
+    os.rename(socket_path + ".tmp", socket_path)
+
+    # The server stays single-threaded, so a fork never copies a lock held by
+    # another thread: one select loop accepts requests, notices clients that
+    # went away and reaps the kernels
+    kernels = {}  # pid -> connection of the client
+    while True:
+        readable, _, _ = select.select([server, *kernels.values()], [], [], 0.1)
+        for pid, conn in list(kernels.items()):
+            if conn in readable and not conn.recv(1, socket.MSG_PEEK):
+                # The client was killed, take the kernel with it
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(pid, signal.SIGKILL)
+        _reap(kernels)
+        if server not in readable:
+            continue
+
+        conn, _ = server.accept()
+        request = _receive(conn)
+        if request is None:
+            conn.close()
+            continue
+        if request.get("stop"):
+            conn.close()
+            break
+
+        pid = os.fork()
+        if pid == 0:
+            server.close()
+            conn.close()
+            for other in kernels.values():
+                other.close()
+            _reseed()
+            _run_kernel(request)
+        _send(conn, {"pid": pid})
+        kernels[pid] = conn
+
+    server.close()
+    os.unlink(socket_path)
+
+
+def connect(socket_path, connection_file):
+    """Ask the server for a kernel, then wait for it like a kernel process."""
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(socket_path)
+    _send(conn, {"connection_file": os.path.abspath(connection_file), "cwd": os.getcwd(), "env": dict(os.environ)})
+    pid = _receive(conn)["pid"]
+
+    def relay(signum, frame):
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(pid, signum)
+        if signum == signal.SIGTERM:
+            sys.exit(128 + signum)
+
+    for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+        signal.signal(signum, relay)
+
+    reply = _receive(conn)
+    sys.exit(reply["exit"] if reply else 1)
+
+
+def kernel_manager(socket_path, **kwargs):
+    """A jupyter ``AsyncKernelManager`` that starts kernels on the fork server."""
+    from jupyter_client.manager import AsyncKernelManager
+
+    class ForkServerKernelManager(AsyncKernelManager):
+        def format_kernel_cmd(self, extra_arguments=None):
+            return [sys.executable, str(Path(__file__).resolve()), "connect", socket_path, "-f", self.connection_file]
+
+    return ForkServerKernelManager(**kwargs)
+
+
+@contextlib.contextmanager
+def forkserver(preload=None, timeout=300):
+    """Run a fork server in a subprocess, yield the path of its socket."""
+    if preload is None:
+        sys.path.insert(0, str(ROOT))
+        from ts2025.lazy import STACK as preload
+
+    with tempfile.TemporaryDirectory(prefix="ts2025-forkserver-") as directory:
+        socket_path = os.path.join(directory, "server.sock")
+        process = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve", socket_path, *preload],
+            cwd=ROOT,
+        )
+        try:
+            deadline = time.monotonic() + timeout
+            while not os.path.exists(socket_path):
+                if process.poll() is not None:
+                    raise RuntimeError(f"fork server exited with {process.returncode}")
+                if time.monotonic() > deadline:
+                    raise TimeoutError("fork server did not start")
+                time.sleep(0.05)
+            yield socket_path
+        finally:
+            with contextlib.suppress(OSError):
+                conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                conn.connect(socket_path)
+                _send(conn, {"stop": True})
+                conn.close()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="import the modules and fork kernels on request")
+    serve_parser.add_argument("socket")
+    serve_parser.add_argument("preload", nargs="*")
+    connect_parser = commands.add_parser("connect", help="start a kernel on a running server")
+    connect_parser.add_argument("socket")
+    connect_parser.add_argument("-f", dest="connection_file", required=True)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket, args.preload)
+    else:
+        connect(args.socket, args.connection_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Load test for the circle/sine wave app.
+
+Simulates N browser sessions that press Play and then fire the interval
+callback every 50 ms, the same way dcc.Interval does, and reports callback
+latency percentiles. Start the server first, e.g.
+
+    uv run gunicorn wsgi:server --workers 4 --bind 127.0.0.1:8050
+    uv run python scripts/loadtest_app.py --sessions 40 --duration 30
+"""
+import argparse
+import gzip
+import json
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+OUTPUTS = [
+    {'id': 'circle-plot', 'property': 'figure'},
+    {'id': 'sine-plot', 'property': 'figure'},
+    {'id': 'interval-component', 'property': 'disabled'},
+    {'id': 'time-store', 'property': 'data'},
+    {'id': 'is-playing', 'property': 'data'},
+]
+
+
+def callback_payload(trigger, n_intervals, play_clicks, frequency, current_time, is_playing):
+    return {
+        'output': '..' + '...'.join(f"{o['id']}.{o['property']}" for o in OUTPUTS) + '..',
+        'outputs': OUTPUTS,
+        'inputs': [
+            {'id': 'interval-component', 'property': 'n_intervals', 'value': n_intervals},
+            {'id': 'frequency-slider', 'property': 'value', 'value': frequency},
+            {'id': 'play-button', 'property': 'n_clicks', 'value': play_clicks},
+            {'id': 'reset-button', 'property': 'n_clicks', 'value': 0},
+        ],
+        'changedPropIds': [trigger],
+        'state': [
+            {'id': 'time-store', 'property': 'data', 'value': current_time},
+            {'id': 'is-playing', 'property': 'data', 'value': is_playing},
+        ],
+    }
+
+
+def post(url, payload):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'},
+    )
+    with urllib.request.urlopen(request) as response:
+        body = response.read()
+        encoding = response.headers.get('Content-Encoding')
+
+    if encoding == 'gzip':
+        body = gzip.decompress(body)
+
+    return json.loads(body)['response'], len(body)
+
+
+def run_session(url, frequency, duration, interval, latencies, errors):
+    current_time, is_playing = 0.0, False
+    n_intervals = 0
+
+    try:
+        # Press Play once, then follow the interval ticks
+        response, _ = post(url, callback_payload(
+            'play-button.n_clicks', n_intervals, 1, frequency, current_time, is_playing))
+        current_time = response['time-store']['data']
+        is_playing = response['is-playing']['data']
+
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            n_intervals += 1
+            start = time.perf_counter()
+            response, _ = post(url, callback_payload(
+                'interval-component.n_intervals', n_intervals, 1, frequency, current_time, is_playing))
+            elapsed = time.perf_counter() - start
+            latencies.append(elapsed)
+
+            current_time = response['time-store']['data']
+            # Like the browser, the next tick is not sent before the last one returned
+            time.sleep(max(0.0, interval - elapsed))
+    except Exception as exc:  # Keep the other sessions running
+        errors.append(repr(exc))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8050')
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=20.0, help='seconds of playback per session')
+    parser.add_argument('--interval', type=float, default=0.05, help='seconds between ticks')
+    args = parser.parse_args()
+
+    url = args.url.rstrip('/') + '/_dash-update-component'
+    latencies, errors = [], []
+    rng = np.random.default_rng(0)
+
+    threads = [
+        threading.Thread(
+            target=run_session,
+            # Sessions use different slider values, as students would
+            args=(url, round(float(rng.choice(np.arange(1, 51))) / 10, 1),
+                  args.duration, args.interval, latencies, errors),
+        )
+        for _ in range(args.sessions)
+    ]
+    wall_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+
+    if not latencies:
+        print(f"No successful callbacks, {len(errors)} errors: {errors[:3]}")
+        return
+
+    ms = np.array(latencies) * 1000
+    expected = args.sessions * args.duration / args.interval
+    print(f"sessions:        {args.sessions}")
+    print(f"callbacks:       {len(ms)} ({len(ms) / wall:.1f}/s, {len(ms) / expected:.0%} of the nominal tick rate)")
+    print(f"errors:          {len(errors)}")
+    for q in (50, 90, 95, 99):
+        print(f"p{q:<2} latency:    {np.percentile(ms, q):8.1f} ms")
+    print(f"max latency:     {ms.max():8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+"""Profile every code cell of a notebook.
+
+Executes the notebook headlessly and records for each code cell the wall
+time, the CPU time of the kernel, the peak resident memory while the cell ran
+and the time spent importing the heavy packages (statsmodels, arch, plotly,
+manim, ...). The report is written as JSON and as a sortable HTML table and
+compared with the previous run of the same notebook:
+
+    uv run python -m scripts.profile_notebook 04-ARMA.ipynb 08-GARCH.ipynb
+
+Reports go to ``.cache/profile/<notebook>.json`` and ``.html``; the previous
+JSON report is kept as ``<notebook>.previous.json``. Memory and CPU time of
+worker processes started by a cell are not included.
+"""
+import argparse
+import hashlib
+import html
+import json
+import time
+from pathlib import Path
+
+import nbformat
+
+ROOT = Path(__file__).resolve().parent.parent
+PROFILE_DIR = ROOT / ".cache" / "profile"
+
+TRACKED_IMPORTS = ["statsmodels", "arch", "plotly", "manim", "pandas", "numpy", "scipy",
+                   "matplotlib", "seaborn", "yfinance", "sklearn", "statsforecast", "dash"]
+
+# Runs in the kernel before the notebook. Records one entry per executed cell
+# through the IPython pre/post_run_cell events and times imports of tracked
+# packages that are not loaded yet.
+KERNEL_SETUP = """
+def _profile_setup(tracked):
+    import builtins, resource, sys, time
+
+    records = []
+    state = {"depth": 0, "imports": {}}
+    original_import = builtins.__import__
+
+    def timed_import(name, *args, **kwargs):
+        top = name.partition(".")[0]
+        if state["depth"] or top not in tracked or top in sys.modules:
+            return original_import(name, *args, **kwargs)
+        state["depth"] += 1
+        start = time.perf_counter()
+        try:
+            return original_import(name, *args, **kwargs)
+        finally:
+            state["depth"] -= 1
+            state["imports"][top] = state["imports"].get(top, 0.0) + time.perf_counter() - start
+
+    def peak_rss_mb():
+        try:
+            with open("/proc/self/status") as status:
+                for line in status:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+    def pre_run_cell(info):
+        try:
+            # Reset the peak RSS so that it covers this cell only (Linux)
+            with open("/proc/self/clear_refs", "w") as clear_refs:
+                clear_refs.write("5")
+        except OSError:
+            pass
+        state["imports"] = {}
+        state["start"] = (time.perf_counter(), time.process_time(), info.raw_cell)
+
+    def post_run_cell(result):
+        if "start" not in state:
+            return
+        wall, cpu, source = state.pop("start")
+        records.append({
+            "source": source,
+            "wall": time.perf_counter() - wall,
+            "cpu": time.process_time() - cpu,
+            "peak_rss_mb": peak_rss_mb(),
+            "imports": state["imports"],
+        })
+
+    builtins.__import__ = timed_import
+    ip = get_ipython()
+    ip.events.register("pre_run_cell", pre_run_cell)
+    ip.events.register("post_run_cell", post_run_cell)
+    return records
+
+_profile_records = _profile_setup(set(%r))
+"""
+
+KERNEL_COLLECT = "import json as _json; print(_json.dumps(_profile_records))"
+
+
+def _digest(source):
+    return hashlib.sha256(source.encode()).hexdigest()[:12]
+
+
+def profile(path, timeout=1800, tracked=TRACKED_IMPORTS):
+    from nbclient import NotebookClient
+
+    nb = nbformat.read(path, as_version=4)
+    client = NotebookClient(nb, timeout=timeout, resources={"metadata": {"path": str(ROOT)}})
+
+    def run_hidden(source):
+        # execute_cell writes the cell back into the notebook at its index,
+        # so the helper cells are appended temporarily
+        nb.cells.append(nbformat.v4.new_code_cell(source))
+        cell = client.execute_cell(nb.cells[-1], len(nb.cells) - 1, store_history=False)
+        nb.cells.pop()
+        return cell
+
+    start = time.perf_counter()
+    with client.setup_kernel():
+        setup = KERNEL_SETUP % (list(tracked),)
+        run_hidden(setup)
+        for index, cell in enumerate(nb.cells):
+            if cell.cell_type == "code":
+                client.execute_cell(cell, index)
+        collect = run_hidden(KERNEL_COLLECT)
+    total = time.perf_counter() - start
+
+    records = json.loads("".join(output.get("text", "") for output in collect.outputs))
+    records = [record for record in records if record["source"] != setup]
+
+    # nbclient does not send empty cells (or cells tagged to be skipped) to
+    # the kernel, so pair the records with the cells by their source, in order
+    code_cells = iter([(index, cell) for index, cell in enumerate(nb.cells) if cell.cell_type == "code"])
+    matched = []
+    for record in records:
+        for index, cell in code_cells:
+            if cell.source == record["source"]:
+                matched.append((index, cell, record))
+                break
+
+    cells = []
+    for index, cell, record in matched:
+        first_line = next((line for line in cell.source.splitlines() if line.strip()), "")
+        cells.append({
+            "cell": index,
+            "hash": _digest(cell.source),
+            "first_line": first_line[:80],
+            "wall": record["wall"],
+            "cpu": record["cpu"],
+            "peak_rss_mb": record["peak_rss_mb"],
+            "imports": record["imports"],
+        })
+
+    return {"notebook": str(Path(path).name), "total_wall": total, "cells": cells,
+            "profiled": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def compare(report, previous):
+    """Add the change of wall time against the previous report, matched by cell source."""
+    if previous is None:
+        return report
+    before = {cell["hash"]: cell["wall"] for cell in previous["cells"]}
+    for cell in report["cells"]:
+        if cell["hash"] in before:
+            cell["wall_previous"] = before[cell["hash"]]
+            cell["wall_change"] = cell["wall"] - before[cell["hash"]]
+    report["total_wall_previous"] = previous["total_wall"]
+    return report
+
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Profile of {notebook}</title>
+<style>
+body {{ font-family: sans-serif; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 4px 8px; border-bottom: 1px solid #ddd; text-align: right; }}
+td.source {{ text-align: left; font-family: monospace; }}
+th {{ cursor: pointer; background: #f0f0f0; }}
+.slower {{ color: #b00; }} .faster {{ color: #070; }}
+</style></head><body>
+<h2>{notebook}</h2>
+<p>Total wall time {total:.1f} s{previous}. Profiled {profiled}. Click a column header to sort.</p>
+<table id="cells"><thead><tr>
+<th>cell</th><th>wall (s)</th><th>change (s)</th><th>cpu (s)</th><th>peak RSS (MB)</th><th>imports (s)</th><th>source</th>
+</tr></thead><tbody>
+{rows}
+</tbody></table>
+<script>
+document.querySelectorAll("#cells th").forEach((th, col) => th.addEventListener("click", () => {{
+  const body = document.querySelector("#cells tbody");
+  const rows = Array.from(body.rows);
+  const key = r => {{ const v = parseFloat(r.cells[col].dataset.value ?? r.cells[col].textContent); return isNaN(v) ? r.cells[col].textContent : v; }};
+  const dir = th.dataset.dir = th.dataset.dir === "desc" ? "asc" : "desc";
+  rows.sort((a, b) => (key(a) > key(b) ? 1 : -1) * (dir === "desc" ? -1 : 1));
+  rows.forEach(r => body.appendChild(r));
+}}));
+</script></body></html>
+"""
+
+
+def to_html(report):
+    rows = []
+    for cell in report["cells"]:
+        change = cell.get("wall_change")
+        css = "" if change is None else ("slower" if change > 0 else "faster")
+        imports = ", ".join(f"{name} {seconds:.2f}" for name, seconds in sorted(cell["imports"].items(), key=lambda kv: -kv[1]))
+        rows.append(
+            f"<tr><td>{cell['cell']}</td><td>{cell['wall']:.3f}</td>"
+            f"<td class=\"{css}\" data-value=\"{'' if change is None else change}\">{'' if change is None else f'{change:+.3f}'}</td>"
+            f"<td>{cell['cpu']:.3f}</td><td>{cell['peak_rss_mb']:.0f}</td>"
+            f"<td data-value=\"{sum(cell['imports'].values())}\">{html.escape(imports)}</td>"
+            f"<td class=\"source\">{html.escape(cell['first_line'])}</td></tr>"
+        )
+    previous = report.get("total_wall_previous")
+    return HTML_TEMPLATE.format(
+        notebook=html.escape(report["notebook"]),
+        total=report["total_wall"],
+        previous="" if previous is None else f" (previous run {previous:.1f} s)",
+        profiled=report["profiled"],
+        rows="\n".join(rows),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("notebooks", nargs="+")
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds per cell")
+    parser.add_argument("--top", type=int, default=10, help="slowest cells to print")
+    parser.add_argument("--output-dir", type=Path, default=PROFILE_DIR)
+    args = parser.parse_args()
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    for notebook in args.notebooks:
+        stem = Path(notebook).stem
+        json_path = args.output_dir / f"{stem}.json"
+        previous = json.loads(json_path.read_text()) if json_path.exists() else None
+
+        report = compare(profile(notebook, timeout=args.timeout), previous)
+
+        if previous is not None:
+            (args.output_dir / f"{stem}.previous.json").write_text(json.dumps(previous, indent=2))
+        json_path.write_text(json.dumps(report, indent=2))
+        (args.output_dir / f"{stem}.html").write_text(to_html(report))
+
+        print(f"{notebook}: {report['total_wall']:.1f} s total, report in {json_path.with_suffix('.html')}")
+        for cell in sorted(report["cells"], key=lambda cell: -cell["wall"])[:args.top]:
+            change = cell.get("wall_change")
+            change = "" if change is None else f"{change:+8.2f}"
+            print(f"  cell {cell['cell']:>3} {cell['wall']:8.2f} s {change:>8} {cell['peak_rss_mb']:7.0f} MB  {cell['first_line']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Render all manim scenes under ``videos/`` in parallel.
+
+Every ``Scene`` subclass defined in ``videos/*.py`` (directly or through
+another scene of the same directory, e.g. ``ThreeDScene`` or
+``ComplexSineWaveRedraw(ComplexSineWave)``) is found without importing manim
+and rendered by its own ``manim`` process:
+
+    uv run python -m scripts.render_videos --quality h --workers 4
+    uv run python -m scripts.render_videos ComplexSineWave --quality l
+
+A scene is skipped when its hash is unchanged and its video still exists.
+The hash covers
+
+- the scene file and the modules of ``videos/`` it imports (e.g. ``curves.py``),
+- the installed manim version,
+- the render configuration (quality and extra manim arguments).
+
+The produced files, hashes and render times are written to
+``.cache/videos/manifest.json``; the videos themselves are in
+``videos/media/videos/<file>/<quality>/<Scene>.mp4`` as with a manual render.
+"""
+import argparse
+import ast
+import hashlib
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import metadata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+VIDEOS = ROOT / "videos"
+MEDIA_DIR = VIDEOS / "media"
+MANIFEST = ROOT / ".cache" / "videos" / "manifest.json"
+
+# manim's -q flags and the directory it renders each quality to
+QUALITIES = {"l": "480p15", "m": "720p30", "h": "1080p60", "p": "1440p60", "k": "2160p60"}
+
+
+def _base_names(node):
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            yield base.id
+        elif isinstance(base, ast.Attribute):
+            yield base.attr
+
+
+def _local_imports(tree):
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+        elif isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+    return sorted(name for name in names if (VIDEOS / f"{name}.py").exists())
+
+
+def discover():
+    """Return ``[(file, scene, local_imports), ...]`` for ``videos/*.py``."""
+    found = []
+    for path in sorted(VIDEOS.glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        scenes = set()
+        for node in tree.body:
+            # manim's scene classes all end in "Scene"; local subclasses follow
+            if isinstance(node, ast.ClassDef) and any(
+                name.endswith("Scene") or name in scenes for name in _base_names(node)
+            ):
+                scenes.add(node.name)
+                found.append((path.name, node.name, _local_imports(tree)))
+    return found
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "not installed"
+
+
+def scene_hash(file, local_imports, config):
+    digest = hashlib.sha256()
+    digest.update((VIDEOS / file).read_bytes())
+    for module in local_imports:
+        digest.update((VIDEOS / f"{module}.py").read_bytes())
+    digest.update(manim_version().encode())
+    digest.update(json.dumps(config, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def output_path(file, scene, quality):
+    return MEDIA_DIR / "videos" / Path(file).stem / QUALITIES[quality] / f"{scene}.mp4"
+
+
+def render(file, scene, quality, extra):
+    """Render one scene in a separate manim process, return wall time in seconds."""
+    command = [sys.executable, "-m", "manim", "render", f"-q{quality}", "--media_dir", str(MEDIA_DIR), *extra, file, scene]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=VIDEOS, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if result.returncode != 0:
+        lines = (result.stderr or result.stdout).strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"manim exited with {result.returncode}")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quality", "-q", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="render all scenes")
+    parser.add_argument("--list", action="store_true", help="only list the scenes")
+    parser.add_argument("--manim-args", default="", help="extra arguments passed to manim, e.g. '--fps 30'")
+    parser.add_argument("scenes", nargs="*", help="subset of scene names (default: all)")
+    args = parser.parse_args()
+
+    scenes = [item for item in discover() if not args.scenes or item[1] in args.scenes]
+    if args.list:
+        for file, scene, _ in scenes:
+            print(f"{file}:{scene}")
+        return
+
+    extra = args.manim_args.split()
+    config = {"quality": args.quality, "manim_args": extra}
+    manifest = json.loads(MANIFEST.read_text()) if MANIFEST.exists() else {}
+
+    todo, report = [], {}
+    for file, scene, local_imports in scenes:
+        key = f"{file}:{scene}:{args.quality}"
+        digest = scene_hash(file, local_imports, config)
+        output = output_path(file, scene, args.quality)
+        if not args.force and manifest.get(key, {}).get("hash") == digest and output.exists():
+            report[key] = {"status": "cached", "seconds": 0.0}
+        else:
+            todo.append((key, file, scene, digest, output))
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(render, file, scene, args.quality, extra): (key, digest, output)
+            for key, file, scene, digest, output in todo
+        }
+        for future in as_completed(futures):
+            key, digest, output = futures[future]
+            try:
+                seconds = future.result()
+            except Exception as exc:
+                failed.append(key)
+                report[key] = {"status": "failed", "seconds": None, "error": str(exc)}
+                continue
+            report[key] = {"status": "rendered", "seconds": seconds}
+            manifest[key] = {
+                "hash": digest,
+                "output": str(output.relative_to(ROOT)),
+                "bytes": output.stat().st_size if output.exists() else None,
+                "seconds": seconds,
+                "config": config,
+                "manim": manim_version(),
+                "rendered": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+
+    MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    print(f"{'scene':<60} {'status':<10} {'seconds':>8}")
+    for key, entry in sorted(report.items(), key=lambda item: -(item[1]["seconds"] or 0)):
+        seconds = "" if entry["seconds"] is None else f"{entry['seconds']:8.1f}"
+        print(f"{key:<60} {entry['status']:<10} {seconds:>8}")
+        if "error" in entry:
+            print(f"    {entry['error']}")
+
+    if failed:
+        raise SystemExit(f"render failed: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
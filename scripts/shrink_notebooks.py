@@ -0,0 +1,201 @@
+"""Reduce the size of the outputs stored in the notebooks.
+
+- Raster outputs are re-encoded as optimized PNGs, which is lossless. Lossy
+  options are opt-in: ``--palette`` quantizes to 256 colours without
+  dithering (plots have few colours, but gradients band) and ``--max-width``
+  downscales wider images; ``--format webp`` writes lossless WebP instead of
+  PNG. An image is only replaced when the new encoding is smaller.
+- With ``--extract-duplicates`` an image that appears more than once across
+  the processed notebooks is written once to ``figures/outputs/`` and the
+  outputs refer to it through a markdown image. ``scripts.build_book
+  --shrink`` does this for the chapters of the book, in its build copy.
+- Numeric arrays in Plotly figure outputs are stored as base64 typed arrays
+  (``{"dtype": "f8", "bdata": ...}``, read by plotly.js >= 2.28) instead of
+  JSON lists of numbers.
+
+    uv run python -m scripts.shrink_notebooks            # all notebooks
+    uv run python -m scripts.shrink_notebooks --dry-run 08-GARCH.ipynb
+    uv run python -m scripts.shrink_notebooks --palette --max-width 1200
+
+The bytes saved per notebook are reported.
+"""
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+from collections import Counter
+from numbers import Number
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUTS_DIR = ROOT / "figures" / "outputs"
+
+PLOTLY_MIME = "application/vnd.plotly.v1+json"
+MIN_TYPED_ARRAY = 16  # Shorter lists are not worth encoding
+
+
+def _load(path):
+    return json.loads(Path(path).read_text())
+
+
+def dump_notebook(nb):
+    # The layout written by nbformat/Jupyter
+    return json.dumps(nb, indent=1, ensure_ascii=False) + "\n"
+
+
+def _outputs(nb):
+    for cell in nb["cells"]:
+        for output in cell.get("outputs", []):
+            if "data" in output:
+                yield output
+
+
+def _joined(value):
+    return "".join(value) if isinstance(value, list) else value
+
+
+def reencode_image(raw, image_format="png", max_width=0, palette=False):
+    """Return ``(mime, bytes)`` of the smaller encoding of a PNG image.
+
+    Lossless unless ``max_width`` is set (and the image is wider) or
+    ``palette`` is true.
+    """
+    image = Image.open(io.BytesIO(raw))
+    image.load()
+
+    if max_width and image.width > max_width:
+        height = round(image.height * max_width / image.width)
+        image = image.resize((max_width, height), Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    if image_format == "webp":
+        image.save(buffer, "WEBP", lossless=True, method=6)
+        mime = "image/webp"
+    else:
+        if palette and image.mode == "RGBA":
+            image = image.quantize(256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+        elif palette and image.mode != "P":
+            image = image.convert("RGB").quantize(256, dither=Image.Dither.NONE)
+        image.save(buffer, "PNG", optimize=True)
+        mime = "image/png"
+
+    encoded = buffer.getvalue()
+    if len(encoded) >= len(raw):
+        return "image/png", raw
+    return mime, encoded
+
+
+def _typed_array(values):
+    array = np.asarray(values)
+    if array.dtype.kind in "iu" and np.abs(array).max(initial=0) < 2**31:
+        array, dtype = array.astype("<i4"), "i4"
+    else:
+        array, dtype = array.astype("<f8"), "f8"
+    return {"dtype": dtype, "bdata": base64.b64encode(array.tobytes()).decode("ascii")}
+
+
+def compact_plotly(value):
+    """Replace long lists of numbers in Plotly trace data by typed arrays."""
+    if isinstance(value, dict):
+        return {key: compact_plotly(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if (len(value) >= MIN_TYPED_ARRAY
+                and all(isinstance(item, Number) and not isinstance(item, bool) for item in value)):
+            return _typed_array(value)
+        return [compact_plotly(item) for item in value]
+    return value
+
+
+def shrink(path, image_format="png", max_width=0, palette=False, shared=None, write_shared=True,
+           outputs_dir=OUTPUTS_DIR):
+    """Shrink the outputs of one notebook in memory, return the notebook.
+
+    ``shared`` is a set of image hashes to extract to ``outputs_dir``.
+    """
+    nb = _load(path)
+    for output in _outputs(nb):
+        data = output["data"]
+
+        if "image/png" in data:
+            raw = base64.b64decode(_joined(data["image/png"]))
+            digest = hashlib.sha256(raw).hexdigest()[:16]
+            mime, encoded = reencode_image(raw, image_format, max_width, palette)
+
+            if shared is not None and digest in shared:
+                target = Path(outputs_dir) / f"{digest}{'.webp' if mime == 'image/webp' else '.png'}"
+                if write_shared and not target.exists():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    target.write_bytes(encoded)
+                link = Path(os.path.relpath(target, Path(path).resolve().parent)).as_posix()
+                del data["image/png"]
+                data["text/markdown"] = f"![]({link})"
+                output.get("metadata", {}).pop("image/png", None)
+                continue
+
+            del data["image/png"]
+            data[mime] = base64.b64encode(encoded).decode("ascii")
+            metadata = output.get("metadata", {})
+            if "image/png" in metadata and mime != "image/png":
+                metadata[mime] = metadata.pop("image/png")
+
+        if PLOTLY_MIME in data:
+            figure = data[PLOTLY_MIME]
+            if "data" in figure:
+                figure["data"] = compact_plotly(figure["data"])
+
+    return nb
+
+
+def duplicate_images(paths):
+    """Hashes of PNG outputs that occur more than once across ``paths``."""
+    counts = Counter()
+    for path in paths:
+        for output in _outputs(_load(path)):
+            if "image/png" in output["data"]:
+                raw = base64.b64decode(_joined(output["data"]["image/png"]))
+                counts[hashlib.sha256(raw).hexdigest()[:16]] += 1
+    return {digest for digest, count in counts.items() if count > 1}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("notebooks", nargs="*", help="default: every notebook in the repository")
+    parser.add_argument("--format", choices=["png", "webp"], default="png")
+    parser.add_argument("--max-width", type=int, default=0, help="downscale wider images (pixels), 0 keeps the size")
+    parser.add_argument("--palette", action="store_true", help="quantize PNGs to 256 colours (lossy)")
+    parser.add_argument("--extract-duplicates", action="store_true")
+    parser.add_argument("--dry-run", action="store_true", help="only report the savings")
+    args = parser.parse_args()
+
+    paths = [Path(p) for p in args.notebooks] or sorted(
+        p.relative_to(ROOT) for p in ROOT.rglob("*.ipynb")
+        if ".ipynb_checkpoints" not in p.parts and "_site" not in p.parts
+    )
+    shared = duplicate_images(paths) if args.extract_duplicates else None
+
+    total_before = total_after = 0
+    for path in paths:
+        before = path.stat().st_size
+        text = dump_notebook(shrink(path, args.format, args.max_width, args.palette, shared,
+                                        write_shared=not args.dry_run))
+        after = len(text.encode("utf-8"))
+        if not args.dry_run and after < before:
+            path.write_text(text, encoding="utf-8")
+        total_before += before
+        total_after += min(before, after)
+        print(f"{str(path):<45} {before / 1024:8.0f} KB -> {min(before, after) / 1024:8.0f} KB "
+              f"({(before - min(before, after)) / 1024:6.0f} KB saved)")
+
+    print(f"{'total':<45} {total_before / 1024:8.0f} KB -> {total_after / 1024:8.0f} KB "
+          f"({(total_before - total_after) / 1024:6.0f} KB saved)")
+    if shared and not args.dry_run:
+        print(f"{len(shared)} duplicated images written to {OUTPUTS_DIR.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
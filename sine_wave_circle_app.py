@@ -1,92 +1,116 @@
-import dash
-from dash import dcc, html
-import plotly.graph_objects as go
+import argparse
+import base64
+from functools import lru_cache
+from pathlib import Path
+
 import numpy as np
-from dash.dependencies import Input, Output, State
-
-# Initialize the Dash app
-app = dash.Dash(__name__)
-
-# Define the app layout
-app.layout = html.Div([
-    html.H2("Circle and Sine Wave Animation", style={'textAlign': 'center', 'marginBottom': '20px'}),
-    html.Div([
-        html.Label("Angular Frequency (ω):", style={'fontWeight': 'bold', 'marginRight': '10px'}),
-        dcc.Slider(
-            id='frequency-slider',
-            min=0.1,
-            max=5,
-            step=0.1,
-            value=1.0,
-            marks={i: str(i) for i in range(0, 6)},
-            tooltip={"placement": "bottom", "always_visible": True}
-        ),
-    ], style={'marginBottom': '20px', 'padding': '20px'}),
-    html.Div([
-        html.Button('Play/Pause', id='play-button', n_clicks=0, 
-                   style={'marginRight': '10px', 'padding': '10px 20px', 'fontSize': '16px'}),
-        html.Button('Reset', id='reset-button', n_clicks=0, 
-                   style={'padding': '10px 20px', 'fontSize': '16px'}),
-    ], style={'marginBottom': '20px', 'textAlign': 'center'}),
-    dcc.Interval(
-        id='interval-component',
-        interval=50,  # Update every 50ms for smooth animation
-        disabled=True,
-        n_intervals=0
-    ),
-    dcc.Store(id='time-store', data=0.0),
-    dcc.Store(id='is-playing', data=False),
-    html.Div([
+
+from ts2025.lazy import lazy_import
+
+# Dash and Plotly are only imported when a layout or figure is built, so the
+# static export and the frame math do not pay for them
+dash = lazy_import('dash')
+dcc = lazy_import('dash.dcc')
+html = lazy_import('dash.html')
+dependencies = lazy_import('dash.dependencies')
+go = lazy_import('plotly.graph_objects')
+pio = lazy_import('plotly.io')
+
+# Animation constants shared by the server-side and clientside modes
+TIME_STEP = 0.05  # Time increment per interval tick
+MAX_TIME = 4 * np.pi  # Time range shown in the sine wave plot
+N_SINE_POINTS = 500
+FRAME_CACHE_SIZE = 4096  # Frames kept per worker, each holds both figures
+
+# Slider grid (frequency = index / 10) and the time steps of one loop
+FREQUENCY_INDICES = np.arange(1, 51)
+TIME_INDICES = np.arange(int(MAX_TIME / TIME_STEP) + 1)
+STATIC_BUDGET_KB = 512  # Packed frame data of the static export
+
+# Geometry that does not depend on the slider or the time
+CIRCLE_THETA = np.linspace(0, 2*np.pi, 100)
+CIRCLE_X = np.cos(CIRCLE_THETA)
+CIRCLE_Y = np.sin(CIRCLE_THETA)
+T_RANGE = np.linspace(0, MAX_TIME, N_SINE_POINTS)
+
+# Trace indices of the moving parts, used by the clientside callback
+CIRCLE_RADIUS_TRACE = 3
+CIRCLE_PROJECTION_TRACE = 4
+CIRCLE_POINT_TRACE = 5
+SINE_WAVE_TRACE = 0
+SINE_TRACED_TRACE = 1
+SINE_POINT_TRACE = 2
+SINE_VERTICAL_TRACE = 3
+
+
+def make_layout(circle_figure=None, sine_figure=None):
+    circle_graph = {'figure': circle_figure} if circle_figure is not None else {}
+    sine_graph = {'figure': sine_figure} if sine_figure is not None else {}
+
+    return html.Div([
+        html.H2("Circle and Sine Wave Animation", style={'textAlign': 'center', 'marginBottom': '20px'}),
         html.Div([
-            html.H4("Unit Circle", style={'textAlign': 'center'}),
-            dcc.Graph(id='circle-plot', style={'height': '500px'})
-        ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'}),
+            html.Label("Angular Frequency (ω):", style={'fontWeight': 'bold', 'marginRight': '10px'}),
+            dcc.Slider(
+                id='frequency-slider',
+                min=0.1,
+                max=5,
+                step=0.1,
+                value=1.0,
+                marks={i: str(i) for i in range(0, 6)},
+                tooltip={"placement": "bottom", "always_visible": True}
+            ),
+        ], style={'marginBottom': '20px', 'padding': '20px'}),
         html.Div([
-            html.H4("Sine Wave", style={'textAlign': 'center'}),
-            dcc.Graph(id='sine-plot', style={'height': '500px'})
-        ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'})
-    ])
-], style={'padding': '20px'})
-
-@app.callback(
-    [Output('circle-plot', 'figure'),
-     Output('sine-plot', 'figure'),
-     Output('interval-component', 'disabled'),
-     Output('time-store', 'data'),
-     Output('is-playing', 'data')],
-    [Input('interval-component', 'n_intervals'),
-     Input('frequency-slider', 'value'),
-     Input('play-button', 'n_clicks'),
-     Input('reset-button', 'n_clicks')],
-    [State('time-store', 'data'),
-     State('is-playing', 'data')]
-)
-def update_plots(n_intervals, frequency, play_clicks, reset_clicks, current_time, is_playing):
-    ctx = dash.callback_context
-    
-    # Handle button clicks
-    if ctx.triggered:
-        trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-        
-        if trigger_id == 'play-button':
-            is_playing = not is_playing
-        elif trigger_id == 'reset-button':
-            current_time = 0.0
-            is_playing = False
-    
+            html.Button('Play/Pause', id='play-button', n_clicks=0, 
+                       style={'marginRight': '10px', 'padding': '10px 20px', 'fontSize': '16px'}),
+            html.Button('Reset', id='reset-button', n_clicks=0, 
+                       style={'padding': '10px 20px', 'fontSize': '16px'}),
+        ], style={'marginBottom': '20px', 'textAlign': 'center'}),
+        dcc.Interval(
+            id='interval-component',
+            interval=50,  # Update every 50ms for smooth animation
+            disabled=True,
+            n_intervals=0
+        ),
+        dcc.Store(id='time-store', data=0.0),
+        dcc.Store(id='is-playing', data=False),
+        html.Div([
+            html.Div([
+                html.H4("Unit Circle", style={'textAlign': 'center'}),
+                dcc.Graph(id='circle-plot', style={'height': '500px'}, **circle_graph)
+            ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'}),
+            html.Div([
+                html.H4("Sine Wave", style={'textAlign': 'center'}),
+                dcc.Graph(id='sine-plot', style={'height': '500px'}, **sine_graph)
+            ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'})
+        ])
+    ], style={'padding': '20px'})
+
+
+def advance_time(trigger_id, current_time, is_playing):
+    """Apply a button click or interval tick to the animation state."""
+    if trigger_id == 'play-button':
+        is_playing = not is_playing
+    elif trigger_id == 'reset-button':
+        current_time = 0.0
+        is_playing = False
+
     # Update time if playing
     if is_playing:
-        current_time += 0.05  # Increment time by 0.05 per interval
-    
+        current_time += TIME_STEP
+
     # Limit time range for sine wave display
-    max_time = 4 * np.pi
-    if current_time > max_time:
+    if current_time > MAX_TIME:
         current_time = 0.0
-    
+
+    return current_time, is_playing
+
+
+def build_circle_figure(frequency, current_time):
     # Create circle plot
-    theta = np.linspace(0, 2*np.pi, 100)
-    circle_x = np.cos(theta)
-    circle_y = np.sin(theta)
+    circle_x = CIRCLE_X
+    circle_y = CIRCLE_Y
     
     # Current point on circle
     current_theta = frequency * current_time
@@ -98,8 +122,6 @@ def update_plots(n_intervals, frequency, play_clicks, reset_clicks, current_time
     line_y = [0, point_y]
     
     # Projection lines
-    proj_x_line = [point_x, point_x]
-    proj_y_line = [point_y, point_y]
     proj_x_axis = [point_x, point_x]
     proj_y_axis = [0, point_y]
     
@@ -160,9 +182,13 @@ def update_plots(n_intervals, frequency, play_clicks, reset_clicks, current_time
         showlegend=False,
         height=500
     )
-    
+
+    return circle_fig
+
+
+def build_sine_figure(frequency, current_time):
     # Create sine wave plot
-    t_range = np.linspace(0, max_time, 500)
+    t_range = T_RANGE
     sine_values = np.sin(frequency * t_range)
     
     # Trace of the sine wave up to current time
@@ -210,7 +236,7 @@ def update_plots(n_intervals, frequency, play_clicks, reset_clicks, current_time
     
     # Add x-axis
     sine_fig.add_trace(go.Scatter(
-        x=[0, max_time], y=[0, 0],
+        x=[0, MAX_TIME], y=[0, 0],
         mode='lines',
         name='x-axis',
         line=dict(color='gray', width=1, dash='dash'),
@@ -219,7 +245,7 @@ def update_plots(n_intervals, frequency, play_clicks, reset_clicks, current_time
     
     sine_fig.update_layout(
         xaxis=dict(
-            range=[0, max_time],
+            range=[0, MAX_TIME],
             title='time (seconds)'
         ),
         yaxis=dict(range=[-1.2, 1.2], title='sin(ωt)'),
@@ -227,9 +253,385 @@ def update_plots(n_intervals, frequency, play_clicks, reset_clicks, current_time
         showlegend=False,
         height=500
     )
+
+    return sine_fig
+
+
+def frame_key(frequency, current_time):
+    """Snap the slider value and the time to the grid they move on.
+
+    The slider moves in steps of 0.1 and the time in steps of TIME_STEP, so
+    every reachable frame is identified by two integers.
+    """
+    return int(round(frequency * 10)), int(round(current_time / TIME_STEP))
+
+
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def frame_payload(frequency_index, time_index):
+    """Serialized circle and sine figures for one frame."""
+    frequency = frequency_index / 10
+    current_time = time_index * TIME_STEP
+
+    circle_fig = build_circle_figure(frequency, current_time).to_plotly_json()
+    sine_fig = build_sine_figure(frequency, current_time).to_plotly_json()
+
+    return circle_fig, sine_fig
+
+
+def frame_cache_stats():
+    info = frame_payload.cache_info()
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'maxsize': info.maxsize,
+    }
+
+
+def update_plots(n_intervals, frequency, play_clicks, reset_clicks, current_time, is_playing):
+    ctx = dash.callback_context
     
+    # Handle button clicks
+    trigger_id = None
+    if ctx.triggered:
+        trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
+
+    current_time, is_playing = advance_time(trigger_id, current_time, is_playing)
+
+    circle_fig, sine_fig = frame_payload(*frame_key(frequency, current_time))
+
     return circle_fig, sine_fig, not is_playing, current_time, is_playing
 
+
+# Same state machine as `advance_time` and the same geometry as the
+# `build_*_figure` functions, evaluated in the browser. The figures already on
+# the page are reused and only the moving traces and titles are replaced, so an
+# interval tick never reaches the server.
+CLIENTSIDE_UPDATE = """
+function(n_intervals, frequency, play_clicks, reset_clicks, current_time, is_playing, circle_fig, sine_fig) {
+    const ctx = dash_clientside.callback_context;
+    let trigger_id = null;
+    if (ctx.triggered && ctx.triggered.length) {
+        trigger_id = ctx.triggered[0].prop_id.split('.')[0];
+    }
+
+    if (trigger_id === 'play-button') {
+        is_playing = !is_playing;
+    } else if (trigger_id === 'reset-button') {
+        current_time = 0.0;
+        is_playing = false;
+    }
+    if (is_playing) {
+        current_time += %(time_step)r;
+    }
+    if (current_time > %(max_time)r) {
+        current_time = 0.0;
+    }
+
+    const theta = frequency * current_time;
+    const point_x = Math.cos(theta);
+    const point_y = Math.sin(theta);
+
+    const circle_data = circle_fig.data.slice();
+    circle_data[%(circle_radius)d] = Object.assign({}, circle_data[%(circle_radius)d], {x: [0, point_x], y: [0, point_y]});
+    circle_data[%(circle_projection)d] = Object.assign({}, circle_data[%(circle_projection)d], {x: [point_x, point_x], y: [0, point_y]});
+    circle_data[%(circle_point)d] = Object.assign({}, circle_data[%(circle_point)d], {x: [point_x], y: [point_y]});
+    const circle_layout = Object.assign({}, circle_fig.layout, {
+        title: Object.assign({}, circle_fig.layout.title, {text: 'θ = ' + theta.toFixed(2) + ' rad'})
+    });
+
+    const t_range = [];
+    for (let i = 0; i < %(n_points)d; i++) {
+        t_range.push(%(max_time)r * i / (%(n_points)d - 1));
+    }
+    const t_trace = t_range.filter(t => t <= current_time);
+    const current_sine = Math.sin(theta);
+
+    const sine_data = sine_fig.data.slice();
+    if (trigger_id !== 'interval-component') {
+        // The full wave only depends on the frequency
+        sine_data[%(sine_wave)d] = Object.assign({}, sine_data[%(sine_wave)d], {
+            x: t_range, y: t_range.map(t => Math.sin(frequency * t))
+        });
+    }
+    sine_data[%(sine_traced)d] = Object.assign({}, sine_data[%(sine_traced)d], {
+        x: t_trace, y: t_trace.map(t => Math.sin(frequency * t))
+    });
+    sine_data[%(sine_point)d] = Object.assign({}, sine_data[%(sine_point)d], {x: [current_time], y: [current_sine]});
+    sine_data[%(sine_vertical)d] = Object.assign({}, sine_data[%(sine_vertical)d], {x: [current_time, current_time], y: [0, current_sine]});
+    const sine_layout = Object.assign({}, sine_fig.layout, {
+        title: Object.assign({}, sine_fig.layout.title, {text: 'sin(' + frequency.toFixed(2) + ' t)'})
+    });
+
+    return [
+        {data: circle_data, layout: circle_layout},
+        {data: sine_data, layout: sine_layout},
+        !is_playing,
+        current_time,
+        is_playing
+    ];
+}
+""" % dict(
+    time_step=TIME_STEP,
+    max_time=float(MAX_TIME),
+    n_points=N_SINE_POINTS,
+    circle_radius=CIRCLE_RADIUS_TRACE,
+    circle_projection=CIRCLE_PROJECTION_TRACE,
+    circle_point=CIRCLE_POINT_TRACE,
+    sine_wave=SINE_WAVE_TRACE,
+    sine_traced=SINE_TRACED_TRACE,
+    sine_point=SINE_POINT_TRACE,
+    sine_vertical=SINE_VERTICAL_TRACE,
+)
+
+
+def static_frames(dtype='float32'):
+    """Every reachable frame of the app, packed as flat arrays.
+
+    Same math as `build_circle_figure` and `build_sine_figure`, evaluated for
+    all slider values and time steps at once:
+
+    - ``wave``: the full sine wave for each frequency, shape (frequencies, points)
+    - ``point``: cos/sin of the angle for each frequency and time step,
+      shape (frequencies, times, 2)
+    - ``traced``: number of points of the traced wave at each time step (the
+      traced wave is a prefix of the full wave)
+    """
+    frequencies = FREQUENCY_INDICES / 10
+    times = TIME_INDICES * TIME_STEP
+    theta = frequencies[:, None] * times[None, :]
+
+    return {
+        'wave': np.sin(frequencies[:, None] * T_RANGE[None, :]).astype(dtype),
+        'point': np.stack([np.cos(theta), np.sin(theta)], axis=-1).astype(dtype),
+        'traced': np.searchsorted(T_RANGE, times, side='right').astype('uint16'),
+    }
+
+
+def _check_static_frames(frames, samples=((10, 0), (1, 1), (27, 100), (50, TIME_INDICES[-1]))):
+    """Compare a few packed frames with the figures of the Dash app."""
+    tolerance = 1e-3 if frames['wave'].dtype == np.float16 else 1e-6
+    for frequency_index, time_index in samples:
+        frequency, current_time = frequency_index / 10, time_index * TIME_STEP
+        i = frequency_index - FREQUENCY_INDICES[0]
+        circle = build_circle_figure(frequency, current_time).data
+        sine = build_sine_figure(frequency, current_time).data
+        n = frames['traced'][time_index]
+
+        assert np.allclose(frames['point'][i, time_index], [circle[CIRCLE_POINT_TRACE].x[0], circle[CIRCLE_POINT_TRACE].y[0]], atol=tolerance)
+        assert np.allclose(frames['wave'][i], sine[SINE_WAVE_TRACE].y, atol=tolerance)
+        assert n == len(sine[SINE_TRACED_TRACE].x)
+        assert np.allclose(frames['wave'][i, :n], sine[SINE_TRACED_TRACE].y, atol=tolerance)
+
+
+def _pack(array):
+    return base64.b64encode(np.ascontiguousarray(array).astype(array.dtype.newbyteorder('<')).tobytes()).decode('ascii')
+
+
+# Player for the static export: the same controls as `make_layout`, the frames
+# are looked up in the packed arrays instead of being computed by a server.
+STATIC_CONTROLS = """
+<div style="padding: 20px">
+  <label style="font-weight: bold">Angular Frequency (ω): <span id="frequency-value"></span></label>
+  <input id="frequency-slider" type="range" min="%(min_index)d" max="%(max_index)d" step="1" value="10" style="width: 100%%">
+  <div style="text-align: center; margin: 10px">
+    <button id="play-button" style="padding: 10px 20px; font-size: 16px">Play/Pause</button>
+    <button id="reset-button" style="padding: 10px 20px; font-size: 16px">Reset</button>
+  </div>
+</div>
+"""
+
+STATIC_SCRIPT = """
+<script>
+(function() {
+    function decode(text, Type) {
+        const bytes = Uint8Array.from(atob(text), c => c.charCodeAt(0));
+        return new Type(bytes.buffer);
+    }
+    function toFloat(half) {
+        // float16 -> float32, used when the export was made with --dtype float16
+        const out = new Float32Array(half.length);
+        for (let i = 0; i < half.length; i++) {
+            const h = half[i], s = h & 0x8000 ? -1 : 1, e = (h >> 10) & 0x1f, m = h & 0x3ff;
+            out[i] = e === 0 ? s * Math.pow(2, -14) * m / 1024 : s * Math.pow(2, e - 15) * (1 + m / 1024);
+        }
+        return out;
+    }
+    const floats = text => "%(dtype)s" === "float16" ? toFloat(decode(text, Uint16Array)) : decode(text, Float32Array);
+    const wave = floats("%(wave)s");
+    const point = floats("%(point)s");
+    const traced = decode("%(traced)s", Uint16Array);
+    const nPoints = %(n_points)d, nTimes = %(n_times)d, minIndex = %(min_index)d;
+    const tRange = Array.from({length: nPoints}, (_, i) => %(max_time)r * i / (nPoints - 1));
+
+    const circle = document.getElementById("circle-plot");
+    const sine = document.getElementById("sine-plot");
+    const slider = document.getElementById("frequency-slider");
+    let timeIndex = 0, timer = null;
+
+    function draw(waveChanged) {
+        const f = Number(slider.value), i = f - minIndex;
+        const frequency = f / 10, currentTime = timeIndex * %(time_step)r;
+        const row = wave.subarray(i * nPoints, (i + 1) * nPoints);
+        const k = 2 * (i * nTimes + timeIndex), px = point[k], py = point[k + 1];
+        const n = traced[timeIndex];
+        document.getElementById("frequency-value").textContent = frequency.toFixed(1);
+
+        Plotly.restyle(circle, {x: [[0, px], [px, px], [px]], y: [[0, py], [0, py], [py]]},
+                       [%(circle_radius)d, %(circle_projection)d, %(circle_point)d]);
+        Plotly.relayout(circle, {"title.text": "θ = " + (frequency * currentTime).toFixed(2) + " rad"});
+        const update = {x: [tRange.slice(0, n), [currentTime], [currentTime, currentTime]],
+                        y: [Array.from(row.subarray(0, n)), [py], [0, py]]};
+        const traces = [%(sine_traced)d, %(sine_point)d, %(sine_vertical)d];
+        if (waveChanged) {
+            update.x.push(tRange);
+            update.y.push(Array.from(row));
+            traces.push(%(sine_wave)d);
+            Plotly.relayout(sine, {"title.text": "sin(" + frequency.toFixed(2) + " t)"});
+        }
+        Plotly.restyle(sine, update, traces);
+    }
+
+    slider.addEventListener("input", () => draw(true));
+    document.getElementById("play-button").addEventListener("click", () => {
+        if (timer === null) {
+            timer = setInterval(() => { timeIndex = (timeIndex + 1) %% nTimes; draw(false); }, 50);
+        } else {
+            clearInterval(timer);
+            timer = null;
+        }
+    });
+    document.getElementById("reset-button").addEventListener("click", () => {
+        clearInterval(timer);
+        timer = null;
+        timeIndex = 0;
+        draw(false);
+    });
+    draw(true);
+})();
+</script>
+"""
+
+
+def export_static(path, dtype='float32', budget_kb=STATIC_BUDGET_KB, include_plotlyjs='cdn'):
+    """Write the animation as a standalone HTML page that needs no server.
+
+    All frames are precomputed (`static_frames`) and embedded as base64
+    typed arrays; a small script replays them with ``Plotly.restyle``. The
+    book embeds the page with an iframe (see ``scripts/build_book.py``). Raises
+    ``ValueError`` when the packed frames exceed ``budget_kb``. Returns the
+    size of the packed frames and of the page in bytes.
+    """
+    frames = static_frames(dtype)
+    _check_static_frames(frames)
+
+    packed = {name: _pack(array) for name, array in frames.items()}
+    data_bytes = sum(len(text) for text in packed.values())
+    if data_bytes > budget_kb * 1024:
+        raise ValueError(
+            f"packed frames take {data_bytes / 1024:.0f} KB, over the budget of {budget_kb} KB "
+            f"(try dtype='float16')"
+        )
+
+    circle_fig = build_circle_figure(1.0, 0.0)
+    sine_fig = build_sine_figure(1.0, 0.0)
+    plots = (
+        '<div style="display: flex">'
+        + '<div style="width: 50%%">%s</div>' % pio.to_html(circle_fig, full_html=False, include_plotlyjs=include_plotlyjs, div_id='circle-plot')
+        + '<div style="width: 50%%">%s</div>' % pio.to_html(sine_fig, full_html=False, include_plotlyjs=False, div_id='sine-plot')
+        + '</div>'
+    )
+    controls = STATIC_CONTROLS % dict(min_index=FREQUENCY_INDICES[0], max_index=FREQUENCY_INDICES[-1])
+    script = STATIC_SCRIPT % dict(
+        packed,
+        dtype=dtype,
+        n_points=N_SINE_POINTS,
+        n_times=len(TIME_INDICES),
+        min_index=FREQUENCY_INDICES[0],
+        max_time=float(MAX_TIME),
+        time_step=TIME_STEP,
+        circle_radius=CIRCLE_RADIUS_TRACE,
+        circle_projection=CIRCLE_PROJECTION_TRACE,
+        circle_point=CIRCLE_POINT_TRACE,
+        sine_wave=SINE_WAVE_TRACE,
+        sine_traced=SINE_TRACED_TRACE,
+        sine_point=SINE_POINT_TRACE,
+        sine_vertical=SINE_VERTICAL_TRACE,
+    )
+    html_page = (
+        '<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8"><title>Circle and Sine Wave Animation</title></head>\n'
+        '<body>\n<h2 style="text-align: center">Circle and Sine Wave Animation</h2>\n'
+        + controls + plots + script + '</body>\n</html>\n'
+    )
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(html_page, encoding='utf-8')
+    return data_bytes, len(html_page.encode('utf-8'))
+
+
+def create_app(clientside=False, compress=False):
+    """Build the Dash app.
+
+    With ``clientside=True`` the initial figures are shipped with the layout
+    and every update is computed in the browser, so playback does no server
+    work per tick. ``compress=True`` gzips callback responses (needs
+    flask-compress).
+    """
+    # Initialize the Dash app
+    app = dash.Dash(__name__, compress=compress)
+
+    Input, Output, State = dependencies.Input, dependencies.Output, dependencies.State
+
+    outputs = [Output('circle-plot', 'figure'),
+               Output('sine-plot', 'figure'),
+               Output('interval-component', 'disabled'),
+               Output('time-store', 'data'),
+               Output('is-playing', 'data')]
+    inputs = [Input('interval-component', 'n_intervals'),
+              Input('frequency-slider', 'value'),
+              Input('play-button', 'n_clicks'),
+              Input('reset-button', 'n_clicks')]
+    states = [State('time-store', 'data'),
+              State('is-playing', 'data')]
+
+    if clientside:
+        app.layout = make_layout(build_circle_figure(1.0, 0.0), build_sine_figure(1.0, 0.0))
+        app.clientside_callback(
+            CLIENTSIDE_UPDATE,
+            outputs,
+            inputs,
+            states + [State('circle-plot', 'figure'), State('sine-plot', 'figure')],
+        )
+    else:
+        app.layout = make_layout()
+        app.callback(outputs, inputs, states)(update_plots)
+
+        # Hit/miss counters of the frame cache of this worker
+        app.server.add_url_rule('/frame-cache-stats', view_func=frame_cache_stats)
+
+    return app
+
+
 if __name__ == '__main__':
-    app.run(debug=True, port=8050)
+    parser = argparse.ArgumentParser(description="Circle and sine wave animation")
+    parser.add_argument('--clientside', action='store_true',
+                        help="animate in the browser instead of calling the server on every tick")
+    parser.add_argument('--export', metavar='PATH',
+                        help="write a standalone HTML page with all frames precomputed and exit")
+    parser.add_argument('--dtype', choices=['float32', 'float16'], default='float32',
+                        help="precision of the exported frames")
+    parser.add_argument('--budget-kb', type=int, default=STATIC_BUDGET_KB,
+                        help="maximum size of the exported frame data")
+    args = parser.parse_args()
+
+    if args.export:
+        try:
+            data_bytes, page_bytes = export_static(args.export, dtype=args.dtype, budget_kb=args.budget_kb)
+        except ValueError as exc:
+            parser.error(str(exc))
+        print(f"{args.export}: {page_bytes / 1024:.0f} KB ({data_bytes / 1024:.0f} KB frame data)")
+        raise SystemExit
 
+    app = create_app(clientside=args.clientside)
+    app.run(debug=True, port=8050)
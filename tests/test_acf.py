@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from statsmodels.stats.diagnostic import acorr_ljungbox
+
+from ts2025.acf import ljung_box
+
+
+def test_ljung_box_matches_statsmodels():
+    x = np.random.default_rng(0).standard_normal((3, 50))
+
+    lb_stat, lb_pvalue = ljung_box(x, lags=[1, 5, 49], model_df=2)
+
+    for i, row in enumerate(x):
+        expected = acorr_ljungbox(row, lags=[1, 5, 49], model_df=2)
+        np.testing.assert_allclose(lb_stat[i], expected["lb_stat"], rtol=1e-10)
+        np.testing.assert_allclose(lb_pvalue[i], expected["lb_pvalue"], rtol=1e-10)
+
+
+@pytest.mark.parametrize("lags", [50, [5, 60], 0, [0, 3]])
+def test_ljung_box_rejects_lags_out_of_range(lags):
+    with pytest.raises(ValueError, match="between 1 and nobs - 1 = 49"):
+        ljung_box(np.zeros((2, 50)), lags=lags)
@@ -0,0 +1,60 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from ts2025.batch_arma import fit_arma
+from ts2025.simulate import arma_generate_paths
+
+
+@pytest.fixture(scope="module")
+def arma21_paths():
+    # Series 27 used to take a Newton step to a unit root, where the
+    # stationary initialization is singular
+    return arma_generate_paths([1, -0.5, 0.3], [1, 0.4], 200, 30, burnin=100, seed=0)
+
+
+def test_boundary_step_does_not_abort_batch(arma21_paths):
+    res = fit_arma(arma21_paths, order=(2, 0, 1))
+
+    assert res.converged.all()
+    assert np.isfinite(res.params.values).all()
+    assert np.isfinite(res.bse.values).all()
+
+
+def test_matches_statsmodels(arma21_paths):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    res = fit_arma(arma21_paths[25:], order=(2, 0, 1))
+    for i, y in enumerate(arma21_paths[25:]):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = ARIMA(y, order=(2, 0, 1)).fit()
+        np.testing.assert_allclose(res.params.iloc[i], expected.params, atol=1e-3)
+        np.testing.assert_allclose(res.bse.iloc[i], expected.bse, rtol=1e-2)
+        assert res.llf[i] >= expected.llf - 1e-6
+
+
+def test_not_converged_within_maxiter(arma21_paths):
+    res = fit_arma(arma21_paths[:3], order=(2, 0, 1), maxiter=1)
+
+    assert not res.converged.any()
+    assert (res.iterations == 1).all()
+
+
+def test_failed_start_restarts_from_white_noise(arma21_paths, monkeypatch):
+    import ts2025.batch_arma as batch_arma
+
+    start_values = batch_arma._start_values
+
+    def broken_start(y, p, q, trend):
+        x = start_values(y, p, q, trend)
+        x[1, 1] = np.inf  # the filter fails for the second series
+        return x
+
+    expected = fit_arma(arma21_paths[:3], order=(2, 0, 1))
+    monkeypatch.setattr(batch_arma, "_start_values", broken_start)
+    res = fit_arma(arma21_paths[:3], order=(2, 0, 1))
+
+    assert res.converged.all()
+    np.testing.assert_allclose(res.params.values, expected.params.values, atol=1e-3)
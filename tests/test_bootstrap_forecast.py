@@ -0,0 +1,59 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from ts2025.bootstrap_forecast import TailQuantiles, bootstrap_summary_frame, psi_weights
+from ts2025.simulate import arma_generate_paths
+
+
+@pytest.fixture(scope="module")
+def seasonal_series():
+    ar = np.convolve([1, -0.5], [1, 0, 0, 0, -0.4])
+    ma = np.convolve([1, 0.3], [1, 0, 0, 0, 0.2])
+    return arma_generate_paths(ar, ma, 300, 1, burnin=100, seed=1)[0]
+
+
+def _fit(y, order, seasonal_order):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return ARIMA(y, order=order, seasonal_order=seasonal_order).fit()
+
+
+@pytest.mark.parametrize("order, seasonal_order, integrate, rtol", [
+    ((1, 0, 1), (1, 0, 1, 4), False, 1e-10),
+    # The end-of-sample state of the differenced model is not known exactly,
+    # statsmodels adds its (small) uncertainty to the forecast variance
+    ((0, 1, 1), (0, 1, 1, 12), True, 1e-3),
+])
+def test_psi_weights_give_forecast_variance(seasonal_series, order, seasonal_order, integrate, rtol):
+    y = np.cumsum(np.r_[np.zeros(12), seasonal_series]) if integrate else seasonal_series
+    res = _fit(y, order, seasonal_order)
+    sigma2 = np.asarray(res.params)[res.model.param_names.index("sigma2")]
+
+    psi = psi_weights(res, 16)
+
+    np.testing.assert_allclose(sigma2 * np.cumsum(psi**2), res.get_forecast(16).var_pred_mean, rtol=rtol)
+
+
+def test_seasonal_intervals_close_to_gaussian(seasonal_series):
+    res = _fit(seasonal_series, (1, 0, 1), (1, 0, 1, 4))
+
+    frame = bootstrap_summary_frame(res, steps=8, nboot=20_000, seed=0)
+    expected = res.get_forecast(8).summary_frame()
+
+    width = expected["mean_ci_upper"] - expected["mean_ci_lower"]
+    np.testing.assert_allclose(frame["mean_ci_upper"] - frame["mean_ci_lower"], width, rtol=0.1)
+
+
+@pytest.mark.parametrize("total, block_size", [(1000, 97), (7, 3), (5000, 1)])
+def test_tail_quantiles_match_numpy(total, block_size):
+    probs = [0.025, 0.1, 0.5, 0.9, 0.975]
+    values = np.random.default_rng(0).standard_normal((total, 4))
+    quantiles = TailQuantiles(probs, total, 4)
+    for start in range(0, total, block_size):
+        quantiles.update(values[start:start + block_size])
+
+    np.testing.assert_allclose(quantiles.quantiles(), np.quantile(values, probs, axis=0))
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ts2025.bulk_forecast import forecast_panel, forecast_panel_statsmodels, to_long_panel
+from ts2025.simulate import arma_generate_paths
+
+
+def _panel():
+    x = 2 + arma_generate_paths([1, -0.5], [1], 80, 2, burnin=50, seed=0)
+    return to_long_panel(x)
+
+
+def test_monthly_dates_extend_like_statsforecast():
+    panel = _panel()
+    panel["ds"] = pd.Timestamp("2020-01-31") + pd.offsets.MonthEnd(1) * (panel["ds"] % 80)
+    panel["ds"] = pd.to_datetime(panel["ds"])
+
+    from statsforecast.models import ARIMA
+
+    fast = forecast_panel(panel, 3, models=[ARIMA(order=(1, 0, 0), include_mean=True, alias="ARIMA")],
+                          freq="ME", n_jobs=1)
+    slow = forecast_panel_statsmodels(panel, 3)
+
+    assert list(slow["ds"]) == list(fast["ds"])
+    assert slow["ds"].iloc[0] == pd.Timestamp("2026-09-30")
+
+
+def test_integer_ds_steps_by_freq():
+    slow = forecast_panel_statsmodels(_panel(), 2, freq=5)
+
+    np.testing.assert_array_equal(slow["ds"], [84, 89, 84, 89])
+
+
+def test_other_ds_rejected():
+    panel = _panel()
+    panel["ds"] = panel["ds"].astype(str)
+
+    with pytest.raises(ValueError, match="integers or datetimes"):
+        forecast_panel_statsmodels(panel, 2)
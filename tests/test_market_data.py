@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ts2025.market_data import FIELDS, LocalProvider, MarketDataStore
+
+
+def _bars(seed, start="2019-01-01", end="2021-12-31"):
+    index = pd.bdate_range(start, end, name="Date")
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, index.size)))
+    return pd.DataFrame({"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+                         "Volume": rng.integers(1_000, 10_000, index.size).astype(float)}, index=index)
+
+
+@pytest.fixture
+def provider():
+    return LocalProvider({"AAA": _bars(0), "BBB": _bars(1)})
+
+
+@pytest.fixture
+def store(provider, tmp_path):
+    return MarketDataStore(provider, root=tmp_path)
+
+
+def _expected(provider, ticker, start, end):
+    bars = provider.bars[ticker]
+    return bars[(bars.index >= start) & (bars.index < end)]
+
+
+def test_cache_hit_does_not_fetch(store, provider):
+    first = store.download("AAA BBB", "2020-01-01", "2020-07-01")
+    second = store.download("AAA BBB", "2020-02-01", "2020-05-01")
+
+    assert len(provider.calls) == 1
+    expected = first.loc["2020-02-01":"2020-04-30"].copy()
+    expected.iloc[0, expected.columns.get_loc(("LogReturn", "AAA"))] = np.nan
+    expected.iloc[0, expected.columns.get_loc(("LogReturn", "BBB"))] = np.nan
+    pd.testing.assert_frame_equal(second, expected, check_freq=False)
+
+
+def test_tickers_missing_the_same_range_share_one_call(store, provider):
+    store.download(["AAA", "BBB"], "2020-01-01", "2020-03-01")
+
+    assert provider.calls == [(("AAA", "BBB"), "2020-01-01", "2020-03-01")]
+
+
+def test_incremental_update_fetches_only_the_new_range(store, provider):
+    store.download("AAA", "2020-01-01", "2020-03-01")
+    result = store.download("AAA", "2020-01-01", "2020-06-01")
+
+    assert provider.calls[-1] == (("AAA",), "2020-03-01", "2020-06-01")
+    expected = _expected(provider, "AAA", "2020-01-01", "2020-06-01")
+    np.testing.assert_allclose(result["Close"]["AAA"], expected["Close"])
+    np.testing.assert_allclose(result["LogReturn"]["AAA"].iloc[1:], np.diff(np.log(expected["Close"])))
+
+
+def test_gap_between_stored_ranges_is_filled(store, provider):
+    store.download("AAA", "2020-01-01", "2020-03-01")
+    store.download("AAA", "2020-05-01", "2020-07-01")
+    result = store.download("AAA", "2020-01-01", "2020-07-01")
+
+    assert provider.calls[-1] == (("AAA",), "2020-03-01", "2020-05-01")
+    expected = _expected(provider, "AAA", "2020-01-01", "2020-07-01")
+    pd.testing.assert_index_equal(result.index, expected.index, check_names=False)
+    np.testing.assert_allclose(result["Close"]["AAA"], expected["Close"])
+    # The return across the former boundaries uses the filled-in bars
+    np.testing.assert_allclose(result["LogReturn"]["AAA"].iloc[1:], np.diff(np.log(expected["Close"])))
+
+
+def test_bars_are_partitioned_by_year(store, tmp_path):
+    store.download("AAA", "2019-06-01", "2021-03-01")
+
+    assert sorted(path.name for path in (tmp_path / "AAA").glob("*.parquet")) == \
+        ["2019.parquet", "2020.parquet", "2021.parquet"]
+    assert list(store.load("AAA").columns) == FIELDS + ["LogReturn"]
+
+
+def test_todays_bar_is_not_cached_before_the_close(provider, tmp_path):
+    now = [pd.Timestamp("2020-06-10 12:00", tz="America/New_York")]
+    store = MarketDataStore(provider, root=tmp_path, clock=lambda: now[0])
+
+    intraday = store.download("AAA", "2020-06-01", "2020-06-30")
+    assert intraday.index[-1] == pd.Timestamp("2020-06-09")
+
+    now[0] = pd.Timestamp("2020-06-10 18:00", tz="America/New_York")
+    after_close = store.download("AAA", "2020-06-01", "2020-06-30")
+    assert provider.calls[-1] == (("AAA",), "2020-06-10", "2020-06-11")
+    assert after_close.index[-1] == pd.Timestamp("2020-06-10")
+
+
+def test_log_returns_do_not_depend_on_the_stored_bars(provider, tmp_path):
+    warm = MarketDataStore(provider, root=tmp_path / "warm")
+    warm.download("AAA", "2020-01-01", "2020-03-01")
+    cold = MarketDataStore(provider, root=tmp_path / "cold")
+
+    pd.testing.assert_frame_equal(warm.download("AAA", "2020-02-01", "2020-04-01"),
+                                  cold.download("AAA", "2020-02-01", "2020-04-01"))
+
+
+def test_corporate_action_refetches_the_stored_span(tmp_path):
+    original = _bars(0)
+    now = [pd.Timestamp("2020-06-30 18:00", tz="America/New_York")]
+    provider = LocalProvider({"AAA": original})
+    store = MarketDataStore(provider, root=tmp_path, clock=lambda: now[0])
+    store.download("AAA", "2020-01-01", "2020-07-01")
+
+    # A 2:1 split on 2020-08-03: the adjusted history is halved
+    split = pd.Timestamp("2020-08-03")
+    adjusted = original.copy()
+    adjusted.loc[adjusted.index < split, ["Open", "High", "Low", "Close"]] /= 2
+    provider.bars["AAA"] = adjusted
+    provider.corporate_actions["AAA"] = [split]
+    now[0] = pd.Timestamp("2020-09-30 18:00", tz="America/New_York")
+    result = store.download("AAA", "2020-01-01", "2020-10-01")
+
+    assert provider.action_calls == [(("AAA",), "2020-07-01", "2020-10-01")]
+    assert provider.calls[-1] == (("AAA",), "2020-01-01", "2020-10-01")
+    expected = adjusted[(adjusted.index >= "2020-01-01") & (adjusted.index < "2020-10-01")]
+    np.testing.assert_allclose(result["Close"]["AAA"], expected["Close"])
+    np.testing.assert_allclose(result["LogReturn"]["AAA"].iloc[1:], np.diff(np.log(expected["Close"])))
+
+
+def test_no_corporate_action_appends_only_the_new_range(tmp_path):
+    now = [pd.Timestamp("2020-06-30 18:00", tz="America/New_York")]
+    provider = LocalProvider({"AAA": _bars(0)})
+    store = MarketDataStore(provider, root=tmp_path, clock=lambda: now[0])
+    store.download("AAA", "2020-01-01", "2020-07-01")
+
+    now[0] = pd.Timestamp("2020-09-30 18:00", tz="America/New_York")
+    store.download("AAA", "2020-01-01", "2020-10-01")
+
+    assert provider.action_calls == [(("AAA",), "2020-07-01", "2020-10-01")]
+    assert provider.calls[-1] == (("AAA",), "2020-07-01", "2020-10-01")
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from ts2025.montecarlo import RunningMoments, forecast_loss_experiment, last_value, random_walk_sample
+
+
+@pytest.mark.parametrize("nrep", [0, -5])
+def test_rejects_no_replications(nrep):
+    with pytest.raises(ValueError, match="nrep"):
+        forecast_loss_experiment(random_walk_sample, {"Last Balance": last_value}, nrep=nrep, workers=1)
+
+
+def test_empty_and_single_observation_moments():
+    moments = RunningMoments(2)
+    moments.update(np.empty((0, 2)))
+    moments.merge(RunningMoments(2))
+    assert moments.count == 0
+    assert np.isnan(moments.variance).all()
+
+    moments.update([[1.0, 2.0]])
+    assert np.isnan(moments.variance).all()
+
+
+def test_single_replication():
+    table = forecast_loss_experiment(random_walk_sample, {"Last Balance": last_value}, nrep=1, workers=1, seed=0)
+
+    assert table["nrep"].iloc[0] == 1
+    assert np.isfinite(table["mean_loss"]).all()
@@ -0,0 +1,25 @@
+import numpy as np
+
+from ts2025.order_selection import select_order
+
+
+def test_bic_bound_below_fitted_criterion_when_differenced():
+    y = np.cumsum(np.random.default_rng(0).standard_normal(200))
+
+    table = select_order(y, p_max=2, d_max=1, q_max=2, criterion="bic", workers=1)
+
+    fitted = table[table["status"] == "fitted"]
+    assert (fitted["criterion_lower_bound"] <= fitted["criterion"] + 1e-8).all()
+    assert (fitted["criterion"] == fitted["bic"]).all()
+
+
+def test_candidates_ranked_within_d():
+    y = np.cumsum(np.random.default_rng(1).standard_normal(150))
+
+    table = select_order(y, p_max=1, d_max=1, q_max=1, workers=1, prune=False)
+
+    assert table.index.names == ["d", "rank"]
+    for d in (0, 1):
+        ranked = table.loc[d]
+        assert list(ranked.index) == list(range(4))
+        assert ranked["criterion"].is_monotonic_increasing
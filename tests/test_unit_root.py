@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+from statsmodels.tsa.stattools import adfuller
+
+from ts2025.unit_root import adf_statistic
+
+
+@pytest.mark.parametrize("regression", ["n", "c", "ct", "ctt"])
+@pytest.mark.parametrize("lags", [0, 2])
+def test_adf_statistic_matches_adfuller(regression, lags):
+    x = np.cumsum(np.random.default_rng(0).standard_normal((10, 150)), axis=1)
+
+    expected = [adfuller(row, regression=regression, maxlag=lags, autolag=None)[0] for row in x]
+
+    np.testing.assert_allclose(adf_statistic(x, regression, lags), expected, rtol=1e-9)
@@ -0,0 +1,5 @@
+"""Helpers shared by the course notebooks.
+
+The notebooks are executed from the repository root, so the modules can be
+imported directly, e.g. ``from ts2025.simulate import arma_generate_paths``.
+"""
@@ -0,0 +1,124 @@
+"""Autocorrelations, partial autocorrelations and Ljung-Box tests for many series.
+
+The functions take a 2-D array with one series per row (a 1-D array is
+treated as a single series) and return one row of results per series. They
+are meant for screening many series at once, e.g. the squared residuals of
+many GARCH fits; for a single series ``plot_acf``/``plot_pacf`` remain the
+tools used in the chapters.
+"""
+import numpy as np
+from scipy import fft, stats
+
+
+def _as_2d(x):
+    x = np.asarray(x, dtype=float)
+    return x[np.newaxis, :] if x.ndim == 1 else x
+
+
+def acf(x, nlags=40, demean=True, batch_size=10_000):
+    """Sample autocorrelations up to lag ``nlags``.
+
+    Computed with one real FFT per batch of ``batch_size`` series. Matches
+    ``statsmodels.tsa.stattools.acf(x, nlags=nlags, adjusted=False)``.
+
+    Returns an array of shape ``(nseries, nlags + 1)``, the first column is
+    the autocorrelation at lag 0 (always 1).
+    """
+    x = _as_2d(x)
+    nseries, nobs = x.shape
+    nlags = min(nlags, nobs - 1)
+    # Zero padding to at least 2 * nobs - 1 avoids circular wrap-around
+    nfft = fft.next_fast_len(2 * nobs - 1, real=True)
+
+    result = np.empty((nseries, nlags + 1))
+    for start in range(0, nseries, batch_size):
+        block = x[start:start + batch_size]
+        if demean:
+            block = block - block.mean(axis=1, keepdims=True)
+        spectrum = fft.rfft(block, n=nfft, axis=1)
+        acov = fft.irfft(spectrum.real**2 + spectrum.imag**2, n=nfft, axis=1)[:, :nlags + 1]
+        result[start:start + batch_size] = acov / acov[:, :1]
+
+    return result
+
+
+def pacf_from_acf(r):
+    """Partial autocorrelations from autocorrelations (Durbin-Levinson).
+
+    ``r`` has shape ``(nseries, nlags + 1)`` as returned by :func:`acf`. The
+    recursion runs over the lags and is vectorized over the series.
+    """
+    r = _as_2d(r)
+    nseries, ncols = r.shape
+    nlags = ncols - 1
+
+    pacf = np.empty((nseries, ncols))
+    pacf[:, 0] = 1.0
+    if nlags == 0:
+        return pacf
+
+    # phi[:, :k] holds the AR(k) coefficients phi_{k,1}, ..., phi_{k,k}
+    phi = np.zeros((nseries, nlags))
+    phi[:, 0] = r[:, 1]
+    pacf[:, 1] = r[:, 1]
+    sigma2 = 1.0 - r[:, 1] ** 2
+
+    for k in range(2, nlags + 1):
+        prev = phi[:, :k - 1]
+        # r_{k-1}, ..., r_1
+        reversed_r = r[:, k - 1:0:-1]
+        phi_kk = (r[:, k] - np.einsum('ij,ij->i', prev, reversed_r)) / sigma2
+        phi[:, :k - 1] = prev - phi_kk[:, np.newaxis] * prev[:, ::-1]
+        phi[:, k - 1] = phi_kk
+        sigma2 = sigma2 * (1.0 - phi_kk**2)
+        pacf[:, k] = phi_kk
+
+    return pacf
+
+
+def pacf(x, nlags=40, demean=True, batch_size=10_000):
+    """Sample partial autocorrelations up to lag ``nlags``.
+
+    Matches ``statsmodels.tsa.stattools.pacf(x, nlags=nlags, method="ldb")``.
+    """
+    return pacf_from_acf(acf(x, nlags=nlags, demean=demean, batch_size=batch_size))
+
+
+def ljung_box(x, lags=10, model_df=0, demean=True, batch_size=10_000):
+    """Ljung-Box statistics and p-values for many series.
+
+    Parameters
+    ----------
+    x : array_like, shape (nseries, nobs)
+    lags : int or sequence of int
+        An integer h tests lags 1, ..., h; a sequence tests each of the given
+        maximum lags. All must be between 1 and ``nobs - 1``.
+    model_df : int
+        Degrees of freedom used by the model (e.g. p + q for ARMA residuals),
+        subtracted from the number of lags.
+
+    Returns
+    -------
+    lb_stat, lb_pvalue : np.ndarray, shape (nseries, number of lags tested)
+        Same values as the ``lb_stat`` and ``lb_pvalue`` columns of
+        ``statsmodels.stats.diagnostic.acorr_ljungbox``.
+    """
+    x = _as_2d(x)
+    nobs = x.shape[1]
+    requested = lags
+    lags = np.arange(1, lags + 1) if np.isscalar(lags) else np.asarray(lags)
+    if lags.size == 0 or lags.min() < 1 or lags.max() > nobs - 1:
+        raise ValueError(f"lags must be between 1 and nobs - 1 = {nobs - 1}, got {requested!r}")
+    max_lag = int(lags.max())
+
+    r = acf(x, nlags=max_lag, demean=demean, batch_size=batch_size)[:, 1:]
+    k = np.arange(1, max_lag + 1)
+    cumulative = np.cumsum(r**2 / (nobs - k), axis=1)
+    lb_stat = nobs * (nobs + 2) * cumulative[:, lags - 1]
+
+    df = lags - model_df
+    lb_pvalue = np.full(lb_stat.shape, np.nan)
+    valid = df > 0
+    lb_pvalue[:, valid] = stats.chi2.sf(lb_stat[:, valid], df[valid])
+
+    return lb_stat, lb_pvalue
@@ -0,0 +1,261 @@
+"""Closed-form AR(p) estimates for many series at once.
+
+Like :mod:`ts2025.acf`, the functions take a 2-D array with one series per
+row (a 1-D array is treated as a single series). None of the estimators
+iterates, so thousands of series are fitted in the time of a few statsmodels
+calls:
+
+* ``method="ols"`` regresses ``y_t`` on its lags (and a constant), the
+  estimate of ``AutoReg(x_i, lags=p, trend=trend).fit()``. The lagged values
+  are a strided view of the series (:func:`lag_matrix`), the normal equations
+  of all series are solved with one batched ``np.linalg.solve``.
+* ``method="yule_walker"`` solves the Yule-Walker equations with the sample
+  autocovariances, the estimate of
+  ``statsmodels.regression.linear_model.yule_walker(x_i, p, method="mle")``.
+* ``method="burg"`` is Burg's algorithm, the estimate of
+  ``statsmodels.regression.linear_model.burg(x_i, p)``.
+
+:func:`select_ar_order` compares the information criteria of the orders
+``0, ..., max_p`` and serves as a cheap prefilter before the exact maximum
+likelihood fits of :mod:`ts2025.batch_arma`:
+
+>>> from ts2025.autoregression import select_ar_order
+>>> from ts2025.batch_arma import fit_arma
+>>> orders = select_ar_order(paths, max_p=6, ic="bic").idxmin(axis=1)
+>>> fits = {p: fit_arma(paths[rows], order=(p, 0, 0)) for p, rows in orders.groupby(orders).groups.items()}
+
+The Dickey-Fuller regression ``rw1_diff ~ 0 + rw1_l1`` of the unit root
+chapter is an AR(1) regression without constant, its coefficient is
+``fit_ar(rw1, 1, trend="n").params["y.L1"] - 1``.
+"""
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import stats
+
+from ts2025.acf import acf, pacf_from_acf
+
+METHODS = ("ols", "yule_walker", "burg")
+
+
+def _as_2d(x):
+    x = np.asarray(x, dtype=float)
+    return x[np.newaxis, :] if x.ndim == 1 else x
+
+
+def param_names(p, trend="c"):
+    return (["const"] if trend == "c" else []) + [f"y.L{i}" for i in range(1, p + 1)]
+
+
+def lag_matrix(x, p):
+    """The targets and lagged values of the AR(p) regressions, without copies.
+
+    Returns ``(y, lags)``: ``y`` of shape ``(nseries, nobs - p)`` holds
+    ``x_t`` for ``t = p, ..., nobs - 1`` and ``lags`` of shape ``(nseries,
+    nobs - p, p)`` holds ``x_{t-1}, ..., x_{t-p}``. Both are views of ``x``.
+    """
+    x = _as_2d(x)
+    windows = sliding_window_view(x, p + 1, axis=1)
+    # Read each window backwards, without the target: x_{t-1}, ..., x_{t-p}
+    lags = windows[:, :, ::-1][:, :, 1:]
+    return windows[:, :, p], lags
+
+
+def _normal_equations(x, p, trend, hold_back):
+    """``X'X``, ``X'y`` and ``y`` of the AR(p) regressions after ``hold_back``.
+
+    The constant is the first regressor, so the equations of a lower order on
+    the same observations are the leading blocks.
+    """
+    y, lags = lag_matrix(x[:, hold_back - p:], p)
+    nseries, nobs = y.shape
+    k = p + (trend == "c")
+
+    gram = np.empty((nseries, k, k))
+    moment = np.empty((nseries, k))
+    gram[:, k - p:, k - p:] = np.einsum("ntj,ntk->njk", lags, lags)
+    moment[:, k - p:] = np.einsum("ntj,nt->nj", lags, y)
+    if trend == "c":
+        gram[:, 0, 0] = nobs
+        gram[:, 0, 1:] = gram[:, 1:, 0] = lags.sum(axis=1)
+        moment[:, 0] = y.sum(axis=1)
+    return gram, moment, y, lags
+
+
+def _ols(x, p, trend):
+    """Conditional least squares, the estimates of ``AutoReg``."""
+    gram, moment, y, lags = _normal_equations(x, p, trend, hold_back=p)
+    nseries, nobs = y.shape
+    k = gram.shape[1]
+    if k == 0:
+        return np.empty((nseries, 0)), np.empty((nseries, 0)), (y**2).mean(axis=1), nobs
+
+    params = np.linalg.solve(gram, moment[:, :, np.newaxis])[:, :, 0]
+    resid = y - np.einsum("ntj,nj->nt", lags, params[:, k - p:])
+    if trend == "c":
+        resid -= params[:, :1]
+    sigma2 = (resid**2).mean(axis=1)
+    bse = np.sqrt(sigma2[:, np.newaxis] * np.diagonal(np.linalg.inv(gram), axis1=1, axis2=2))
+    return params, bse, sigma2, nobs
+
+
+def _burg(x, p):
+    """Burg estimates of all orders up to ``p``.
+
+    Returns the AR(p) coefficients and the innovation variances of the orders
+    ``0, ..., p``, as in ``statsmodels.tsa.stattools.pacf_burg``.
+    """
+    nseries, nobs = x.shape
+    forward, backward = x[:, 1:], x[:, :-1]
+    phi = np.zeros((nseries, p))
+    sigma2 = np.empty((nseries, p + 1))
+    sigma2[:, 0] = (x**2).mean(axis=1)
+    for m in range(1, p + 1):
+        power = (forward**2).sum(axis=1) + (backward**2).sum(axis=1)
+        reflection = 2 * (forward * backward).sum(axis=1) / power
+        sigma2[:, m] = (1 - reflection**2) * power / (2 * (nobs - m))
+        # Durbin-Levinson update of the coefficients
+        phi[:, :m - 1] = phi[:, :m - 1] - reflection[:, np.newaxis] * phi[:, :m - 1][:, ::-1]
+        phi[:, m - 1] = reflection
+        # Prediction errors of order m, aligned for the next step
+        forward, backward = (forward - reflection[:, np.newaxis] * backward,
+                             backward - reflection[:, np.newaxis] * forward)
+        forward, backward = forward[:, 1:], backward[:, :-1]
+    return phi, sigma2
+
+
+def _yule_walker(x, p):
+    """Yule-Walker estimates from the sample autocovariances."""
+    c0 = (x**2).mean(axis=1)
+    r = acf(x, nlags=p, demean=False)
+    lags = np.abs(np.subtract.outer(np.arange(p), np.arange(p)))
+    phi = np.linalg.solve(r[:, lags], r[:, 1:, np.newaxis])[:, :, 0]
+    sigma2 = c0 * (1 - np.einsum("nj,nj->n", phi, r[:, 1:]))
+    return phi, sigma2
+
+
+class ARResults:
+    """Estimates of :func:`fit_ar`, one row per series.
+
+    ``params`` (and ``bse``, for ``method="ols"``) are data frames with the
+    parameter names of ``AutoReg`` as columns; ``sigma2``, ``llf``, ``aic``
+    and ``bic`` are series. The log-likelihood is the conditional Gaussian
+    one of ``AutoReg``, ``-nobs / 2 * (log(2 pi sigma2) + 1)``.
+    """
+
+    def __init__(self, params, bse, sigma2, nobs):
+        nparams = params.shape[1] + 1
+        self.params = params
+        self.bse = bse
+        self.sigma2 = sigma2
+        self.nobs = nobs
+        self.llf = -0.5 * nobs * (np.log(2 * np.pi * sigma2) + 1)
+        self.aic = -2 * self.llf + 2 * nparams
+        self.bic = -2 * self.llf + np.log(nobs) * nparams
+
+    @property
+    def tvalues(self):
+        return self.params / self.bse
+
+    @property
+    def pvalues(self):
+        return 2 * stats.norm.sf(np.abs(self.tvalues))
+
+    def table(self, i=0):
+        """Coefficient table of series ``i``."""
+        return pd.DataFrame({
+            "coef": self.params.iloc[i],
+            "std err": self.bse.iloc[i],
+            "z": self.tvalues.iloc[i],
+            "P>|z|": pd.Series(self.pvalues[i], index=self.params.columns),
+        })
+
+
+def fit_ar(x, p, method="ols", trend="c"):
+    """Fit an AR(p) model to every row of ``x`` without iterating.
+
+    ``trend`` is ``"c"`` (intercept) or ``"n"``. For ``"yule_walker"`` and
+    ``"burg"`` the series are demeaned and ``const`` is the implied intercept
+    ``mean * (1 - phi_1 - ... - phi_p)``; with ``trend="n"`` they are not
+    demeaned. The standard errors are those of ``AutoReg`` for ``"ols"`` and
+    missing for the other methods.
+
+    Returns an :class:`ARResults`.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    if trend not in ("c", "n"):
+        raise ValueError(f"trend must be 'c' or 'n', got {trend!r}")
+    x = _as_2d(x)
+    nseries, nobs = x.shape
+    names = param_names(p, trend)
+
+    if method == "ols":
+        params, bse, sigma2, nobs = _ols(x, p, trend)
+    else:
+        mean = x.mean(axis=1) if trend == "c" else np.zeros(nseries)
+        centered = x - mean[:, np.newaxis]
+        if method == "burg":
+            phi, sigma2 = _burg(centered, p)
+            sigma2 = sigma2[:, -1]
+        else:
+            phi, sigma2 = _yule_walker(centered, p)
+        const = [(mean * (1 - phi.sum(axis=1)))[:, np.newaxis]] if trend == "c" else []
+        params = np.hstack(const + [phi])
+        bse = np.full(params.shape, np.nan)
+
+    return ARResults(
+        params=pd.DataFrame(params, columns=names),
+        bse=pd.DataFrame(bse, columns=names),
+        sigma2=pd.Series(sigma2, name="sigma2"),
+        nobs=nobs,
+    )
+
+
+def select_ar_order(x, max_p, ic="bic", method="ols", trend="c"):
+    """Information criteria of the AR orders ``0, ..., max_p`` for every series.
+
+    With ``method="ols"`` every order is fitted on the same observations (the
+    first ``max_p`` are held back), so the criteria are comparable as in
+    ``statsmodels.tsa.ar_model.ar_select_order``; the normal equations are
+    formed once for ``max_p`` and each order solves a leading block. With
+    ``"yule_walker"`` and ``"burg"`` the innovation variances of all orders
+    come out of one Durbin-Levinson or Burg recursion, the cheapest screen.
+
+    Returns a data frame with one row per series and one column per order;
+    ``.idxmin(axis=1)`` gives the selected orders.
+    """
+    if ic not in ("aic", "bic"):
+        raise ValueError(f"ic must be 'aic' or 'bic', got {ic!r}")
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    x = _as_2d(x)
+    nseries, nobs = x.shape
+    orders = np.arange(max_p + 1)
+
+    if method == "ols":
+        gram, moment, y, _ = _normal_equations(x, max_p, trend, hold_back=max_p)
+        nobs = y.shape[1]
+        ssr = np.empty((nseries, max_p + 1))
+        for p in orders:
+            k = p + (trend == "c")
+            explained = 0.0
+            if k:
+                params = np.linalg.solve(gram[:, :k, :k], moment[:, :k, np.newaxis])[:, :, 0]
+                explained = np.einsum("nj,nj->n", params, moment[:, :k])
+            ssr[:, p] = (y**2).sum(axis=1) - explained
+        sigma2 = ssr / nobs
+    else:
+        centered = x - x.mean(axis=1, keepdims=True) if trend == "c" else x
+        if method == "burg":
+            _, sigma2 = _burg(centered, max_p)
+        else:
+            r = acf(centered, nlags=max_p, demean=False)
+            partial = pacf_from_acf(r)[:, 1:]
+            sigma2 = (centered**2).mean(axis=1, keepdims=True) * np.cumprod(
+                np.hstack([np.ones((nseries, 1)), 1 - partial**2]), axis=1)
+
+    nparams = orders + (trend == "c") + 1
+    penalty = 2 * nparams if ic == "aic" else np.log(nobs) * nparams
+    criteria = nobs * (np.log(2 * np.pi * sigma2) + 1) + penalty
+    return pd.DataFrame(criteria, columns=pd.Index(orders, name="p"))
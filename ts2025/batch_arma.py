@@ -0,0 +1,372 @@
+"""Exact maximum likelihood ARMA(p, q) fits for many series at once.
+
+``statsmodels.tsa.arima.model.ARIMA`` builds and optimizes a state space
+model per series. Here the Gaussian log-likelihood of a whole ``(nseries,
+nobs)`` array is evaluated by one Kalman filter that runs over time and is
+vectorized over the series, and all series are optimized together: every
+Newton step updates the stacked parameters of all series, with the gradient
+and Hessian of each series obtained from a few batched likelihood
+evaluations (the likelihood of one series does not depend on the parameters
+of another).
+
+The model and the parameter names are those of ``ARIMA(y, order=(p, 0, q),
+trend="c")``: ``const`` is the mean of the series, ``ar.L1, ...`` and
+``ma.L1, ...`` the lag coefficients and ``sigma2`` the innovation variance.
+The standard errors are computed like the default ``cov_type="opg"`` of
+statsmodels, from numerical scores of the log-likelihood contributions:
+
+>>> from ts2025.batch_arma import fit_arma
+>>> res = fit_arma(paths, order=(1, 0, 0))
+>>> res.params.iloc[0]   # compare with model_ar1_fit.params
+>>> res.table(0)         # coef, std err, z and p-values of the first series
+"""
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from ts2025.acf import acf, pacf_from_acf
+
+# Partial autocorrelations are kept this far from +-1, where the AR part has
+# a unit root and the stationary initialization does not exist
+MAX_PARTIAL = 1 - 1e-6
+
+# Largest Newton step in the unconstrained parameters
+MAX_STEP = 5.0
+
+
+def _as_2d(x):
+    x = np.asarray(x, dtype=float)
+    return x[np.newaxis, :] if x.ndim == 1 else x
+
+
+def param_names(p, q, trend="c"):
+    names = ["const"] if trend == "c" else []
+    names += [f"ar.L{i}" for i in range(1, p + 1)]
+    names += [f"ma.L{i}" for i in range(1, q + 1)]
+    return names + ["sigma2"]
+
+
+def _from_partial(r):
+    """Coefficients of a stationary AR polynomial from partial autocorrelations.
+
+    ``r`` has shape ``(nseries, p)`` with entries in (-1, 1). Returns ``phi``
+    with ``1 - phi_1 L - ... - phi_p L^p`` having all roots outside the unit
+    circle (Durbin-Levinson recursion, vectorized over the series).
+    """
+    phi = np.zeros_like(r)
+    for k in range(r.shape[1]):
+        previous = phi[:, :k].copy()
+        phi[:, :k] = previous - r[:, k:k + 1] * previous[:, ::-1]
+        phi[:, k] = r[:, k]
+    return phi
+
+
+def _constrain(x, p, q, trend):
+    """Map unconstrained values to (mean, stationary AR, invertible MA)."""
+    k = 1 if trend == "c" else 0
+    mean = x[:, 0] if k else np.zeros(x.shape[0])
+    squash = lambda u: np.clip(u / np.sqrt(1 + u**2), -MAX_PARTIAL, MAX_PARTIAL)  # noqa: E731
+    ar = _from_partial(squash(x[:, k:k + p]))
+    ma = -_from_partial(squash(x[:, k + p:k + p + q]))
+    return mean, ar, ma
+
+
+def _kalman(y, mean, ar, ma):
+    """Prediction errors ``v`` and their variances ``F`` for sigma2 = 1.
+
+    State space form of statsmodels/Harvey: the state has dimension
+    ``r = max(p, q + 1)``, the transition matrix is the companion matrix of
+    the AR coefficients and the state is initialized with its stationary
+    distribution. All arrays carry the series on the first axis.
+    """
+    nseries, nobs = y.shape
+    p, q = ar.shape[1], ma.shape[1]
+    r = max(p, q + 1)
+
+    transition = np.zeros((nseries, r, r))
+    transition[:, :p, 0] = ar
+    transition[:, np.arange(r - 1), np.arange(1, r)] = 1.0
+    selection = np.zeros((nseries, r))
+    selection[:, 0] = 1.0
+    selection[:, 1:q + 1] = ma
+    rr = selection[:, :, None] * selection[:, None, :]
+
+    # Stationary covariance: vec(P) = (I - T kron T)^-1 vec(R R')
+    kron = np.einsum("nij,nkl->nikjl", transition, transition).reshape(nseries, r * r, r * r)
+    cov = np.linalg.solve(np.eye(r * r) - kron, rr.reshape(nseries, r * r, 1)).reshape(nseries, r, r)
+
+    transition_t = transition.transpose(0, 2, 1)
+    state = np.zeros((nseries, r))
+    z = y - mean[:, None]
+    v = np.empty((nseries, nobs))
+    f = np.empty((nseries, nobs))
+    for t in range(nobs):
+        f[:, t] = cov[:, 0, 0]
+        v[:, t] = z[:, t] - state[:, 0]
+        # T P Z', the Kalman gain times F
+        tpz = np.einsum("nij,nj->ni", transition, cov[:, :, 0])
+        state = np.einsum("nij,nj->ni", transition, state) + tpz * (v[:, t] / f[:, t])[:, None]
+        cov = (transition @ cov @ transition_t
+               - tpz[:, :, None] * tpz[:, None, :] / f[:, t, None, None] + rr)
+
+    return v, f
+
+
+def _concentrated_llf(y, x, p, q, trend):
+    """Log-likelihood with sigma2 profiled out, and the sigma2 estimate."""
+    v, f = _kalman(y, *_constrain(x, p, q, trend))
+    nobs = y.shape[1]
+    sigma2 = (v**2 / f).mean(axis=1)
+    llf = -0.5 * nobs * (np.log(2 * np.pi) + 1 + np.log(sigma2)) - 0.5 * np.log(f).sum(axis=1)
+    return llf, sigma2
+
+
+def _safe_concentrated_llf(y, x, p, q, trend):
+    """:func:`_concentrated_llf`, with ``nan`` for series whose filter fails.
+
+    A singular stationary covariance of one series would abort the whole
+    batch, so on failure the series are evaluated one by one.
+    """
+    try:
+        return _concentrated_llf(y, x, p, q, trend)
+    except np.linalg.LinAlgError:
+        pass
+    llf = np.full(y.shape[0], np.nan)
+    sigma2 = np.full(y.shape[0], np.nan)
+    for i in range(y.shape[0]):
+        try:
+            (llf[i],), (sigma2[i],) = _concentrated_llf(y[i:i + 1], x[i:i + 1], p, q, trend)
+        except np.linalg.LinAlgError:
+            pass
+    return llf, sigma2
+
+
+def _llf_obs(y, params, p, q, trend):
+    """Log-likelihood contributions ``(nseries, nobs)`` at constrained parameters."""
+    k = 1 if trend == "c" else 0
+    mean = params[:, 0] if k else np.zeros(params.shape[0])
+    ar, ma, sigma2 = params[:, k:k + p], params[:, k + p:k + p + q], params[:, -1]
+    v, f = _kalman(y, mean, ar, ma)
+    return -0.5 * (np.log(2 * np.pi * sigma2[:, None] * f) + v**2 / (sigma2[:, None] * f))
+
+
+def _cov_opg(y, params, p, q, trend, step):
+    """Inverse of the outer product of the per-observation scores."""
+    h = step * np.maximum(1.0, np.abs(params))
+    scores = np.empty(y.shape + (params.shape[1],))
+    for j in range(params.shape[1]):
+        plus, minus = params.copy(), params.copy()
+        plus[:, j] += h[:, j]
+        minus[:, j] -= h[:, j]
+        scores[:, :, j] = (_llf_obs(y, plus, p, q, trend) - _llf_obs(y, minus, p, q, trend)) / (2 * h[:, j, None])
+    return np.einsum("nti,ntj->nij", scores, scores)
+
+
+def _cov_approx(y, params, p, q, trend, step):
+    """Minus the Hessian of the log-likelihood."""
+    _, _, hess = _derivatives(lambda u: _llf_obs(y, u, p, q, trend).sum(axis=1), params, step)
+    return -hess
+
+
+def _derivatives(func, x, step):
+    """Gradient and Hessian of every row of ``func`` by central differences.
+
+    ``func`` maps an ``(nseries, k)`` array to ``nseries`` values and row ``i``
+    only depends on ``x[i]``, so each derivative needs one batched call.
+    """
+    nseries, k = x.shape
+    h = step * np.maximum(1.0, np.abs(x))
+    center = func(x)
+    grad = np.empty((nseries, k))
+    hess = np.empty((nseries, k, k))
+
+    def shifted(*moves):
+        xs = x.copy()
+        for j, sign in moves:
+            xs[:, j] += sign * h[:, j]
+        return func(xs)
+
+    for j in range(k):
+        plus, minus = shifted((j, 1)), shifted((j, -1))
+        grad[:, j] = (plus - minus) / (2 * h[:, j])
+        hess[:, j, j] = (plus - 2 * center + minus) / h[:, j] ** 2
+        for i in range(j):
+            value = (shifted((i, 1), (j, 1)) - shifted((i, 1), (j, -1))
+                     - shifted((i, -1), (j, 1)) + shifted((i, -1), (j, -1))) / (4 * h[:, i] * h[:, j])
+            hess[:, i, j] = hess[:, j, i] = value
+
+    return center, grad, hess
+
+
+def _start_values(y, p, q, trend):
+    mean = y.mean(axis=1) if trend == "c" else np.zeros(y.shape[0])
+    # Yule-Walker AR coefficients through the partial autocorrelations
+    partial = pacf_from_acf(acf(y, nlags=p))[:, 1:] if p else np.zeros((y.shape[0], 0))
+    partial = np.clip(partial, -0.95, 0.95)
+    stretch = partial / np.sqrt(1 - partial**2)
+    parts = [mean[:, None]] if trend == "c" else []
+    return np.hstack(parts + [stretch, np.zeros((y.shape[0], q))])
+
+
+class BatchARMAResults:
+    """Estimates of :func:`fit_arma`, one row per series.
+
+    ``params`` and ``bse`` are data frames with the parameter names of
+    statsmodels as columns, ``llf``, ``aic``, ``bic``, ``converged`` and
+    ``iterations`` are series.
+    """
+
+    def __init__(self, params, bse, llf, nobs, converged, iterations):
+        nparams = params.shape[1]
+        self.params = params
+        self.bse = bse
+        self.llf = llf
+        self.nobs = nobs
+        self.aic = -2 * llf + 2 * nparams
+        self.bic = -2 * llf + np.log(nobs) * nparams
+        self.converged = converged
+        self.iterations = iterations
+
+    @property
+    def tvalues(self):
+        return self.params / self.bse
+
+    @property
+    def pvalues(self):
+        return 2 * stats.norm.sf(np.abs(self.tvalues))
+
+    def table(self, i=0):
+        """Coefficient table of series ``i``, as in the statsmodels summary."""
+        return pd.DataFrame({
+            "coef": self.params.iloc[i],
+            "std err": self.bse.iloc[i],
+            "z": self.tvalues.iloc[i],
+            "P>|z|": pd.Series(self.pvalues[i], index=self.params.columns),
+        })
+
+
+def fit_arma(y, order=(1, 0, 0), trend="c", cov_type="opg", maxiter=50, tol=1e-8, step=1e-4):
+    """Fit ``ARIMA(y_i, order=order, trend=trend)`` to every row of ``y``.
+
+    ``y`` has shape ``(nseries, nobs)`` (a 1-D array is a single series) and
+    ``order`` is ``(p, 0, q)``; difference the series beforehand for
+    integrated models. The optimization runs in the unconstrained
+    parameterization of statsmodels (partial autocorrelations), so the AR part
+    is stationary and the MA part invertible. ``sigma2`` is profiled out and
+    every series takes damped Newton steps until both its log-likelihood
+    change and the increase predicted by the Newton step are less than
+    ``tol`` (relative). A series that finds no step that does not
+    decrease its log-likelihood (or whose filter fails) stops there and is
+    reported as not converged, like ``mle_retvals["converged"]``.
+
+    ``cov_type`` is ``"opg"`` (outer product of the scores, the default of
+    statsmodels' ``fit``) or ``"approx"`` (numerical Hessian).
+
+    Returns a :class:`BatchARMAResults`.
+    """
+    p, d, q = order
+    if cov_type not in ("opg", "approx"):
+        raise ValueError(f"cov_type must be 'opg' or 'approx', got {cov_type!r}")
+    if d != 0:
+        raise ValueError("only d = 0 is supported, difference the series first")
+    if trend not in ("c", "n"):
+        raise ValueError(f"trend must be 'c' or 'n', got {trend!r}")
+
+    y = _as_2d(y)
+    nseries, nobs = y.shape
+    x = _start_values(y, p, q, trend)
+    k = x.shape[1]
+    llf, _ = _safe_concentrated_llf(y, x, p, q, trend)
+    # Where the filter fails at the start values, start from white noise
+    failed = ~np.isfinite(llf)
+    if failed.any():
+        x[failed, int(trend == "c"):] = 0.0
+        llf[failed], _ = _safe_concentrated_llf(y[failed], x[failed], p, q, trend)
+    active = np.ones(nseries, dtype=bool)
+    converged = np.zeros(nseries, dtype=bool)
+    iterations = np.zeros(nseries, dtype=int)
+
+    for _ in range(maxiter):
+        idx = np.flatnonzero(active)
+        if idx.size == 0 or k == 0:
+            break
+        ys, xs = y[idx], x[idx]
+        _, grad, hess = _derivatives(lambda u: _safe_concentrated_llf(ys, u, p, q, trend)[0], xs, step)
+        finite = np.isfinite(grad).all(axis=1) & np.isfinite(hess).all(axis=(1, 2))
+        grad[~finite], hess[~finite] = 0.0, -np.eye(k)
+
+        # Newton direction with the Hessian forced to be negative definite
+        values, vectors = np.linalg.eigh(hess)
+        values = np.minimum(values, -1e-6 * np.maximum(1.0, np.abs(values).max(axis=1, keepdims=True)))
+        direction = -np.einsum("nij,nj,nkj,nk->ni", vectors, 1 / values, vectors, grad)
+        # Increase of the quadratic model at its maximum: small only near a
+        # stationary point, not after a tiny step on a steep slope
+        gain = 0.5 * np.einsum("ni,ni->n", grad, direction)
+        # Far from the optimum the quadratic model can send a step towards
+        # the boundary of the parameter space, keep it within MAX_STEP
+        norm = np.linalg.norm(direction, axis=1, keepdims=True)
+        direction *= np.minimum(1.0, MAX_STEP / np.maximum(norm, 1e-300))
+
+        # Halve the step of every series until its likelihood does not decrease
+        accepted = np.zeros(idx.size, dtype=bool)
+        new_llf = llf[idx].copy()
+        new_x = xs.copy()
+        scale = 1.0
+        for _ in range(30):
+            todo = np.flatnonzero(~accepted)
+            if todo.size == 0:
+                break
+            trial = xs[todo] + scale * direction[todo]
+            trial_llf, _ = _safe_concentrated_llf(ys[todo], trial, p, q, trend)
+            current = llf[idx][todo]
+            better = np.isfinite(trial_llf) & ((trial_llf >= current) | ~np.isfinite(current))
+            new_x[todo[better]] = trial[better]
+            new_llf[todo[better]] = trial_llf[better]
+            accepted[todo[better]] = True
+            scale /= 2
+
+        change = np.abs(new_llf - llf[idx])
+        x[idx], llf[idx] = new_x, new_llf
+        iterations[idx] += 1
+        small = tol * (1 + np.abs(new_llf))
+        converged[idx] = accepted & finite & (change <= small) & (gain <= small)
+        # Series without an acceptable step stop without converging
+        active[idx[converged[idx] | ~accepted | ~finite]] = False
+
+    mean, ar, ma = _constrain(x, p, q, trend)
+    if k == 0:
+        converged[:] = True
+    llf, sigma2 = _safe_concentrated_llf(y, x, p, q, trend)
+    columns = ([mean[:, None]] if trend == "c" else []) + [ar, ma, sigma2[:, None]]
+    params = np.hstack(columns)
+
+    # Standard errors from the information matrix in the constrained parameters
+    information_matrix = {"opg": _cov_opg, "approx": _cov_approx}[cov_type]
+    try:
+        information = information_matrix(y, params, p, q, trend, step)
+    except np.linalg.LinAlgError:
+        # A series at the boundary of the parameter space, the others still
+        # get their standard errors
+        information = np.full((nseries,) + params.shape[1:] * 2, np.nan)
+        for i in range(nseries):
+            try:
+                information[i] = information_matrix(y[i:i + 1], params[i:i + 1], p, q, trend, step)[0]
+            except np.linalg.LinAlgError:
+                pass
+    bse = np.full(params.shape, np.nan)
+    for i in range(nseries):
+        try:
+            diagonal = np.diag(np.linalg.inv(information[i]))
+        except (np.linalg.LinAlgError, ValueError):
+            continue
+        bse[i] = np.sqrt(np.where(diagonal > 0, diagonal, np.nan))
+
+    names = param_names(p, q, trend)
+    return BatchARMAResults(
+        params=pd.DataFrame(params, columns=names),
+        bse=pd.DataFrame(bse, columns=names),
+        llf=pd.Series(llf, name="llf"),
+        nobs=nobs,
+        converged=pd.Series(converged, name="converged"),
+        iterations=pd.Series(iterations, name="iterations"),
+    )
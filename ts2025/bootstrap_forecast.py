@@ -0,0 +1,242 @@
+"""Residual bootstrap prediction intervals for fitted ARIMA models.
+
+``get_forecast(steps).summary_frame()`` gives Gaussian intervals. For skewed
+or fat-tailed series the intervals here resample the residuals of the fit
+instead:
+
+>>> from ts2025.bootstrap_forecast import bootstrap_summary_frame
+>>> results_ar1 = ARIMA(ar1, order=(1, 0, 0)).fit()
+>>> bootstrap_summary_frame(results_ar1, steps=3, nboot=10_000, seed=42)
+
+The result has the ``mean``, ``mean_ci_lower`` and ``mean_ci_upper`` columns
+of ``summary_frame``, so it can replace it in the plots of the forecasting
+chapter.
+
+A future path is the point forecast plus the innovations of the coming steps
+passed through the MA(infinity) weights ``psi`` of the model (including the
+differencing), ``x_{T+k} = mean_k + sum_j psi_j e_{T+k-j}``. With the
+resampled innovations of ``nboot`` paths in a ``(nboot, steps)`` array, all
+paths are one product with the lower triangular Toeplitz matrix of ``psi``.
+The paths are generated in blocks of ``block_size`` and only the order
+statistics next to the requested quantiles are kept (see
+:class:`TailQuantiles`), so the memory does not grow with ``nboot``.
+
+:func:`bootstrap_summary_frames` does the same for many fitted models. The
+series are distributed over a process pool in chunks; every series draws from
+its own child of ``np.random.SeedSequence(seed)``, so the intervals for a
+given seed do not depend on the number of workers. The fitted results stay in
+the calling process, only the residuals and ``psi`` are sent to the workers.
+
+The intervals are conditional on the estimated parameters (parameter
+uncertainty is not resampled).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import toeplitz
+from scipy.signal import lfilter
+
+
+class TailQuantiles:
+    """Exact quantiles of a stream of blocks of rows.
+
+    For ``total`` rows in all, the quantiles (with the linear interpolation of
+    ``np.quantile``) only depend on the few order statistics around
+    ``prob * (total - 1)``. Every block is merged into the smallest and the
+    largest rows seen so far with ``np.partition``, a partial sort, so the
+    memory is proportional to ``min(prob, 1 - prob) * total``.
+    """
+
+    def __init__(self, probs, total, ncols):
+        self.probs = np.asarray(probs, dtype=float)
+        self.total = total
+        positions = np.floor(self.probs * (total - 1)).astype(int)
+        lower = self.probs <= 0.5
+        # Order statistics floor(position) and the one above it
+        self.nsmall = min(total, positions[lower].max() + 2) if lower.any() else 0
+        self.nlarge = min(total, total - positions[~lower].min()) if (~lower).any() else 0
+        self.small = np.empty((0, ncols))
+        self.large = np.empty((0, ncols))
+        self.count = 0
+
+    def update(self, values):
+        """Add a ``(n, ncols)`` block of rows."""
+        values = np.asarray(values, dtype=float)
+        self.count += values.shape[0]
+        if self.nsmall:
+            small = np.vstack([self.small, values])
+            if small.shape[0] > self.nsmall:
+                small = np.partition(small, self.nsmall - 1, axis=0)[:self.nsmall]
+            self.small = small
+        if self.nlarge:
+            large = np.vstack([self.large, values])
+            if large.shape[0] > self.nlarge:
+                large = np.partition(large, large.shape[0] - self.nlarge, axis=0)[-self.nlarge:]
+            self.large = large
+
+    def quantiles(self):
+        """The quantiles, an array of shape ``(len(probs), ncols)``."""
+        if self.count != self.total:
+            raise ValueError(f"expected {self.total} rows, got {self.count}")
+        small = np.sort(self.small, axis=0)
+        large = np.sort(self.large, axis=0)
+
+        def order_statistic(i, lower):
+            return small[i] if lower else large[i - (self.total - self.nlarge)]
+
+        result = np.empty((self.probs.size, small.shape[1] if self.nsmall else large.shape[1]))
+        for k, prob in enumerate(self.probs):
+            position = prob * (self.total - 1)
+            below = int(np.floor(position))
+            above = min(below + 1, self.total - 1)
+            lower = prob <= 0.5
+            fraction = position - below
+            result[k] = ((1 - fraction) * order_statistic(below, lower)
+                         + fraction * order_statistic(above, lower))
+        return result
+
+
+def psi_weights(results, steps):
+    """The first ``steps`` MA(infinity) weights of a fitted (S)ARIMA model.
+
+    The reduced polynomials are the products of the regular and the seasonal
+    lag polynomials; the AR polynomial is also multiplied by the regular and
+    seasonal differences, so the weights apply to the levels of the series.
+    """
+    model = results.model
+    ar = np.asarray(results.polynomial_reduced_ar, dtype=float)
+    for _ in range(model.order[1]):
+        ar = np.convolve(ar, [1.0, -1.0])
+    _, seasonal_diff, _, period = model.seasonal_order
+    for _ in range(seasonal_diff):
+        ar = np.convolve(ar, np.r_[1.0, np.zeros(period - 1), -1.0])
+    impulse = np.zeros(steps)
+    impulse[0] = 1.0
+    return lfilter(np.asarray(results.polynomial_reduced_ma, dtype=float), ar, impulse)
+
+
+def bootstrap_residuals(results):
+    """Centered residuals of a fit, scaled to the innovation variance.
+
+    The one-step prediction errors of the Kalman filter have a larger
+    variance than the innovations at the start of the sample; the
+    standardized errors times ``sqrt(sigma2)`` do not. The observations of the
+    diffuse initialization (the first ``d`` for a differenced model) are
+    dropped.
+    """
+    burn = results.loglikelihood_burn
+    errors = results.filter_results.standardized_forecasts_error[0, burn:]
+    errors = errors[np.isfinite(errors)] * np.sqrt(_sigma2(results))
+    return errors - errors.mean()
+
+
+def _sigma2(results):
+    # params is an array when the model was fitted on an array
+    return np.asarray(results.params)[results.model.param_names.index("sigma2")]
+
+
+def _check(results):
+    if getattr(results.model, "k_exog", 0):
+        raise ValueError("models with exogenous regressors are not supported")
+    if "sigma2" not in results.model.param_names:
+        raise ValueError("the model has no sigma2 parameter (concentrated scale)")
+
+
+def _bootstrap_paths(resid, psi, nboot, probs, block_size, seed):
+    """Quantiles of the bootstrap deviations from the point forecast."""
+    rng = np.random.default_rng(seed)
+    steps = psi.size
+    # paths[b, k] = sum_j psi[k - j] e[b, j]
+    loading = toeplitz(psi, np.zeros(steps)).T
+    quantiles = TailQuantiles(probs, nboot, steps)
+    for start in range(0, nboot, block_size):
+        n = min(block_size, nboot - start)
+        e = resid[rng.integers(resid.size, size=(n, steps))]
+        quantiles.update(e @ loading)
+    return quantiles.quantiles()
+
+
+def _bootstrap_chunk(specs, nboot, probs, block_size):
+    return [_bootstrap_paths(resid, psi, nboot, probs, block_size, seed) for resid, psi, seed in specs]
+
+
+def _summary_frame(results, steps, deviations):
+    forecast = results.get_forecast(steps)
+    mean = np.asarray(forecast.predicted_mean)
+    return pd.DataFrame({
+        "mean": mean,
+        "mean_ci_lower": mean + deviations[0],
+        "mean_ci_upper": mean + deviations[1],
+    }, index=forecast.row_labels)
+
+
+def bootstrap_summary_frame(results, steps=1, nboot=10_000, alpha=0.05, block_size=10_000, seed=None):
+    """Bootstrap prediction intervals of one fitted ARIMA model.
+
+    Parameters
+    ----------
+    results : ARIMAResults
+        ``ARIMA(...).fit()`` (also SARIMAX results without regressors).
+    steps : int
+        Forecast horizon.
+    nboot : int
+        Number of simulated paths.
+    alpha : float
+        The intervals cover ``1 - alpha``, as in ``summary_frame(alpha)``.
+    block_size : int
+        Paths generated at once.
+    seed : int or np.random.SeedSequence, optional
+
+    Returns
+    -------
+    pd.DataFrame
+        The point forecast and the interval bounds, one row per step.
+    """
+    _check(results)
+    deviations = _bootstrap_paths(bootstrap_residuals(results), psi_weights(results, steps), nboot,
+                                  [alpha / 2, 1 - alpha / 2], block_size, seed)
+    return _summary_frame(results, steps, deviations)
+
+
+def bootstrap_summary_frames(results, steps=1, nboot=10_000, alpha=0.05, block_size=10_000,
+                             chunk_size=100, workers=None, seed=None):
+    """Bootstrap prediction intervals of many fitted ARIMA models.
+
+    ``results`` is a dict (or a list) of fitted results. The series are sent to
+    the worker processes in chunks of ``chunk_size``; ``workers`` defaults to
+    the number of CPUs and ``workers=1`` runs in the current process. The
+    other arguments are those of :func:`bootstrap_summary_frame`.
+
+    Returns a data frame indexed by the keys of ``results`` and the forecast
+    index.
+    """
+    if not isinstance(results, dict):
+        results = dict(enumerate(results))
+    keys = list(results)
+    for key in keys:
+        _check(results[key])
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    specs = [(bootstrap_residuals(results[key]), psi_weights(results[key], steps), child)
+             for key, child in zip(keys, seed.spawn(len(keys)))]
+    chunks = [specs[start:start + chunk_size] for start in range(0, len(specs), chunk_size)]
+    probs = [alpha / 2, 1 - alpha / 2]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(chunks))
+
+    if workers <= 1:
+        deviations = [d for chunk in chunks for d in _bootstrap_chunk(chunk, nboot, probs, block_size)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map returns the chunks in submission order
+            blocks = pool.map(_bootstrap_chunk, chunks, [nboot] * len(chunks), [probs] * len(chunks),
+                              [block_size] * len(chunks))
+            deviations = [d for block in blocks for d in block]
+
+    frames = [_summary_frame(results[key], steps, d) for key, d in zip(keys, deviations)]
+    return pd.concat(frames, keys=keys, names=["series", None])
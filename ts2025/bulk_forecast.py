@@ -0,0 +1,126 @@
+"""Forecasting many series at once with statsforecast.
+
+The panel is in long format with the columns ``unique_id``, ``ds`` and ``y``
+(the format used by statsforecast). The forecasts are returned in the layout
+of ``get_forecast(h).summary_frame()`` in statsmodels, with one row per
+series, model and horizon:
+
+    unique_id  ds  model  mean  mean_se  mean_ci_lower  mean_ci_upper
+
+``mean_se`` is recovered from the width of the prediction interval, assuming
+a Gaussian interval as statsmodels does.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+SUMMARY_COLUMNS = ["mean", "mean_se", "mean_ci_lower", "mean_ci_upper"]
+
+
+def default_models(order=(1, 0, 0)):
+    from statsforecast.models import ARIMA, AutoETS
+
+    return [ARIMA(order=order, include_mean=True, alias="ARIMA"), AutoETS(alias="ETS")]
+
+
+def _summary_frame(forecasts, model_names, level):
+    z = stats.norm.ppf(0.5 + level / 200)
+    frames = []
+    for name in model_names:
+        lower = forecasts[f"{name}-lo-{level}"]
+        upper = forecasts[f"{name}-hi-{level}"]
+        frames.append(pd.DataFrame({
+            "unique_id": forecasts["unique_id"],
+            "ds": forecasts["ds"],
+            "model": name,
+            "mean": forecasts[name],
+            "mean_se": (upper - lower) / (2 * z),
+            "mean_ci_lower": lower,
+            "mean_ci_upper": upper,
+        }))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def forecast_panel(panel, h, models=None, level=95, freq=1, n_jobs=-1):
+    """Fit the models to every series of the panel and forecast ``h`` steps.
+
+    Parameters
+    ----------
+    panel : pd.DataFrame
+        Long format with columns ``unique_id``, ``ds`` and ``y``.
+    h : int
+        Forecast horizon.
+    models : list, optional
+        statsforecast model instances. Defaults to an ARIMA(1, 0, 0) with a
+        mean and an automatic ETS model.
+    level : int
+        Coverage of the prediction intervals in percent (95 corresponds to
+        ``summary_frame(alpha=0.05)``).
+    freq : int or str
+        Frequency of ``ds``, 1 for an integer time index.
+    n_jobs : int
+        Processes used by statsforecast, -1 for all CPUs.
+    """
+    from statsforecast import StatsForecast
+
+    if models is None:
+        models = default_models()
+
+    sf = StatsForecast(models=models, freq=freq, n_jobs=n_jobs)
+    forecasts = sf.forecast(df=panel, h=h, level=[level])
+
+    return _summary_frame(forecasts, [str(model) for model in models], level)
+
+
+def _future_ds(ds, h, freq=None):
+    """The ``h`` time stamps after the last one of ``ds``."""
+    if pd.api.types.is_integer_dtype(ds):
+        return ds.iloc[-1] + (1 if freq is None else freq) * np.arange(1, h + 1)
+    if pd.api.types.is_datetime64_any_dtype(ds):
+        if freq is None:
+            freq = pd.infer_freq(ds)
+        if freq is None:
+            raise ValueError("cannot infer the frequency of ds, pass freq")
+        return pd.date_range(ds.iloc[-1], periods=h + 1, freq=freq)[1:]
+    raise ValueError(f"ds must be integers or datetimes, got dtype {ds.dtype}")
+
+
+def forecast_panel_statsmodels(panel, h, order=(1, 0, 0), level=95, freq=None):
+    """The same ARIMA forecasts with a loop over the series in statsmodels.
+
+    This is how the chapters forecast a single series; it is kept as the
+    reference for validating and benchmarking :func:`forecast_panel`.
+    ``freq`` is the step of an integer ``ds`` (default 1) or the pandas
+    frequency of a datetime ``ds`` (inferred from each series by default).
+    """
+    from statsmodels.tsa.arima.model import ARIMA
+
+    frames = []
+    for unique_id, group in panel.groupby("unique_id", sort=False):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            res = ARIMA(group["y"].to_numpy(), order=order, trend="c" if order[1] == 0 else "n").fit()
+
+        summary = res.get_forecast(steps=h).summary_frame(alpha=1 - level / 100)
+        summary = summary.reset_index(drop=True)
+        summary.columns.name = None
+        summary.insert(0, "model", "ARIMA")
+        summary.insert(0, "ds", _future_ds(group["ds"], h, freq))
+        summary.insert(0, "unique_id", unique_id)
+        frames.append(summary)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def to_long_panel(x, start=0):
+    """Long panel from an ``(nseries, nobs)`` array with an integer time index."""
+    x = np.asarray(x, dtype=float)
+    nseries, nobs = x.shape
+    return pd.DataFrame({
+        "unique_id": np.repeat(np.arange(nseries), nobs),
+        "ds": np.tile(np.arange(start, start + nobs), nseries),
+        "y": x.ravel(),
+    })
@@ -0,0 +1,142 @@
+"""Local cache for the datasets the chapters download.
+
+``read_csv`` is a drop-in replacement for ``pd.read_csv`` on a URL:
+
+    from ts2025.data import read_csv
+    px = read_csv("https://github.com/febse/data/raw/refs/heads/main/ts/review/px.csv")
+
+The first call downloads the file, parses it and stores the table in Arrow
+IPC format under ``.cache/data/objects``, named by the SHA-256 of the
+downloaded bytes and of the parsing options. ``.cache/data/index.json`` maps
+each URL to its object. Later calls memory-map the stored table and do not
+touch the network.
+
+Set ``TS2025_OFFLINE=1`` (or pass ``offline=True``) to fail instead of
+downloading when a URL is not cached, and use ``refresh=True`` or
+:func:`invalidate` to fetch a new version.
+"""
+import hashlib
+import json
+import os
+import time
+import urllib.request
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "data"
+
+
+def _offline_default():
+    return os.environ.get("TS2025_OFFLINE", "0") == "1"
+
+
+def _index_path(cache_dir):
+    return Path(cache_dir) / "index.json"
+
+
+def _load_index(cache_dir):
+    path = _index_path(cache_dir)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def _save_index(cache_dir, index):
+    path = _index_path(cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so that a crash never leaves a broken index
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index, indent=2, sort_keys=True))
+    tmp.replace(path)
+
+
+def _key(url, kwargs):
+    return url if not kwargs else f"{url} {json.dumps(kwargs, sort_keys=True, default=str)}"
+
+
+def _download(url, timeout=60):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+
+def read_csv(url, offline=None, refresh=False, cache_dir=CACHE_DIR, **kwargs):
+    """Read a CSV file from ``url`` through the local cache.
+
+    Keyword arguments are passed to ``pd.read_csv`` and are part of the cache
+    key, so the same URL parsed differently is stored separately. They must be
+    JSON-serializable.
+    """
+    if offline is None:
+        offline = _offline_default()
+
+    index = _load_index(cache_dir)
+    key = _key(url, kwargs)
+    entry = index.get(key)
+
+    if entry is not None and not refresh:
+        path = Path(cache_dir) / "objects" / entry["object"]
+        if path.exists():
+            return _read_object(path)
+
+    if offline:
+        raise FileNotFoundError(f"{url} is not in the data cache and offline mode is on")
+
+    content = _download(url)
+    df = pd.read_csv(BytesIO(content), **kwargs)
+
+    digest = hashlib.sha256(content)
+    digest.update(json.dumps(kwargs, sort_keys=True, default=str).encode())
+    name = f"{digest.hexdigest()}.arrow"
+    path = Path(cache_dir) / "objects" / name
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        # Uncompressed so that the file can be memory-mapped
+        feather.write_feather(df, tmp, compression="uncompressed")
+        tmp.replace(path)
+
+    index[key] = {"url": url, "object": name, "bytes": len(content), "fetched": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    _save_index(cache_dir, index)
+
+    return df
+
+
+def _read_object(path):
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+def invalidate(url=None, cache_dir=CACHE_DIR):
+    """Forget ``url`` (all parsings of it), or every URL if ``url`` is None.
+
+    Objects that are no longer referenced by the index are deleted. Returns
+    the number of deleted objects.
+    """
+    index = _load_index(cache_dir)
+    if url is None:
+        index = {}
+    else:
+        index = {key: entry for key, entry in index.items() if entry["url"] != url}
+    _save_index(cache_dir, index)
+
+    referenced = {entry["object"] for entry in index.values()}
+    removed = 0
+    objects = Path(cache_dir) / "objects"
+    if objects.exists():
+        for path in objects.glob("*.arrow"):
+            if path.name not in referenced:
+                path.unlink()
+                removed += 1
+
+    return removed
+
+
+def cached_urls(cache_dir=CACHE_DIR):
+    """The cache index as a ``DataFrame``, one row per cached URL and parsing."""
+    index = _load_index(cache_dir)
+    return pd.DataFrame(list(index.values()), columns=["url", "object", "bytes", "fetched"])
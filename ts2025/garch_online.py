@@ -0,0 +1,179 @@
+"""Streaming volatility updates for a fitted GARCH model.
+
+A GARCH(p, o, q) model with a constant (or zero) mean, as fitted in the GARCH
+chapter with
+
+    fit = arch_model(r, mean='Constant', vol='GARCH', p=1, q=1, dist='t').fit()
+
+is turned into a filter that takes one new return at a time:
+
+    online = OnlineGARCH.from_result(fit, refit_every=250)
+    for r_new in stream:
+        sigma2_next = online.update(r_new)
+        online.forecast(horizon=3)
+
+Every update costs O(p + o + q) and uses the fitted parameters unchanged. The
+model is re-estimated on the accumulated returns every ``refit_every``
+observations, or earlier when the standardized residuals drift away from unit
+variance (see ``drift_threshold``).
+"""
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+class OnlineGARCH:
+    """Recursive conditional variance of a GARCH(p, o, q) with fixed parameters.
+
+    Parameters
+    ----------
+    params : pd.Series
+        Parameters named as in ``arch`` (``mu``, ``omega``, ``alpha[i]``,
+        ``gamma[i]``, ``beta[i]``). A missing ``mu`` means a zero mean.
+    resid : array_like
+        The last residuals r_t - mu, at least ``max(p, o)`` of them.
+    variance : array_like
+        The conditional variances of the same periods, at least ``q``.
+    result : ARCHModelResult, optional
+        The fit the parameters come from, needed to refit the model.
+    history : array_like, optional
+        Returns used for refitting; new returns are appended.
+    refit_every : int, optional
+        Refit after this many new observations.
+    drift_threshold : float, optional
+        Refit when the exponentially weighted mean of the squared
+        standardized residuals differs from 1 by more than this.
+    drift_halflife : float
+        Half-life (in observations) of that weighted mean.
+    window : int, optional
+        Refit on the last ``window`` returns only; also bounds the history.
+    """
+
+    def __init__(self, params, resid, variance, result=None, history=None,
+                 refit_every=None, drift_threshold=None, drift_halflife=50, window=None):
+        self.refit_every = refit_every
+        self.drift_threshold = drift_threshold
+        self.drift_decay = 0.5 ** (1 / drift_halflife)
+        self.window = window
+        self.history = deque(np.asarray(history, dtype=float) if history is not None else (), maxlen=window)
+        self.result = result
+        self.nrefits = 0
+        self._set_state(params, resid, variance)
+
+    @classmethod
+    def from_result(cls, result, **kwargs):
+        """Start from an ``arch`` fit, continuing after its last observation."""
+        resid = np.asarray(result.resid, dtype=float)
+        variance = np.asarray(result.conditional_volatility, dtype=float) ** 2
+        history = np.asarray(result.model.y, dtype=float)
+        return cls(result.params, resid, variance, result=result, history=history, **kwargs)
+
+    def _set_state(self, params, resid, variance):
+        params = pd.Series(params)
+        self.params = params
+        self.mu = float(params.get("mu", 0.0))
+        self.omega = float(params["omega"])
+        self.alpha = self._lag_params(params, "alpha")
+        self.gamma = self._lag_params(params, "gamma")
+        self.beta = self._lag_params(params, "beta")
+
+        p, o, q = len(self.alpha), len(self.gamma), len(self.beta)
+        resid = np.asarray(resid, dtype=float)
+        variance = np.asarray(variance, dtype=float)
+
+        # Most recent value first
+        n_resid = max(p, o, 1)
+        self._resid = deque(resid[::-1][:n_resid], maxlen=n_resid)
+        self._variance = deque(variance[::-1][:max(q, 1)], maxlen=max(q, 1))
+
+        # Variance of the next, not yet observed, return
+        self.next_variance = self._recursion(self._resid, self._variance)
+        self.nobs_since_refit = 0
+        self.drift = 1.0
+
+    @staticmethod
+    def _lag_params(params, name):
+        values = []
+        while f"{name}[{len(values) + 1}]" in params.index:
+            values.append(float(params[f"{name}[{len(values) + 1}]"]))
+        return np.array(values)
+
+    def _recursion(self, resid, variance):
+        sigma2 = self.omega
+        for a, e in zip(self.alpha, resid):
+            sigma2 += a * e * e
+        for g, e in zip(self.gamma, resid):
+            sigma2 += g * e * e * (e < 0)
+        for b, s in zip(self.beta, variance):
+            sigma2 += b * s
+        return sigma2
+
+    def update(self, r):
+        """Add the return ``r`` and return the variance of the next return."""
+        e = r - self.mu
+        sigma2 = self.next_variance
+
+        self._resid.appendleft(e)
+        self._variance.appendleft(sigma2)
+        self.next_variance = self._recursion(self._resid, self._variance)
+
+        self.history.append(r)
+        self.nobs_since_refit += 1
+        self.drift = self.drift_decay * self.drift + (1 - self.drift_decay) * e * e / sigma2
+
+        if self.needs_refit():
+            self.refit()
+
+        return self.next_variance
+
+    def needs_refit(self):
+        if self.refit_every is not None and self.nobs_since_refit >= self.refit_every:
+            return True
+        if self.drift_threshold is not None and abs(self.drift - 1.0) > self.drift_threshold:
+            return True
+        return False
+
+    def forecast(self, horizon=1):
+        """Variance forecasts for 1, ..., ``horizon`` steps ahead.
+
+        Same as the analytic ``forecast(horizon).variance`` of ``arch`` for a
+        constant mean: beyond one step the squared residuals are replaced by
+        their expectation, half of which enters the asymmetric term.
+        """
+        resid2 = [e * e for e in self._resid]
+        negative = [e * e * (e < 0) for e in self._resid]
+        variance = list(self._variance)
+        forecasts = np.empty(horizon)
+
+        for h in range(horizon):
+            sigma2 = self.omega
+            sigma2 += sum(a * e2 for a, e2 in zip(self.alpha, resid2))
+            sigma2 += sum(g * n for g, n in zip(self.gamma, negative))
+            sigma2 += sum(b * s for b, s in zip(self.beta, variance))
+            forecasts[h] = sigma2
+
+            resid2.insert(0, sigma2)
+            negative.insert(0, 0.5 * sigma2)
+            variance.insert(0, sigma2)
+
+        return forecasts
+
+    def refit(self):
+        """Re-estimate the model on the history, warm-started at the current parameters."""
+        if self.result is None:
+            raise ValueError("refitting needs the arch result the filter was created from")
+
+        from arch.univariate import GARCH
+
+        model = self.result.model
+        y = np.asarray(self.history, dtype=float)
+        volatility = GARCH(p=model.volatility.p, o=model.volatility.o, q=model.volatility.q)
+        new_model = type(model)(y, volatility=volatility, distribution=type(model.distribution)())
+        result = new_model.fit(disp="off", starting_values=self.params.to_numpy())
+
+        self.result = result
+        self.nrefits += 1
+        resid = np.asarray(result.resid, dtype=float)
+        variance = np.asarray(result.conditional_volatility, dtype=float) ** 2
+        self._set_state(result.params, resid, variance)
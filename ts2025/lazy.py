@@ -0,0 +1,91 @@
+"""Lazy imports of the scientific stack.
+
+Importing statsmodels, arch or scipy.stats takes seconds, which dominates
+short notebook runs and the start of the Dash app. The modules here are
+imported on first attribute access instead:
+
+    from ts2025.lazy import sm, go, sns
+
+    sm.tsa.ARIMA(...)  # statsmodels.api is imported here
+
+Any module can be wrapped with :func:`lazy_import`. ``STACK`` lists the
+modules the chapters use; ``scripts/kernel_forkserver.py`` imports them
+once and forks a kernel per notebook.
+"""
+import importlib
+import types
+
+# Aliases available as ``from ts2025.lazy import <alias>``
+ALIASES = {
+    "np": "numpy",
+    "pd": "pandas",
+    "plt": "matplotlib.pyplot",
+    "sns": "seaborn",
+    "stats": "scipy.stats",
+    "sm": "statsmodels.api",
+    "smf": "statsmodels.formula.api",
+    "tsa": "statsmodels.tsa.api",
+    "tsaplots": "statsmodels.graphics.tsaplots",
+    "arch": "arch",
+    "go": "plotly.graph_objects",
+    "px": "plotly.express",
+    "yf": "yfinance",
+    "dash": "dash",
+}
+
+# Imported ahead of time by the kernel fork server
+STACK = [
+    "numpy",
+    "pandas",
+    "scipy.stats",
+    "scipy.signal",
+    "matplotlib.pyplot",
+    "seaborn",
+    "statsmodels.api",
+    "statsmodels.formula.api",
+    "statsmodels.tsa.arima.model",
+    "statsmodels.graphics.tsaplots",
+    "arch",
+    "plotly.graph_objects",
+    "plotly.subplots",
+    "statsforecast",
+]
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that imports it on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name):
+    """Return ``name`` as a module that is imported when first used."""
+    return LazyModule(name)
+
+
+def __getattr__(name):
+    if name in ALIASES:
+        module = globals()[name] = lazy_import(ALIASES[name])
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(ALIASES))
@@ -0,0 +1,304 @@
+"""Local store of daily OHLCV bars downloaded with yfinance.
+
+    from ts2025.market_data import MarketDataStore
+    dt = MarketDataStore().download("TSLA", start="2020-01-01", end="2025-12-31")
+    tesla = dt["Close"]
+    tesla_lr = dt["LogReturn"]
+
+``download`` returns the same layout as ``yf.download`` (columns indexed by
+price field and ticker) with an extra ``LogReturn`` field, the log
+difference of the close price. Bars are stored per ticker and year in Parquet
+files under ``.cache/market/<ticker>/<year>.parquet`` together with the date
+ranges that have been requested before, so only missing ranges are fetched.
+Tickers missing the same range are fetched in one provider call.
+
+Adjusted prices (``auto_adjust=True``) are rewritten back in time after
+every split or dividend, so bars fetched before and after a corporate action
+are on different bases and must not be joined. The store records the last
+session its bars of a ticker were fetched as of; before new bars are added
+it asks the provider for corporate actions after that session and, if there
+are any, fetches the whole stored span of the ticker again. ``LogReturn`` is
+``np.log(close).diff()`` of the returned window (the first row is missing),
+whatever was stored before.
+
+The data source is a provider object with ``fetch(tickers, start, end)`` and
+``actions(tickers, start, end)`` methods. :class:`YFinanceProvider` is the
+default; :class:`LocalProvider` serves bars from memory and records its
+calls, so the store can be exercised without network access.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "market"
+
+FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Daily bars of a session are final once the (US) market has closed
+MARKET_TIMEZONE = "America/New_York"
+MARKET_CLOSE = pd.Timedelta(hours=16, minutes=30)
+
+
+class YFinanceProvider:
+    """Daily bars from Yahoo Finance, with the defaults of ``yf.download``."""
+
+    def __init__(self, auto_adjust=True):
+        self.auto_adjust = auto_adjust
+
+    def fetch(self, tickers, start, end):
+        """Return a dict mapping each ticker to its bars in ``[start, end)``."""
+        import yfinance as yf
+
+        data = yf.download(list(tickers), start=start, end=end, auto_adjust=self.auto_adjust,
+                           group_by="ticker", progress=False, multi_level_index=True)
+        bars = {}
+        for ticker in tickers:
+            if data is None or data.empty or ticker not in data.columns.get_level_values(0):
+                bars[ticker] = pd.DataFrame(columns=FIELDS, index=pd.DatetimeIndex([], name="Date"))
+                continue
+            bars[ticker] = data[ticker][FIELDS].dropna(how="all")
+
+        return bars
+
+    def actions(self, tickers, start, end):
+        """Return a dict mapping each ticker to the dates of its splits and dividends in ``[start, end)``."""
+        import yfinance as yf
+
+        data = yf.download(list(tickers), start=start, end=end, auto_adjust=self.auto_adjust, actions=True,
+                           group_by="ticker", progress=False, multi_level_index=True)
+        dates = {}
+        for ticker in tickers:
+            if data is None or data.empty or ticker not in data.columns.get_level_values(0):
+                dates[ticker] = pd.DatetimeIndex([])
+                continue
+            events = data[ticker].reindex(columns=["Dividends", "Stock Splits"]).fillna(0)
+            dates[ticker] = events.index[(events != 0).any(axis=1)]
+
+        return dates
+
+
+class LocalProvider:
+    """Serves bars from a dict of ``DataFrame``s and records every call.
+
+    ``actions`` optionally maps tickers to the dates of their corporate
+    actions.
+    """
+
+    def __init__(self, bars, actions=None):
+        self.bars = bars
+        self.corporate_actions = actions or {}
+        self.calls = []
+        self.action_calls = []
+
+    def fetch(self, tickers, start, end):
+        self.calls.append((tuple(tickers), start, end))
+        result = {}
+        for ticker in tickers:
+            df = self.bars[ticker]
+            result[ticker] = df[(df.index >= start) & (df.index < end)][FIELDS]
+        return result
+
+    def actions(self, tickers, start, end):
+        self.action_calls.append((tuple(tickers), start, end))
+        result = {}
+        for ticker in tickers:
+            dates = pd.DatetimeIndex(self.corporate_actions.get(ticker, []))
+            result[ticker] = dates[(dates >= start) & (dates < end)]
+        return result
+
+
+def _subtract(start, end, covered):
+    """Parts of ``[start, end)`` not covered by the sorted intervals."""
+    missing = []
+    for c_start, c_end in covered:
+        if c_end <= start or c_start >= end:
+            continue
+        if c_start > start:
+            missing.append((start, c_start))
+        start = max(start, c_end)
+        if start >= end:
+            break
+    if start < end:
+        missing.append((start, end))
+    return missing
+
+
+def session_end(now):
+    """Exclusive end date of the last completed session at time ``now``.
+
+    Before the close the bar of the day is still changing, so it is neither
+    fetched nor recorded as covered.
+    """
+    now = pd.Timestamp(now)
+    now = now.tz_localize(MARKET_TIMEZONE) if now.tzinfo is None else now.tz_convert(MARKET_TIMEZONE)
+    today = now.normalize()
+    end = today + pd.Timedelta(days=1) if now - today >= MARKET_CLOSE else today
+    return end.tz_localize(None)
+
+
+def _merge(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class MarketDataStore:
+    """On-disk store of daily bars and log returns per ticker.
+
+    Parameters
+    ----------
+    provider : object, optional
+        Anything with ``fetch(tickers, start, end)``, defaults to
+        :class:`YFinanceProvider`.
+    root : path
+        Directory of the store.
+    clock : callable, optional
+        Returns the current time, defaults to ``pd.Timestamp.now``.
+    """
+
+    def __init__(self, provider=None, root=CACHE_DIR, clock=None):
+        self.provider = provider if provider is not None else YFinanceProvider()
+        self.root = Path(root)
+        self.clock = clock if clock is not None else (lambda: pd.Timestamp.now(tz=MARKET_TIMEZONE))
+
+    def _ticker_dir(self, ticker):
+        return self.root / ticker.replace("/", "_")
+
+    def _read_coverage(self, ticker):
+        """Stored date ranges and the end of the session they are adjusted as of."""
+        path = self._ticker_dir(ticker) / "coverage.json"
+        if not path.exists():
+            return [], None
+        state = json.loads(path.read_text())
+        if isinstance(state, list):
+            # Written before the sessions were recorded: check all actions
+            # since the start of the stored bars
+            state = {"covered": state, "as_of": state[0][0]}
+        covered = [(pd.Timestamp(s), pd.Timestamp(e)) for s, e in state["covered"]]
+        return covered, pd.Timestamp(state["as_of"])
+
+    def _coverage(self, ticker):
+        return self._read_coverage(ticker)[0]
+
+    def _save_coverage(self, ticker, covered, as_of):
+        path = self._ticker_dir(ticker) / "coverage.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "covered": [[s.date().isoformat(), e.date().isoformat()] for s, e in covered],
+            "as_of": as_of.date().isoformat(),
+        }))
+
+    def _clear(self, ticker):
+        directory = self._ticker_dir(ticker)
+        for path in list(directory.glob("*.parquet")) + [directory / "coverage.json"]:
+            path.unlink(missing_ok=True)
+
+    def load(self, ticker):
+        """All stored bars of ``ticker``."""
+        files = sorted(self._ticker_dir(ticker).glob("*.parquet"))
+        if not files:
+            return pd.DataFrame(columns=FIELDS + ["LogReturn"], index=pd.DatetimeIndex([], name="Date"))
+        return pd.concat([pd.read_parquet(path) for path in files]).sort_index()
+
+    def _store(self, ticker, new_bars, covered):
+        """Add bars and recompute the log returns within the ``covered`` ranges."""
+        old = self.load(ticker)
+        if new_bars.empty:
+            return
+
+        new_bars = new_bars[FIELDS].copy()
+        new_bars.index = pd.DatetimeIndex(new_bars.index).tz_localize(None).normalize()
+        new_bars.index.name = "Date"
+
+        bars = pd.concat([old[FIELDS], new_bars]) if not old.empty else new_bars
+        bars = bars[~bars.index.duplicated(keep="last")].sort_index()
+        bars["LogReturn"] = np.log(bars["Close"]).diff()
+        # The previous stored bar of the first bar of a range is not the
+        # previous session
+        starts = np.array([s for s, _ in covered], dtype="datetime64[ns]")
+        range_index = np.searchsorted(starts, bars.index.values, side="right")
+        bars.loc[np.r_[True, range_index[1:] != range_index[:-1]], "LogReturn"] = np.nan
+
+        # Only rewrite the years that changed
+        directory = self._ticker_dir(ticker)
+        directory.mkdir(parents=True, exist_ok=True)
+        for year, group in bars.groupby(bars.index.year):
+            previous = old[old.index.year == year]
+            if previous.shape == group.shape and previous.equals(group):
+                continue
+            group.to_parquet(directory / f"{year}.parquet")
+
+    def update(self, tickers, start, end):
+        """Fetch the parts of ``[start, end)`` not yet stored for each ticker.
+
+        Only completed sessions are fetched (see :func:`session_end`), so a
+        range that reaches into today is completed by a later update.
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        as_of = session_end(self.clock())
+        end = min(end, as_of)
+
+        gaps = {}
+        for ticker in tickers:
+            missing = _subtract(start, end, self._coverage(ticker))
+            if missing:
+                gaps[ticker] = missing
+
+        # Stored bars adjusted as of an earlier session are on another basis if
+        # there was a split or dividend since: fetch their whole span again
+        stale = {}
+        for ticker in gaps:
+            covered, stored_as_of = self._read_coverage(ticker)
+            if covered and stored_as_of < as_of:
+                stale.setdefault(stored_as_of, []).append(ticker)
+        for stored_as_of, batch in stale.items():
+            actions = self.provider.actions(batch, stored_as_of.date().isoformat(), as_of.date().isoformat())
+            for ticker in batch:
+                if len(actions.get(ticker, [])):
+                    covered = self._coverage(ticker)
+                    self._clear(ticker)
+                    gaps[ticker] = [(min(start, covered[0][0]), max(end, covered[-1][1]))]
+
+        # Group tickers by missing range to batch them into one request
+        requests = {}
+        for ticker, missing in gaps.items():
+            for gap in missing:
+                requests.setdefault(gap, []).append(ticker)
+
+        for (gap_start, gap_end), batch in requests.items():
+            bars = self.provider.fetch(batch, gap_start.date().isoformat(), gap_end.date().isoformat())
+            for ticker in batch:
+                covered = _merge(self._coverage(ticker) + [(gap_start, gap_end)])
+                self._store(ticker, bars.get(ticker, pd.DataFrame(columns=FIELDS)), covered)
+                self._save_coverage(ticker, covered, as_of)
+
+        return len(requests)
+
+    def download(self, tickers, start, end):
+        """Bars in ``[start, end)`` in the layout of ``yf.download``.
+
+        The columns are a ``MultiIndex`` of (field, ticker); the fields are
+        Open, High, Low, Close, Volume and LogReturn.
+        """
+        if isinstance(tickers, str):
+            tickers = tickers.split()
+        self.update(tickers, start, end)
+
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        frames = {}
+        for ticker in tickers:
+            bars = self.load(ticker)
+            bars = bars[(bars.index >= start) & (bars.index < end)].copy()
+            # As np.log(close).diff() of the window, whatever was stored before
+            bars.iloc[:1, bars.columns.get_loc("LogReturn")] = np.nan
+            frames[ticker] = bars
+
+        result = pd.concat(frames, axis=1, names=["Ticker", "Price"])
+        result = result.swaplevel(axis=1).sort_index(axis=1, level=0, sort_remaining=False)
+        return result[FIELDS + ["LogReturn"]]
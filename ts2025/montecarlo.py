@@ -0,0 +1,188 @@
+"""Monte Carlo comparison of forecasting rules.
+
+Generalizes the experiment of the ARIMA Forecasting chapter, where the
+historical average, the last value and an arbitrary number are compared as
+forecasts of the next value of a random walk:
+
+>>> from functools import partial
+>>> from ts2025.montecarlo import (forecast_loss_experiment, random_walk_sample,
+...     historical_average, last_value, constant_forecast)
+>>> forecast_loss_experiment(
+...     random_walk_sample,
+...     {
+...         "Historical Average": historical_average,
+...         "Last Balance": last_value,
+...         "Arbitrary Forecast": partial(constant_forecast, value=1050),
+...     },
+...     nrep=1_000_000,
+...     seed=42,
+... )
+
+Replications are simulated in blocks of ``block_size`` as arrays. Blocks are
+distributed over a process pool and every block draws from its own child of
+``np.random.SeedSequence(seed)``. Only the running mean and variance of the
+losses are kept. Since the block results are merged in block order, the result
+for a given seed does not depend on the number of workers.
+
+The simulation, forecast and loss functions are sent to the worker processes,
+so they have to be picklable: module-level functions or ``functools.partial``
+objects, not lambdas.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+class RunningMoments:
+    """Running count, mean and sum of squared deviations of several columns.
+
+    Blocks are combined with the pairwise update of Chan, Golub and LeVeque,
+    which stays accurate for very many observations.
+    """
+
+    def __init__(self, ncols):
+        self.count = 0
+        self.mean = np.zeros(ncols)
+        self.m2 = np.zeros(ncols)
+
+    def update(self, values):
+        """Add a ``(n, ncols)`` block of observations."""
+        values = np.asarray(values, dtype=float)
+        if values.shape[0] == 0:
+            return
+        block = RunningMoments(values.shape[1])
+        block.count = values.shape[0]
+        block.mean = values.mean(axis=0)
+        block.m2 = ((values - block.mean) ** 2).sum(axis=0)
+        self.merge(block)
+
+    def merge(self, other):
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.count / count
+        self.m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self):
+        """Sample variance, ``nan`` for fewer than two observations."""
+        if self.count < 2:
+            return np.full_like(self.m2, np.nan)
+        return self.m2 / (self.count - 1)
+
+
+def random_walk_sample(rng, nrep, nsample=100, start=1000.0, scale=10.0):
+    """Random walks x_t = x_{t-1} + e_t starting at ``start``.
+
+    Returns the first ``nsample`` values of every walk as the past and the
+    following value as the target of the forecast.
+    """
+    x = start + np.cumsum(rng.normal(0, scale, size=(nrep, nsample + 1)), axis=1)
+    return x[:, :-1], x[:, -1]
+
+
+def historical_average(past):
+    return past.mean(axis=1)
+
+
+def last_value(past):
+    return past[:, -1]
+
+
+def constant_forecast(past, value):
+    return np.full(past.shape[0], float(value))
+
+
+def squared_loss(actual, forecast):
+    return (actual - forecast) ** 2
+
+
+def _run_block(simulate, forecasters, loss, nrep, seed):
+    rng = np.random.default_rng(seed)
+    past, actual = simulate(rng, nrep)
+
+    losses = np.column_stack([loss(actual, forecast(past)) for forecast in forecasters])
+
+    moments = RunningMoments(len(forecasters))
+    moments.update(losses)
+    return moments
+
+
+def forecast_loss_experiment(simulate, forecasters, nrep, block_size=10_000, workers=None, seed=None, loss=squared_loss):
+    """Expected loss of several forecasting rules by simulation.
+
+    Parameters
+    ----------
+    simulate : callable
+        ``simulate(rng, n)`` returns the past values, shape ``(n, T)``, and
+        the values to forecast, shape ``(n,)``.
+    forecasters : dict
+        Maps a name to ``forecast(past)``, which returns ``n`` forecasts.
+    nrep : int
+        Number of replications.
+    block_size : int
+        Replications simulated at once by one worker.
+    workers : int, optional
+        Number of processes. Defaults to the number of CPUs, ``workers=1``
+        runs in the current process.
+    seed : int or np.random.SeedSequence, optional
+    loss : callable
+        ``loss(actual, forecast)``, squared loss by default.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per forecaster with the mean loss, its standard deviation and
+        the Monte Carlo standard error of the mean.
+    """
+    if nrep < 1:
+        raise ValueError(f"nrep must be at least 1, got {nrep}")
+    if block_size < 1:
+        raise ValueError(f"block_size must be at least 1, got {block_size}")
+    names = list(forecasters)
+    funcs = [forecasters[name] for name in names]
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    sizes = [block_size] * (nrep // block_size)
+    if nrep % block_size:
+        sizes.append(nrep % block_size)
+    seeds = seed.spawn(len(sizes))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(sizes))
+
+    moments = RunningMoments(len(funcs))
+    if workers <= 1:
+        for n, block_seed in zip(sizes, seeds):
+            moments.merge(_run_block(simulate, funcs, loss, n, block_seed))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            blocks = pool.map(
+                _run_block,
+                [simulate] * len(sizes),
+                [funcs] * len(sizes),
+                [loss] * len(sizes),
+                sizes,
+                seeds,
+            )
+            # map returns the blocks in submission order
+            for block in blocks:
+                moments.merge(block)
+
+    std = np.sqrt(moments.variance)
+    return pd.DataFrame(
+        {
+            "mean_loss": moments.mean,
+            "std_loss": std,
+            "std_error": std / np.sqrt(moments.count),
+            "nrep": moments.count,
+        },
+        index=pd.Index(names, name="forecast"),
+    )
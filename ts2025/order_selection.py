@@ -0,0 +1,217 @@
+"""Grid search over ARIMA orders with statsmodels.
+
+For every differencing order ``d`` the candidate orders ``(p, d, q)`` are
+fitted in rounds of increasing ``p + q``. The fits of one round run in a
+process pool and every fit is warm-started from the estimates of the best
+nested model of the previous round (the new lag coefficients start at zero).
+
+Before the rounds the largest model ``(p_max, d, q_max)`` is fitted. Its
+log-likelihood is an upper bound for the log-likelihood of every nested
+order, so ``-2 * llf_max + penalty(k)`` is a lower bound for the information
+criterion of a model with ``k`` parameters. Candidates whose bound is not
+better than the best criterion found so far are not fitted. The bound assumes
+that the optimizer finds the maximum of the largest model; pass
+``prune=False`` to fit the full grid.
+
+As in statsmodels, the BIC of an order with ``d`` differences uses
+``nobs - d`` observations (``nobs_effective``), and so does the bound. The
+likelihood of such a model is that of the differenced series, so the AIC
+and BIC of different ``d`` are computed on different bases and should not be
+compared across ``d``: pruning only uses the best criterion of the same
+``d``, the table ranks the candidates within each ``d`` (it is indexed by
+``d`` and the rank), and ``d`` itself is better chosen with a unit root test
+(see :mod:`ts2025.unit_root`).
+
+>>> from ts2025.order_selection import select_order
+>>> table = select_order(dt, p_max=3, d_max=1, q_max=3)
+>>> table.loc[1].head()
+"""
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+
+COLUMNS = ["p", "d", "q", "criterion", "aic", "bic", "llf", "nparams",
+           "criterion_lower_bound", "converged", "seconds", "status"]
+
+
+def _default_trend(d):
+    # A constant is eliminated by differencing, see ARIMA(trend=...)
+    return "c" if d == 0 else "n"
+
+
+def _fit_order(y, order, trend, start_params=None):
+    """Fit one order, optionally warm-started from named parameter values."""
+    start = time.perf_counter()
+    model = ARIMA(y, order=order, trend=trend)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res = None
+        if start_params is not None:
+            values = [start_params.get(name, 0.0) for name in model.param_names]
+            try:
+                res = model.fit(start_params=values)
+            except (ValueError, np.linalg.LinAlgError):
+                # E.g. non-stationary start values, retry with the defaults
+                res = None
+        if res is None:
+            res = model.fit()
+
+    return {
+        "order": order,
+        "aic": res.aic,
+        "bic": res.bic,
+        "llf": res.llf,
+        # BIC uses the observations after the diffuse part, nobs - d
+        "nobs": res.nobs_effective,
+        "nparams": len(res.params),
+        "params": dict(zip(model.param_names, np.asarray(res.params))),
+        "converged": bool(res.mle_retvals.get("converged", True)) if res.mle_retvals else True,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _penalty(criterion, nparams, nobs):
+    if criterion == "aic":
+        return 2.0 * nparams
+    if criterion == "bic":
+        return np.log(nobs) * nparams
+    raise ValueError(f"criterion must be 'aic' or 'bic', got {criterion!r}")
+
+
+def _nparams(order, trend):
+    p, _, q = order
+    return p + q + (trend != "n") + 1  # + sigma2
+
+
+def select_order(y, p_max=3, d_max=1, q_max=3, trend=None, criterion="aic", prune=True, workers=None, pool=None):
+    """Rank ARIMA(p, d, q) orders of one series by AIC or BIC.
+
+    Parameters
+    ----------
+    y : array_like
+    p_max, d_max, q_max : int
+        Largest orders in the grid.
+    trend : str, optional
+        Trend passed to ``ARIMA``. Defaults to a constant for ``d = 0`` and
+        no trend otherwise.
+    criterion : {"aic", "bic"}
+    prune : bool
+        Skip candidates whose criterion cannot beat the best one so far.
+    workers : int, optional
+        Size of the process pool, defaults to the number of CPUs.
+        ``workers=1`` fits everything in the current process.
+    pool : concurrent.futures.Executor, optional
+        Executor to run the fits in, e.g. one shared by several searches;
+        ``workers`` is then ignored. By default a process pool of
+        ``workers`` processes is created for the search.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per candidate, indexed by ``d`` and the rank within ``d``
+        (best first). Pruned candidates have status ``"pruned"``, their lower
+        bound and no estimates.
+    """
+    y = np.asarray(y, dtype=float)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if pool is None and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return select_order(y, p_max, d_max, q_max, trend, criterion, prune, workers, pool)
+
+    def run(tasks):
+        if pool is None:
+            return [_fit_order(y, *task) for task in tasks]
+        return list(pool.map(_fit_order, [y] * len(tasks), *zip(*tasks)))
+
+    rows = []
+    for d in range(d_max + 1):
+        # The criteria of different d are not comparable, prune within d only
+        best = np.inf
+        d_trend = _default_trend(d) if trend is None else trend
+        fits = {}
+        llf_max = np.inf
+
+        if prune:
+            largest = (p_max, d, q_max)
+            fits[(p_max, q_max)] = run([(largest, d_trend)])[0]
+            llf_max = fits[(p_max, q_max)]["llf"]
+
+        for level in range(p_max + q_max + 1):
+            tasks = []
+            for p, q in product(range(p_max + 1), range(q_max + 1)):
+                if p + q != level or (p, q) in fits:
+                    continue
+                order = (p, d, q)
+                nparams = _nparams(order, d_trend)
+                nobs = len(y) - d
+                bound = -2.0 * llf_max + _penalty(criterion, nparams, nobs)
+                if prune and bound >= best:
+                    rows.append({"p": p, "d": d, "q": q, "nparams": nparams,
+                                 "criterion_lower_bound": bound, "status": "pruned"})
+                    continue
+
+                # Warm start from the better nested model of the previous round
+                parents = [fits[key] for key in ((p - 1, q), (p, q - 1)) if key in fits]
+                start_params = max(parents, key=lambda fit: fit["llf"])["params"] if parents else None
+                tasks.append((order, d_trend, start_params))
+
+            for fit in run(tasks):
+                p, _, q = fit["order"]
+                fits[(p, q)] = fit
+
+            for fit in fits.values():
+                best = min(best, fit[criterion])
+
+        for (p, q), fit in fits.items():
+            rows.append({
+                "p": p, "d": d, "q": q,
+                "criterion": fit[criterion],
+                "aic": fit["aic"], "bic": fit["bic"], "llf": fit["llf"],
+                "nparams": fit["nparams"],
+                "criterion_lower_bound": -2.0 * llf_max + _penalty(criterion, fit["nparams"], fit["nobs"]) if prune else np.nan,
+                "converged": fit["converged"],
+                "seconds": fit["seconds"],
+                "status": "fitted",
+            })
+
+    # The criteria of different d are not comparable, rank within d
+    table = pd.DataFrame(rows, columns=COLUMNS)
+    table = table.sort_values(["d", "criterion", "criterion_lower_bound"], na_position="last")
+    table["rank"] = table.groupby("d").cumcount()
+    return table.set_index(["d", "rank"])
+
+
+def _select_order_single(y, kwargs):
+    return select_order(y, workers=1, **kwargs)
+
+
+def select_orders(panel, workers=None, **kwargs):
+    """Run :func:`select_order` for many series in a process pool.
+
+    ``panel`` is a ``DataFrame`` with one series per column or a mapping of
+    names to series. Each worker searches the grid of one series. Returns one
+    table indexed by series name, ``d`` and rank.
+    """
+    if isinstance(panel, pd.DataFrame):
+        panel = {name: panel[name].dropna().to_numpy() for name in panel.columns}
+    names = list(panel)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        tables = [_select_order_single(panel[name], kwargs) for name in names]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tables = list(pool.map(_select_order_single, [panel[name] for name in names], [kwargs] * len(names)))
+
+    return pd.concat(tables, keys=names, names=["series", "d", "rank"])
@@ -0,0 +1,107 @@
+"""Batched simulation of AR, MA and ARMA processes.
+
+All functions return an array of shape ``(npaths, nsample)`` with one
+simulated path per row. The lag polynomials follow the convention of
+``statsmodels.tsa.arima_process.arma_generate_sample``: an AR(1) process with
+coefficient ``phi`` is ``ar=[1, -phi]``, an MA(1) process with coefficient
+``theta`` is ``ma=[1, theta]``.
+"""
+import numpy as np
+from scipy.signal import lfilter
+
+
+def draw_innovations(npaths, nsample, scale=1.0, seed=None, per_path_seeds=False):
+    """Draw a ``(npaths, nsample)`` array of Gaussian innovations.
+
+    ``seed`` can be anything accepted by ``np.random.default_rng``. With
+    ``per_path_seeds=True`` every row gets its own child of
+    ``np.random.SeedSequence(seed)``, so path ``i`` is the same no matter how
+    many paths are drawn together. This is slower for very many paths.
+    """
+    if not per_path_seeds:
+        rng = np.random.default_rng(seed)
+        return scale * rng.standard_normal((npaths, nsample))
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    e = np.empty((npaths, nsample))
+    for i, child in enumerate(seed.spawn(npaths)):
+        np.random.default_rng(child).standard_normal(nsample, out=e[i])
+
+    return scale * e
+
+
+def arma_generate_paths(ar, ma, nsample, npaths, scale=1.0, burnin=0, seed=None, per_path_seeds=False):
+    """Simulate ``npaths`` independent ARMA(p, q) paths of length ``nsample``.
+
+    The innovations of all paths are filtered in a single call to
+    ``scipy.signal.lfilter`` along the time axis. The first ``burnin``
+    observations of every path are discarded, so the paths start (close to)
+    the stationary distribution instead of at zero.
+
+    For one path and the same innovations this gives the same result as
+    ``arma_generate_sample(ar, ma, nsample, scale, burnin=burnin)``.
+
+    Example
+    -------
+    >>> x = arma_generate_paths([1, -0.8], [1], nsample=100, npaths=100_000, burnin=200, seed=42)
+    >>> x.shape
+    (100000, 100)
+    """
+    ar = np.asarray(ar, dtype=float)
+    ma = np.asarray(ma, dtype=float)
+
+    e = draw_innovations(npaths, nsample + burnin, scale=scale, seed=seed, per_path_seeds=per_path_seeds)
+    x = lfilter(ma, ar, e, axis=1)
+
+    return x[:, burnin:]
+
+
+def ar_recursion(phi, shocks, initial=None):
+    """Run the difference equation x_t = phi_1 x_{t-1} + ... + phi_p x_{t-p} + e_t.
+
+    Parameters
+    ----------
+    phi : array_like, shape (p,) or (npaths, p)
+        AR coefficients. A 2-D array gives every path its own coefficients,
+        e.g. one row per value of phi as in the Linear Difference Equations
+        chapter.
+    shocks : array_like, shape (npaths, nsample)
+        The values of e_t. Use zeros for the homogeneous equation.
+    initial : array_like, shape (p,) or (npaths, p), optional
+        The values x_{-p}, ..., x_{-1} before the first shock (oldest first).
+        Defaults to zeros.
+
+    Shared coefficients are handled by ``lfilter``. Per-path coefficients use
+    a loop over time that updates all paths at once, so the cost does not grow
+    with the number of paths in Python.
+    """
+    phi = np.atleast_1d(np.asarray(phi, dtype=float))
+    shocks = np.atleast_2d(np.asarray(shocks, dtype=float))
+    npaths, nsample = shocks.shape
+    p = phi.shape[-1]
+
+    if initial is None:
+        initial = np.zeros(p)
+    initial = np.broadcast_to(np.asarray(initial, dtype=float), (npaths, p))
+
+    if phi.ndim == 1:
+        # Initial state of the transposed direct form II filter for b = [1],
+        # a = [1, -phi_1, ..., -phi_p], see scipy.signal.lfiltic
+        past = initial[:, ::-1]  # x_{-1}, ..., x_{-p}
+        zi = np.zeros((npaths, p))
+        for m in range(p):
+            zi[:, m] = past[:, : p - m] @ phi[m:]
+
+        x, _ = lfilter([1.0], np.r_[1.0, -phi], shocks, axis=1, zi=zi)
+        return x
+
+    phi = np.broadcast_to(phi, (npaths, p))
+    x = np.empty((npaths, p + nsample))
+    x[:, :p] = initial
+    for t in range(nsample):
+        # x[:, t:t + p] holds x_{t-p}, ..., x_{t-1}
+        x[:, t + p] = np.einsum('ij,ij->i', x[:, t:t + p], phi[:, ::-1]) + shocks[:, t]
+
+    return x[:, p:]
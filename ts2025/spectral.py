@@ -0,0 +1,177 @@
+"""Periodograms, Welch spectral densities and spectrograms for long series.
+
+Like :mod:`ts2025.acf`, the functions take a 2-D array with one series per
+row (a 1-D array is treated as a single series) and return one row of
+results per series. :func:`welch`, :func:`stft_blocks` and
+:func:`spectrogram` also accept an iterator of consecutive chunks of the
+series (each chunk a 1-D array or a ``(nseries, length)`` array). The chunks
+are cut into overlapping segments as they arrive and only the last
+``nperseg - 1`` samples are carried over to the next chunk, so a series that
+does not fit in memory can be processed chunk by chunk.
+
+The results match ``scipy.signal`` for real input (one-sided spectra, the
+same scaling and segment times), so the frequencies and powers can be plotted
+as in the notebooks, e.g. ``plt.semilogy(freqs, pxx[0])`` or
+``plt.pcolormesh(times, freqs, sxx[0])``.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft, signal
+
+
+def _as_2d(x):
+    x = np.asarray(x, dtype=float)
+    return x[np.newaxis, :] if x.ndim == 1 else x
+
+
+def _iter_chunks(x):
+    if isinstance(x, np.ndarray):
+        yield _as_2d(x)
+        return
+    for chunk in x:
+        yield _as_2d(chunk)
+
+
+def _window(window, nperseg, noverlap):
+    if noverlap is None:
+        noverlap = nperseg // 2
+    if not 0 <= noverlap < nperseg:
+        raise ValueError("noverlap must be at least 0 and less than nperseg")
+    win = signal.get_window(window, nperseg)
+    return win, nperseg - noverlap
+
+
+def _one_sided_power(z, win, fs, scaling, nperseg):
+    """Scale ``|Z|**2`` of window-normalized spectra to a one-sided PSD."""
+    if scaling == "density":
+        scale = win.sum() ** 2 / (fs * (win**2).sum())
+    elif scaling == "spectrum":
+        scale = 1.0
+    else:
+        raise ValueError(f"unknown scaling: {scaling!r}")
+
+    power = z.real**2 + z.imag**2
+    power *= scale
+    # Every frequency except 0 and Nyquist also stands for its negative
+    last = -1 if nperseg % 2 == 0 else None
+    power[..., 1:last, :] *= 2
+    return power
+
+
+def periodogram(x, fs=1.0, window="boxcar", detrend="constant", scaling="density", batch_size=1_000):
+    """Real-FFT periodogram of every row of ``x``.
+
+    Computed with one ``rfft`` per batch of ``batch_size`` series. Matches
+    ``scipy.signal.periodogram(x, fs, window, detrend=detrend, scaling=scaling)``.
+    The whole series is transformed at once; for series that do not fit in
+    memory use :func:`welch` on chunks.
+
+    Returns ``(freqs, pxx)`` with ``pxx`` of shape ``(nseries, nobs // 2 + 1)``.
+    """
+    x = _as_2d(x)
+    nseries, nobs = x.shape
+    win = signal.get_window(window, nobs)
+    freqs = fft.rfftfreq(nobs, 1 / fs)
+
+    pxx = np.empty((nseries, freqs.size))
+    for start in range(0, nseries, batch_size):
+        block = x[start:start + batch_size]
+        if detrend == "constant":
+            block = block - block.mean(axis=1, keepdims=True)
+        elif detrend:
+            raise ValueError(f"unknown detrend: {detrend!r}")
+        z = fft.rfft(block * win, axis=1) / win.sum()
+        pxx[start:start + batch_size] = _one_sided_power(z[..., np.newaxis], win, fs, scaling, nobs)[..., 0]
+
+    return freqs, pxx
+
+
+def stft_blocks(x, fs=1.0, window="hann", nperseg=256, noverlap=None, detrend=False, max_segments=4_096):
+    """Short-time Fourier transform, yielded block by block.
+
+    ``x`` is an array or an iterator of consecutive chunks. Yields
+    ``(times, zxx)`` with ``zxx`` of shape ``(nseries, nperseg // 2 + 1,
+    nsegments)`` for at most ``max_segments`` segments at a time; ``times``
+    are the centers of the segments. Concatenated along the last axis, the
+    blocks equal ``scipy.signal.stft(x, fs, window, nperseg, noverlap,
+    detrend=detrend, boundary=None, padded=False)``.
+    """
+    win, step = _window(window, nperseg, noverlap)
+    if detrend not in (False, None, "constant"):
+        raise ValueError(f"unknown detrend: {detrend!r}")
+
+    tail = None
+    offset = 0  # index of the first sample of `tail` in the whole series
+    for chunk in _iter_chunks(x):
+        buffer = chunk if tail is None else np.concatenate([tail, chunk], axis=1)
+        if buffer.shape[1] < nperseg:
+            tail = buffer
+            continue
+        nsegments = (buffer.shape[1] - nperseg) // step + 1
+        segments = sliding_window_view(buffer, nperseg, axis=1)[:, ::step]
+
+        for first in range(0, nsegments, max_segments):
+            block = segments[:, first:min(first + max_segments, nsegments)]
+            if detrend == "constant":
+                block = block - block.mean(axis=-1, keepdims=True)
+            zxx = fft.rfft(block * win, axis=-1) / win.sum()
+            times = (offset + step * np.arange(first, first + block.shape[1]) + nperseg / 2) / fs
+            yield times, np.swapaxes(zxx, 1, 2)
+
+        # Keep the samples that start the next segment
+        tail = buffer[:, nsegments * step:].copy()
+        offset += nsegments * step
+
+
+def spectrogram_blocks(x, fs=1.0, window="hann", nperseg=256, noverlap=None, detrend="constant",
+                       scaling="density", max_segments=4_096):
+    """Power spectrogram, yielded block by block like :func:`stft_blocks`.
+
+    Yields ``(times, sxx)`` with ``sxx`` of shape ``(nseries, nperseg // 2 +
+    1, nsegments)``, the one-sided periodogram of every segment.
+    """
+    win, _ = _window(window, nperseg, noverlap)
+    for times, zxx in stft_blocks(x, fs, window, nperseg, noverlap, detrend, max_segments):
+        yield times, _one_sided_power(zxx, win, fs, scaling, nperseg)
+
+
+def spectrogram(x, fs=1.0, window="hann", nperseg=256, noverlap=None, detrend="constant", scaling="density"):
+    """Power spectrogram of every row of ``x`` (an array or chunks).
+
+    Matches ``scipy.signal.spectrogram(x, fs, window, nperseg, noverlap,
+    detrend=detrend, scaling=scaling)``; note that the default window here is
+    ``"hann"`` with half overlap, as in :func:`welch`.
+
+    Returns ``(freqs, times, sxx)`` with ``sxx`` of shape ``(nseries, nfreq,
+    ntimes)``. The whole spectrogram is kept in memory, use
+    :func:`spectrogram_blocks` to process it block by block.
+    """
+    blocks = list(spectrogram_blocks(x, fs, window, nperseg, noverlap, detrend, scaling))
+    freqs = fft.rfftfreq(nperseg, 1 / fs)
+    if not blocks:
+        return freqs, np.empty(0), np.empty((0, freqs.size, 0))
+    times = np.concatenate([times for times, _ in blocks])
+    return freqs, times, np.concatenate([sxx for _, sxx in blocks], axis=2)
+
+
+def welch(x, fs=1.0, window="hann", nperseg=256, noverlap=None, detrend="constant", scaling="density",
+          max_segments=4_096):
+    """Welch estimate of the spectral density of every row of ``x``.
+
+    The average of the segment periodograms of :func:`spectrogram_blocks`,
+    accumulated block by block, so the memory use is bounded by the chunk size
+    and ``max_segments`` whatever the length of the series. Matches
+    ``scipy.signal.welch(x, fs, window, nperseg, noverlap, detrend=detrend,
+    scaling=scaling)``.
+
+    Returns ``(freqs, pxx)`` with ``pxx`` of shape ``(nseries, nperseg // 2 + 1)``.
+    """
+    total, count = None, 0
+    for _, sxx in spectrogram_blocks(x, fs, window, nperseg, noverlap, detrend, scaling, max_segments):
+        block_sum = sxx.sum(axis=2)
+        total = block_sum if total is None else total + block_sum
+        count += sxx.shape[2]
+    if count == 0:
+        raise ValueError("the series is shorter than nperseg")
+
+    return fft.rfftfreq(nperseg, 1 / fs), total / count
@@ -0,0 +1,222 @@
+"""Dickey-Fuller and KPSS tests for many series of equal length.
+
+The regressions of all series are solved together: the design matrices are
+stacked into an array of shape ``(nseries, nobs, k)`` and the normal equations
+are solved with one batched ``np.linalg.solve``. The lag order is fixed (there
+is no automatic lag selection), so
+
+    adf(x, regression="c", lags=1)
+
+gives, for every row of ``x``, the statistic of
+``adfuller(x[i], regression="c", maxlag=1, autolag=None)``.
+
+Instead of the MacKinnon approximations the p-values and critical values come
+from finite-sample distributions simulated under the null hypothesis for the
+given number of observations, regression type and lag order. The simulated
+quantiles are cached under ``.cache/critical_values`` so later runs neither
+simulate again nor fall back to the asymptotic tables.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "critical_values"
+
+# Probabilities at which the simulated null distributions are stored
+PROBABILITIES = np.linspace(0.0005, 0.9995, 2000)
+
+ADF_LEVELS = {"1%": 0.01, "5%": 0.05, "10%": 0.10}
+KPSS_LEVELS = {"10%": 0.90, "5%": 0.95, "2.5%": 0.975, "1%": 0.99}
+
+
+def _as_2d(x):
+    x = np.asarray(x, dtype=float)
+    return x[np.newaxis, :] if x.ndim == 1 else x
+
+
+def _deterministic_terms(regression, nobs):
+    t = np.arange(1, nobs + 1, dtype=float)
+    columns = {
+        "n": [],
+        "c": [np.ones(nobs)],
+        "ct": [np.ones(nobs), t],
+        "ctt": [np.ones(nobs), t, t**2],
+    }
+    if regression not in columns:
+        raise ValueError(f"regression must be one of 'n', 'c', 'ct', 'ctt', got {regression!r}")
+    return columns[regression]
+
+
+def adf_statistic(x, regression="c", lags=0):
+    """Augmented Dickey-Fuller t-statistics, one per row of ``x``."""
+    x = _as_2d(x)
+    nseries = x.shape[0]
+    dx = np.diff(x, axis=1)
+    nobs = dx.shape[1] - lags
+
+    # Regressors: lagged level, lagged differences, deterministic terms
+    columns = [x[:, lags:-1]]
+    columns += [dx[:, lags - i:-i] for i in range(1, lags + 1)]
+    columns += [np.broadcast_to(term, (nseries, nobs)) for term in _deterministic_terms(regression, nobs)]
+    X = np.stack(columns, axis=2)
+    y = dx[:, lags:]
+
+    XtX = np.einsum("mti,mtj->mij", X, X)
+    Xty = np.einsum("mti,mt->mi", X, y)
+    # Second right-hand side e_0: the first column of the inverse, whose first
+    # entry scales the standard error of the level coefficient
+    e0 = np.zeros_like(Xty)
+    e0[:, 0] = 1.0
+    solution = np.linalg.solve(XtX, np.stack([Xty, e0], axis=2))
+    beta = solution[:, :, 0]
+
+    resid = y - np.einsum("mti,mi->mt", X, beta)
+    sigma2 = (resid**2).sum(axis=1) / (nobs - X.shape[2])
+
+    return beta[:, 0] / np.sqrt(sigma2 * solution[:, 0, 1])
+
+
+def _kpss_lags(nobs, nlags):
+    if nlags == "legacy":
+        nlags = int(np.ceil(12.0 * np.power(nobs / 100.0, 1 / 4.0)))
+        nlags = min(nlags, nobs - 1)
+    return nlags
+
+
+def kpss_statistic(x, regression="c", nlags="legacy"):
+    """KPSS statistics, one per row of ``x``.
+
+    ``nlags`` is the bandwidth of the Bartlett kernel: an integer or
+    ``"legacy"`` for ceil(12 * (nobs / 100) ** (1 / 4)), capped at
+    ``nobs - 1``, as ``kpss(nlags="legacy")`` in statsmodels.
+    """
+    if regression not in ("c", "ct"):
+        raise ValueError(f"regression must be 'c' or 'ct', got {regression!r}")
+
+    x = _as_2d(x)
+    nobs = x.shape[1]
+    nlags = _kpss_lags(nobs, nlags)
+
+    # The design is the same for all series: one least squares fit with many right-hand sides
+    D = np.column_stack(_deterministic_terms(regression, nobs))
+    beta, *_ = np.linalg.lstsq(D, x.T, rcond=None)
+    resid = x - (D @ beta).T
+
+    eta = (np.cumsum(resid, axis=1) ** 2).sum(axis=1) / nobs**2
+
+    s_hat = (resid**2).sum(axis=1)
+    for i in range(1, nlags + 1):
+        s_hat += 2 * (1 - i / (nlags + 1.0)) * (resid[:, i:] * resid[:, :-i]).sum(axis=1)
+
+    return eta / (s_hat / nobs)
+
+
+def _simulate_null(test, nobs, regression, lags, nsim, seed, batch_size):
+    rng = np.random.default_rng(seed)
+    stats = []
+    for start in range(0, nsim, batch_size):
+        e = rng.standard_normal((min(batch_size, nsim - start), nobs))
+        if test == "adf":
+            # Random walk: unit root under the null
+            stats.append(adf_statistic(np.cumsum(e, axis=1), regression, lags))
+        else:
+            # White noise: (trend) stationary under the null
+            stats.append(kpss_statistic(e, regression, lags))
+
+    return np.concatenate(stats)
+
+
+def null_quantiles(test, nobs, regression="c", lags=0, nsim=100_000, seed=0, cache_dir=CACHE_DIR, batch_size=10_000):
+    """Quantiles of the finite-sample null distribution of a test statistic.
+
+    Parameters
+    ----------
+    test : {"adf", "kpss"}
+    nobs : int
+        Length of the series.
+    regression : str
+        Deterministic terms of the test regression.
+    lags : int
+        Lagged differences (ADF) or Bartlett bandwidth (KPSS).
+    nsim : int
+        Number of simulated series.
+    cache_dir : path or None
+        Where simulated tables are stored, ``None`` disables the cache.
+
+    Returns
+    -------
+    np.ndarray
+        The quantiles at ``PROBABILITIES``.
+    """
+    if test not in ("adf", "kpss"):
+        raise ValueError(f"test must be 'adf' or 'kpss', got {test!r}")
+
+    path = None
+    if cache_dir is not None:
+        path = Path(cache_dir) / f"{test}-n{nobs}-{regression}-lags{lags}-nsim{nsim}-seed{seed}.json"
+        if path.exists():
+            return np.array(json.loads(path.read_text())["quantiles"])
+
+    stats = _simulate_null(test, nobs, regression, lags, nsim, seed, batch_size)
+    quantiles = np.quantile(stats, PROBABILITIES)
+
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "test": test, "nobs": nobs, "regression": regression, "lags": lags,
+            "nsim": nsim, "seed": seed, "quantiles": quantiles.tolist(),
+        }))
+
+    return quantiles
+
+
+def critical_values(test, nobs, regression="c", lags=0, **kwargs):
+    """Simulated critical values, in the format of ``adfuller``/``kpss``."""
+    quantiles = null_quantiles(test, nobs, regression, lags, **kwargs)
+    levels = ADF_LEVELS if test == "adf" else KPSS_LEVELS
+    return {name: float(np.interp(p, PROBABILITIES, quantiles)) for name, p in levels.items()}
+
+
+def adf(x, regression="c", lags=0, **kwargs):
+    """ADF test for every row of ``x``.
+
+    Returns a ``DataFrame`` with the statistic, the simulated p-value (left
+    tail, clipped to the range of the stored quantiles) and the critical
+    values. Keyword arguments are passed to :func:`null_quantiles`.
+    """
+    x = _as_2d(x)
+    stat = adf_statistic(x, regression, lags)
+    nobs = x.shape[1] - 1 - lags
+    quantiles = null_quantiles("adf", x.shape[1], regression, lags, **kwargs)
+
+    result = pd.DataFrame({
+        "adf_stat": stat,
+        "pvalue": np.interp(stat, quantiles, PROBABILITIES),
+        "nobs": nobs,
+    })
+    for name, p in ADF_LEVELS.items():
+        result[f"crit_{name}"] = np.interp(p, PROBABILITIES, quantiles)
+
+    return result
+
+
+def kpss(x, regression="c", nlags="legacy", **kwargs):
+    """KPSS test for every row of ``x``, p-values from the right tail."""
+    x = _as_2d(x)
+    nobs = x.shape[1]
+    nlags = _kpss_lags(nobs, nlags)
+
+    stat = kpss_statistic(x, regression, nlags)
+    quantiles = null_quantiles("kpss", nobs, regression, nlags, **kwargs)
+
+    result = pd.DataFrame({
+        "kpss_stat": stat,
+        "pvalue": 1 - np.interp(stat, quantiles, PROBABILITIES),
+        "lags": nlags,
+    })
+    for name, p in KPSS_LEVELS.items():
+        result[f"crit_{name}"] = np.interp(p, PROBABILITIES, quantiles)
+
+    return result
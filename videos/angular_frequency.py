@@ -2,11 +2,13 @@ from manim import (
     Scene, Axes, Text, MathTex, Create, Write, FadeIn, FadeOut, Transform,
     UP, DOWN, LEFT, RIGHT, ORIGIN, UR, UL,
     BLUE, YELLOW, GREEN, RED, WHITE, PI,
-    Circle, Dot, Line, DashedLine, VGroup, ValueTracker, VMobject,
+    Circle, Dot, Line, DashedLine, VGroup, ValueTracker,
     always_redraw, rate_functions
 )
 import numpy as np
 
+from curves import TracedCurve
+
 
 class SineWavesDifferentFrequencies(Scene):
     def construct(self):
@@ -112,24 +114,10 @@ class SineWavesDifferentFrequencies(Scene):
                     )
                 return update_im_line
             
-            def make_update_path(af, sa, tt):
-                def update_path(mob):
-                    t = tt.get_value()
-                    if t > 0.01:
-                        num_points = max(2, int(t * 100))
-                        t_vals = np.linspace(0, t, num_points)
-                        points = [sa.c2p(tv, np.sin(af * tv)) for tv in t_vals]
-                        mob.clear_points()
-                        if len(points) > 1:
-                            mob.set_points_as_corners(points)
-                    else:
-                        mob.clear_points()
-                return update_path
-            
             components['rotating_dot'].add_updater(make_update_dot(angular_freq, circle_axes, t_tracker))
             components['radius_line'].add_updater(make_update_radius(angular_freq, circle_axes, t_tracker))
             components['im_line'].add_updater(make_update_im_line(angular_freq, circle_axes, t_tracker))
-            components['traced_path'].add_updater(make_update_path(angular_freq, sine_axes, t_tracker))
+            components['traced_path'].start_tracing()
         
         # Animate all simultaneously for 2 seconds
         tracker_animations = []
@@ -286,28 +274,15 @@ class SineWavesDifferentFrequencies(Scene):
         self.add(rotating_dot, radius_line, im_line)
         self.wait(0.4)
         
-        # Create traced path for sine wave
-        traced_path = VMobject(color=RED, stroke_width=3)
-        
-        def update_path(mob):
-            """Update the traced sine wave path"""
-            t = t_tracker.get_value()  # Time in seconds (0 to 2, looping)
-            if t > 0.01:
-                # Sample points along the sine curve from 0 to current t
-                num_points = max(2, int(t * 100))
-                t_vals = np.linspace(0, t, num_points)
-                # Plot sin(ω * t) where ω is angular frequency
-                points = [sine_axes.c2p(tv, np.sin(angular_freq * tv)) for tv in t_vals]
-                
-                # Clear and redraw
-                mob.clear_points()
-                if len(points) > 1:
-                    mob.set_points_as_corners(points)
-            else:
-                # At the start of a loop, clear the path
-                mob.clear_points()
-        
-        traced_path.add_updater(update_path)
+        # Create traced path for sine wave, sin(ω * t) from 0 to the current t.
+        # Each frame only appends the new segment instead of resampling the path.
+        traced_path = TracedCurve(
+            sine_axes,
+            lambda t: np.sin(angular_freq * t),
+            t_tracker,
+            color=RED,
+            stroke_width=3
+        ).start_tracing()
         self.add(traced_path)
         
         # Animate for 2 seconds (initial display in center)
@@ -21,11 +21,19 @@ from manim import (
     GREEN,
     UP,
     RIGHT,
+    logger,
 )
 import numpy as np
 
+from curves import FrameTimer, RevealedCurve, axes_transform, coords_to_points
+
 
 class ComplexSineWave(ThreeDScene):
+    # Sample the helix and its projections once and reveal a prefix per frame.
+    # ComplexSineWaveRedraw below rebuilds them every frame, for comparison.
+    precomputed_curves = True
+    helix_samples = 2000
+
     def construct(self):
         self.set_camera_orientation(phi=0 * DEGREES, theta=-90 * DEGREES)
 
@@ -91,14 +99,10 @@ class ComplexSineWave(ThreeDScene):
             color=BLUE,
             stroke_width=2,
         )
-        helix = always_redraw(
-            lambda: ParametricFunction(
-                lambda u: axes.c2p(np.cos(u), np.sin(u), z_scale * u),
-                t_range=[0, theta.get_value()],
-                color=YELLOW,
-                stroke_width=4,
-            )
-        )
+        if self.precomputed_curves:
+            helix, real_curve, imag_curve = self.revealed_curves(axes, theta, z_scale, time_span)
+        else:
+            helix, real_curve, imag_curve = self.redrawn_curves(axes, theta, z_scale)
         dot_3d = always_redraw(
             lambda: Dot3D(
                 point=axes.c2p(
@@ -110,22 +114,6 @@ class ComplexSineWave(ThreeDScene):
                 radius=0.07,
             )
         )
-        real_curve = always_redraw(
-            lambda: ParametricFunction(
-                lambda u: axes.c2p(np.cos(u), 0, z_scale * u),
-                t_range=[0, theta.get_value()],
-                color=RED,
-                stroke_width=3,
-            )
-        )
-        imag_curve = always_redraw(
-            lambda: ParametricFunction(
-                lambda u: axes.c2p(0, np.sin(u), z_scale * u),
-                t_range=[0, theta.get_value()],
-                color=GREEN,
-                stroke_width=3,
-            )
-        )
         real_link = always_redraw(
             lambda: Line(
                 dot_3d.get_center(),
@@ -151,7 +139,59 @@ class ComplexSineWave(ThreeDScene):
         self.play(FadeIn(dot_3d), FadeIn(real_link), FadeIn(imag_link))
         self.play(Create(helix), Create(real_curve), Create(imag_curve), run_time=1)
         self.begin_ambient_camera_rotation(rate=0.05)
+        timer = FrameTimer()
+        self.add(timer)
         self.play(theta.animate.set_value(theta.get_value() + time_span), run_time=8, rate_func=lambda t: t)
+        self.remove(timer)
+        logger.info(f"{type(self).__name__} helix shot: {timer.summary()}")
         self.wait(1)
         self.stop_ambient_camera_rotation()
         self.wait(0.5)
+
+    def revealed_curves(self, axes, theta, z_scale, time_span):
+        """Helix and its real/imaginary projections from one set of samples."""
+        u = np.linspace(0, theta.get_value() + time_span, self.helix_samples)
+        coords = np.column_stack([np.cos(u), np.sin(u), z_scale * u])
+        helix_points = coords_to_points(axes, coords)
+        # Each projection drops one coordinate, i.e. one basis vector term
+        _, e_x, e_y, _ = axes_transform(axes, 3)
+        real_points = helix_points - np.outer(coords[:, 1], e_y)
+        imag_points = helix_points - np.outer(coords[:, 0], e_x)
+
+        helix = RevealedCurve(u, helix_points, theta, color=YELLOW, stroke_width=4)
+        real_curve = RevealedCurve(u, real_points, theta, color=RED, stroke_width=3)
+        imag_curve = RevealedCurve(u, imag_points, theta, color=GREEN, stroke_width=3)
+        return helix, real_curve, imag_curve
+
+    def redrawn_curves(self, axes, theta, z_scale):
+        helix = always_redraw(
+            lambda: ParametricFunction(
+                lambda u: axes.c2p(np.cos(u), np.sin(u), z_scale * u),
+                t_range=[0, theta.get_value()],
+                color=YELLOW,
+                stroke_width=4,
+            )
+        )
+        real_curve = always_redraw(
+            lambda: ParametricFunction(
+                lambda u: axes.c2p(np.cos(u), 0, z_scale * u),
+                t_range=[0, theta.get_value()],
+                color=RED,
+                stroke_width=3,
+            )
+        )
+        imag_curve = always_redraw(
+            lambda: ParametricFunction(
+                lambda u: axes.c2p(0, np.sin(u), z_scale * u),
+                t_range=[0, theta.get_value()],
+                color=GREEN,
+                stroke_width=3,
+            )
+        )
+        return helix, real_curve, imag_curve
+
+
+class ComplexSineWaveRedraw(ComplexSineWave):
+    """Same scene with the curves rebuilt on every frame (the old version)."""
+
+    precomputed_curves = False
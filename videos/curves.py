@@ -0,0 +1,165 @@
+"""Curve mobjects that avoid resampling the whole curve on every frame.
+
+manim adds the directory of the rendered scene file to ``sys.path``, so the
+scenes in this directory can use ``from curves import TracedCurve``.
+"""
+from time import perf_counter
+
+from manim import Mobject, VMobject
+import numpy as np
+
+
+def axes_transform(axes, dim=2):
+    """Origin and unit vectors of ``axes`` in scene coordinates.
+
+    For linear axes ``axes.c2p(x, y) == origin + x * e_x + y * e_y`` (and
+    likewise with ``e_z`` for ``ThreeDAxes`` and ``dim=3``), which lets whole
+    arrays of coordinates be mapped at once.
+    """
+    unit = np.eye(dim)
+    origin = np.asarray(axes.c2p(*np.zeros(dim)))
+    return (origin, *(np.asarray(axes.c2p(*e)) - origin for e in unit))
+
+
+def coords_to_points(axes, coords):
+    """Vectorized ``axes.c2p`` for an ``(n, dim)`` array of coordinates."""
+    coords = np.asarray(coords, dtype=float)
+    origin, *basis = axes_transform(axes, coords.shape[1])
+    return origin + coords @ np.array(basis)
+
+
+class TracedCurve(VMobject):
+    """Graph of ``func`` on ``axes`` from x = 0 up to ``tracker.get_value()``.
+
+    While the tracker grows, each frame only appends the segment between the
+    previous and the current value, sampled on a fixed grid of
+    ``samples_per_unit`` points per unit of x. The path is rebuilt from
+    scratch only when the tracker goes back (e.g. it is reset to 0) or when the
+    axes have been moved or scaled.
+
+    ``func`` must accept a numpy array, e.g. ``lambda t: np.sin(omega * t)``.
+    Call :meth:`start_tracing` to attach the updater and ``clear_updaters()``
+    to freeze the curve.
+    """
+
+    def __init__(self, axes, func, tracker, samples_per_unit=100, min_value=0.01, **kwargs):
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.func = func
+        self.tracker = tracker
+        self.samples_per_unit = samples_per_unit
+        self.min_value = min_value
+        self._reset()
+
+    def _reset(self):
+        self.clear_points()
+        self._drawn_until = None  # x of the last point in the path
+        self._transform = None
+
+    def _to_points(self, x):
+        origin, e_x, e_y = self._transform
+        y = np.asarray(self.func(x), dtype=float)
+        return origin + np.outer(x, e_x) + np.outer(y, e_y)
+
+    def start_tracing(self):
+        self.add_updater(TracedCurve.update_path)
+        return self
+
+    def update_path(self):
+        t = self.tracker.get_value()
+        if t <= self.min_value:
+            if self._drawn_until is not None:
+                self._reset()
+            return
+
+        transform = axes_transform(self.axes)
+        stale = self._transform is None or any(
+            not np.allclose(a, b) for a, b in zip(transform, self._transform)
+        )
+        if stale or self._drawn_until is None or t < self._drawn_until:
+            self._reset()
+            self._transform = transform
+            grid = np.arange(0, int(t * self.samples_per_unit) + 1) / self.samples_per_unit
+            x = np.append(grid[grid < t], t)
+            points = self._to_points(x)
+            self.start_new_path(points[0])
+            self.add_points_as_corners(points[1:])
+        elif t > self._drawn_until:
+            # New grid points after the last drawn x, and the current end
+            first = int(np.floor(self._drawn_until * self.samples_per_unit)) + 1
+            last = int(np.floor(t * self.samples_per_unit))
+            grid = np.arange(first, last + 1) / self.samples_per_unit
+            x = np.append(grid[grid < t], t)
+            self.add_points_as_corners(self._to_points(x))
+
+        self._drawn_until = t
+
+
+class RevealedCurve(VMobject):
+    """Prefix of a curve sampled once, shown up to ``tracker.get_value()``.
+
+    ``params`` is the increasing array of parameter values and ``points`` the
+    matching ``(n, 3)`` scene points. Each frame keeps the samples with
+    parameter up to the tracker value and ends the path at a point linearly
+    interpolated between the neighbouring samples, so nothing is re-evaluated.
+    Several curves can be built from one sampled array, e.g. a helix and its
+    projections, see ``complex_sine_wave.py``.
+    """
+
+    def __init__(self, params, points, tracker, **kwargs):
+        super().__init__(**kwargs)
+        self.params = np.asarray(params, dtype=float)
+        self.samples = np.asarray(points, dtype=float)
+        self.tracker = tracker
+        self.reveal()
+        self.add_updater(RevealedCurve.reveal)
+
+    def reveal(self):
+        t = self.tracker.get_value()
+        k = np.searchsorted(self.params, t, side="right")
+        if k == 0:
+            self.clear_points()
+            return
+        if k == len(self.params) or self.params[k - 1] == t:
+            corners = self.samples[:k]
+        else:
+            w = (t - self.params[k - 1]) / (self.params[k] - self.params[k - 1])
+            end = self.samples[k - 1] + w * (self.samples[k] - self.samples[k - 1])
+            corners = np.vstack([self.samples[:k], end])
+        if len(corners) < 2:
+            self.clear_points()
+        else:
+            self.set_points_as_corners(corners)
+
+
+class FrameTimer(Mobject):
+    """Invisible mobject that records the wall time between rendered frames.
+
+    Add it to a scene before the shot to measure and log ``summary()`` after
+    it; the time per frame covers the updaters and the rendering.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frame_times = []
+        self._last = None
+        self.add_updater(FrameTimer.tick)
+
+    def tick(self, dt):
+        now = perf_counter()
+        if self._last is not None and dt > 0:
+            self.frame_times.append(now - self._last)
+        self._last = now
+
+    def reset(self):
+        self.frame_times = []
+        self._last = None
+
+    def summary(self):
+        if not self.frame_times:
+            return "no frames timed"
+        ms = 1000 * np.array(self.frame_times)
+        return (
+            f"{len(ms)} frames: mean {ms.mean():.1f} ms, "
+            f"median {np.median(ms):.1f} ms, p95 {np.percentile(ms, 95):.1f} ms"
+        )
@@ -0,0 +1,22 @@
+"""Production entry point for the circle/sine wave app.
+
+All animation state lives in the browser (``dcc.Store``), so any worker can
+serve any request and the app scales with the number of processes:
+
+    uv run gunicorn wsgi:server --preload --workers 4 --bind 0.0.0.0:8050
+
+With ``--preload`` the app (Dash, Plotly, numpy) is imported once in the
+gunicorn master and the workers are forked from it, instead of every worker
+importing it on its own.
+
+Set ``SINE_APP_CLIENTSIDE=1`` to serve the clientside animation mode.
+"""
+import os
+
+from sine_wave_circle_app import create_app
+
+app = create_app(
+    clientside=os.environ.get('SINE_APP_CLIENTSIDE', '0') == '1',
+    compress=True,
+)
+server = app.server